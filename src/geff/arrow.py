@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+try:
+    import pyarrow as pa  # type: ignore[import-untyped]
+    import pyarrow.parquet as pq  # type: ignore[import-untyped]
+except ImportError as e:
+    raise ImportError(
+        "This module requires pyarrow to be installed. "
+        "Please install it with `pip install 'geff[arrow]'`."
+    ) from e
+
+from geff.geff_reader import GeffReader
+from geff.metadata_schema import GeffMetadata
+from geff.write_arrays import write_arrays
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+    from zarr.storage import StoreLike
+
+    from geff.typing import PropDictNpArray
+    from geff.write_arrays import EncodingLike
+
+# the columns of the ids in the node and edge tables
+NODE_ID_COLUMN = "id"
+EDGE_ID_COLUMNS = ("source", "target")
+# the key of the geff metadata in the schema metadata of the tables
+GEFF_METADATA_KEY = b"geff"
+
+
+def _prop_to_arrow(name: str, prop_dict: PropDictNpArray) -> pa.Array:
+    """Convert the values of a property to an arrow array, with the missing mask as the
+    validity bitmap. Numeric values are not copied."""
+    values = prop_dict["values"]
+    missing = prop_dict.get("missing")
+    if values.ndim == 1:
+        return pa.array(values, mask=missing)
+    if values.ndim == 2:
+        flat = pa.array(np.ascontiguousarray(values).reshape(-1))
+        mask = pa.array(missing) if missing is not None else None
+        return pa.FixedSizeListArray.from_arrays(flat, values.shape[1], mask=mask)
+    raise ValueError(
+        f"Property {name} with shape {values.shape} cannot be converted to an arrow column, "
+        "only properties with one or two dimensions are supported"
+    )
+
+
+def _table(
+    id_columns: dict[str, NDArray[Any]],
+    props: dict[str, PropDictNpArray],
+    metadata: GeffMetadata,
+) -> pa.Table:
+    for name in props:
+        if name in id_columns:
+            raise ValueError(f"Property {name} has the same name as an id column")
+    columns = {name: pa.array(ids) for name, ids in id_columns.items()}
+    columns.update({name: _prop_to_arrow(name, prop_dict) for name, prop_dict in props.items()})
+    return pa.table(
+        columns, metadata={GEFF_METADATA_KEY: metadata.model_dump_json(exclude_none=True)}
+    )
+
+
+def to_arrow(
+    source: StoreLike,
+    validate: bool = True,
+    node_props: list[str] | None = None,
+    edge_props: list[str] | None = None,
+) -> tuple[pa.Table, pa.Table]:
+    """Read a geff into an arrow table of nodes and an arrow table of edges.
+
+    The node table has an "id" column and a column per node property, the edge table has
+    "source" and "target" columns and a column per edge property. Missing values are
+    nulls, using the missing masks as validity bitmaps. Properties with a second dimension
+    become fixed size list columns. The node ids and numeric properties are not copied
+    when converted to arrow. The geff metadata is stored as JSON under the "geff" key of
+    the schema metadata of both tables.
+
+    Args:
+        source (str | Path | zarr store): Either a path to the root of the geff zarr
+            (where the .attrs contains the geff metadata), or a zarr store object
+        validate (bool, optional): Flag indicating whether to perform validation on the
+            geff file before loading into memory. Defaults to True.
+        node_props (list of str, optional): The names of the node properties to load,
+            if None all properties will be loaded, defaults to None.
+        edge_props (list of str, optional): The names of the edge properties to load,
+            if None all properties will be loaded, defaults to None.
+
+    Returns:
+        tuple[pa.Table, pa.Table]: The node table and the edge table.
+
+    Raises:
+        ValueError: If a property has more than two dimensions, or is named like an id
+            column.
+    """
+    file_reader = GeffReader(source, validate)
+    file_reader.read_node_props(node_props)
+    file_reader.read_edge_props(edge_props)
+    in_memory_geff = file_reader.build()
+
+    metadata = in_memory_geff["metadata"]
+    edge_ids = in_memory_geff["edge_ids"]
+    nodes = _table(
+        {NODE_ID_COLUMN: in_memory_geff["node_ids"]}, in_memory_geff["node_props"], metadata
+    )
+    edges = _table(
+        dict(zip(EDGE_ID_COLUMNS, (edge_ids[:, 0], edge_ids[:, 1]), strict=True)),
+        in_memory_geff["edge_props"],
+        metadata,
+    )
+    return nodes, edges
+
+
+def _to_numpy(array: pa.Array) -> NDArray[Any]:
+    """Convert an arrow array of scalars to numpy, replacing nulls with zeros or empty
+    strings. Arrays without nulls of numbers are not copied."""
+    is_string = pa.types.is_string(array.type) or pa.types.is_large_string(array.type)
+    if array.null_count > 0:
+        array = array.fill_null("" if is_string else pa.scalar(0).cast(array.type))
+    values = array.to_numpy(zero_copy_only=False)
+    if is_string:
+        values = values.astype(str)
+    return values
+
+
+def _column_to_prop(array: pa.Array) -> tuple[NDArray[Any], NDArray[np.bool_] | None]:
+    """Convert an arrow column to the values and missing arrays of a property."""
+    missing = array.is_null().to_numpy(zero_copy_only=False) if array.null_count > 0 else None
+    if not pa.types.is_fixed_size_list(array.type):
+        return _to_numpy(array), missing
+
+    width = array.type.list_size
+    values = _to_numpy(array.values.slice(array.offset * width, len(array) * width))
+    values = values.reshape(-1, width)
+    if missing is not None:
+        # the values of null lists are not defined
+        values = values.copy()
+        values[missing] = 0
+    return values, missing
+
+
+def _table_to_arrays(
+    table: pa.Table, id_columns: list[str]
+) -> tuple[list[NDArray[Any]], dict[str, tuple[NDArray[Any], NDArray[np.bool_] | None]]]:
+    for name in id_columns:
+        if name not in table.column_names:
+            raise ValueError(f"Id column {name} not found in table columns {table.column_names}")
+        if table.column(name).null_count > 0:
+            raise ValueError(f"Id column {name} cannot have null values")
+    columns = {name: table.column(name).combine_chunks() for name in table.column_names}
+    ids = [_to_numpy(columns.pop(name)) for name in id_columns]
+    return ids, {name: _column_to_prop(array) for name, array in columns.items()}
+
+
+def from_arrow(
+    nodes: pa.Table,
+    edges: pa.Table,
+    store: StoreLike,
+    metadata: GeffMetadata | None = None,
+    zarr_format: Literal[2, 3] = 2,
+    encoding: EncodingLike = None,
+) -> None:
+    """Write a geff from an arrow table of nodes and an arrow table of edges.
+
+    The tables have the layout of `to_arrow`: an "id" column in the node table, "source"
+    and "target" columns in the edge table, and a column per property. Nulls are written
+    as missing values, and fixed size list columns as properties with a second dimension.
+
+    Args:
+        nodes (pa.Table): The node table.
+        edges (pa.Table): The edge table. The source and target columns must have the
+            same type as the node ids.
+        store (str | Path | zarr store): The path/str to the output zarr, or the store
+            itself. Opens in append mode, so will only overwrite geff-controlled groups.
+        metadata (GeffMetadata, optional): The metadata of the geff. Defaults to None,
+            using the metadata stored in the schema of the node table by `to_arrow`.
+        zarr_format (Literal[2, 3], optional): The version of zarr to write.
+            Defaults to 2.
+        encoding (ArrayEncoding | Mapping[str, ArrayEncoding], optional): The chunking,
+            compression and sharding of the arrays, see `geff.write_arrays.ArrayEncoding`.
+            Defaults to None, using the default encoding.
+
+    Raises:
+        ValueError: If an id column is not found or has nulls, or if no metadata is given
+            and the node table has no geff metadata.
+    """
+    if metadata is None:
+        schema_metadata = nodes.schema.metadata or {}
+        if GEFF_METADATA_KEY not in schema_metadata:
+            raise ValueError(
+                "No geff metadata found in the schema of the node table, please provide "
+                "the metadata"
+            )
+        metadata = GeffMetadata.model_validate_json(schema_metadata[GEFF_METADATA_KEY])
+
+    (node_ids,), node_props = _table_to_arrays(nodes, [NODE_ID_COLUMN])
+    (sources, targets), edge_props = _table_to_arrays(edges, list(EDGE_ID_COLUMNS))
+    edge_ids = np.stack([sources, targets], axis=1).astype(node_ids.dtype, copy=False)
+    write_arrays(
+        store,
+        node_ids,
+        node_props,
+        edge_ids,
+        edge_props,
+        metadata,
+        zarr_format=zarr_format,
+        encoding=encoding,
+    )
+
+
+def to_parquet(
+    source: StoreLike,
+    nodes_path: str | Path,
+    edges_path: str | Path,
+    validate: bool = True,
+    node_props: list[str] | None = None,
+    edge_props: list[str] | None = None,
+    **kwargs: Any,
+) -> None:
+    """Write the node and edge tables of a geff to Parquet files, see `to_arrow`.
+
+    Args:
+        source (str | Path | zarr store): Either a path to the root of the geff zarr
+            (where the .attrs contains the geff metadata), or a zarr store object
+        nodes_path (str | Path): The path of the Parquet file of the nodes.
+        edges_path (str | Path): The path of the Parquet file of the edges.
+        validate (bool, optional): Flag indicating whether to perform validation on the
+            geff file before loading into memory. Defaults to True.
+        node_props (list of str, optional): The names of the node properties to write,
+            if None all properties will be written, defaults to None.
+        edge_props (list of str, optional): The names of the edge properties to write,
+            if None all properties will be written, defaults to None.
+        **kwargs: Keyword arguments passed to `pyarrow.parquet.write_table`, like
+            `compression`.
+    """
+    nodes, edges = to_arrow(source, validate, node_props, edge_props)
+    pq.write_table(nodes, nodes_path, **kwargs)
+    pq.write_table(edges, edges_path, **kwargs)
+
+
+def from_parquet(
+    nodes_path: str | Path,
+    edges_path: str | Path,
+    store: StoreLike,
+    metadata: GeffMetadata | None = None,
+    zarr_format: Literal[2, 3] = 2,
+    encoding: EncodingLike = None,
+) -> None:
+    """Write a geff from the Parquet files of a node table and an edge table, see
+    `from_arrow`.
+
+    Args:
+        nodes_path (str | Path): The path of the Parquet file of the nodes.
+        edges_path (str | Path): The path of the Parquet file of the edges.
+        store (str | Path | zarr store): The path/str to the output zarr, or the store
+            itself. Opens in append mode, so will only overwrite geff-controlled groups.
+        metadata (GeffMetadata, optional): The metadata of the geff. Defaults to None,
+            using the metadata stored in the node file by `to_parquet`.
+        zarr_format (Literal[2, 3], optional): The version of zarr to write.
+            Defaults to 2.
+        encoding (ArrayEncoding | Mapping[str, ArrayEncoding], optional): The chunking,
+            compression and sharding of the arrays, see `geff.write_arrays.ArrayEncoding`.
+            Defaults to None, using the default encoding.
+    """
+    from_arrow(
+        pq.read_table(nodes_path),
+        pq.read_table(edges_path),
+        store,
+        metadata=metadata,
+        zarr_format=zarr_format,
+        encoding=encoding,
+    )
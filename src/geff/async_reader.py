@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, cast
+
+import numpy as np
+import zarr
+
+if not zarr.__version__.startswith("3"):
+    raise ImportError(
+        "The async reader requires the async API of zarr 3. "
+        "Please install it with `pip install 'zarr>=3'`."
+    )
+
+from zarr.api import asynchronous as zarr_async
+
+from geff.geff_reader import assemble_selection, plan_selection
+from geff.id_index import edges_within
+from geff.metadata_schema import GeffMetadata
+
+from . import utils
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
+    from numpy.typing import NDArray
+    from zarr import AsyncArray, AsyncGroup
+    from zarr.storage import StoreLike
+
+    from geff.typing import InMemoryGeff, PropDictNpArray
+
+    AsyncPropDict = dict[str, AsyncArray[Any]]
+
+
+async def read_selection_async(
+    array: AsyncArray[Any],
+    selection: NDArray[np.bool_] | NDArray[np.integer] | slice | None = None,
+) -> NDArray[Any]:
+    """Read the rows of an async zarr array selected along its first axis.
+
+    The asynchronous version of `geff.geff_reader.read_selection`: only the chunks that
+    contain at least one selected row are read, and all runs of touched chunks are
+    fetched at once with `asyncio.gather`.
+
+    Args:
+        array (zarr.AsyncArray): The array to read from.
+        selection (np.ndarray of bool | np.ndarray of int | slice, optional): A 1D boolean
+            mask with the length of the first axis of `array`, an array of row indices, or
+            a slice of rows. If None, the whole array is read.
+
+    Returns:
+        np.ndarray: The selected rows of `array`, in the order of the selection.
+
+    Raises:
+        ValueError: If the mask does not match the length of the first axis of the array,
+            or if a row index is out of bounds.
+    """
+    runs, order = plan_selection(array, selection)  # type: ignore[arg-type]
+    data = await asyncio.gather(*(array.getitem(rows) for rows, _ in runs))
+    return assemble_selection(array, runs, list(data), order)  # type: ignore[arg-type]
+
+
+async def _group_keys(group: AsyncGroup, path: str) -> list[str]:
+    """The names of the subgroups of `path`, or an empty list if it does not exist."""
+    if not await group.contains(path):
+        return []
+    subgroup = cast("AsyncGroup", await group.getitem(path))
+    return [key async for key in subgroup.group_keys()]
+
+
+async def _open_prop(group: AsyncGroup, path: str) -> AsyncPropDict:
+    prop_group = cast("AsyncGroup", await group.getitem(path))
+    values, has_missing = await asyncio.gather(
+        prop_group.getitem("values"), prop_group.contains("missing")
+    )
+    prop_dict = {"values": cast("AsyncArray[Any]", values)}
+    if has_missing:
+        prop_dict["missing"] = cast("AsyncArray[Any]", await prop_group.getitem("missing"))
+    return prop_dict
+
+
+async def _read_props(
+    props: dict[str, AsyncPropDict],
+    selection: NDArray[np.bool_] | NDArray[np.integer] | None,
+) -> dict[str, PropDictNpArray]:
+    """Read the selected rows of all arrays of the prop dictionaries at once."""
+    keys = [(name, key) for name, prop_dict in props.items() for key in prop_dict]
+    data = await asyncio.gather(
+        *(read_selection_async(props[name][key], selection) for name, key in keys)
+    )
+    prop_dicts: dict[str, dict[str, NDArray[Any]]] = {name: {} for name in props}
+    for (name, key), array in zip(keys, data, strict=True):
+        prop_dicts[name][key] = array.astype(bool, copy=False) if key == "missing" else array
+    return cast("dict[str, PropDictNpArray]", prop_dicts)
+
+
+class AsyncGeffReader:
+    """
+    File reader class like `GeffReader`, that reads with the async API of zarr 3.
+
+    All reads are awaitables that do not block the event loop. The metadata, the ids and
+    all property arrays of a geff are fetched concurrently with `asyncio.gather`, so that
+    many columns, and many geffs, can be fetched at once from a single thread. This
+    helps most when reading is latency bound, like from object storage.
+
+    Create a reader with `AsyncGeffReader.open`.
+
+    Example:
+        >>> async def read_all(paths):
+        ...     readers = await asyncio.gather(*(AsyncGeffReader.open(p) for p in paths))
+        ...     await asyncio.gather(*(reader.read_node_props() for reader in readers))
+        ...     return await asyncio.gather(*(reader.build() for reader in readers))
+
+        >>> in_memory_geffs = asyncio.run(read_all(["a.zarr", "b.zarr"]))
+    """
+
+    def __init__(
+        self,
+        group: AsyncGroup,
+        metadata: GeffMetadata,
+        nodes: AsyncArray[Any],
+        edges: AsyncArray[Any],
+        node_prop_names: list[str],
+        edge_prop_names: list[str],
+    ):
+        """
+        File reader class that reads with the async API of zarr 3.
+
+        Use `AsyncGeffReader.open` to open a geff, which reads the arguments of this
+        constructor.
+
+        Args:
+            group (zarr.AsyncGroup): The geff group.
+            metadata (GeffMetadata): The metadata of the geff.
+            nodes (zarr.AsyncArray): The node ids array.
+            edges (zarr.AsyncArray): The edge ids array.
+            node_prop_names (list of str): The names of the node properties in the geff.
+            edge_prop_names (list of str): The names of the edge properties in the geff.
+        """
+        self.group = group
+        self.metadata = metadata
+        self.nodes = nodes
+        self.edges = edges
+        self.node_prop_names = node_prop_names
+        self.edge_prop_names = edge_prop_names
+        self.node_props: dict[str, AsyncPropDict] = {}
+        self.edge_props: dict[str, AsyncPropDict] = {}
+
+    @classmethod
+    async def open(cls, source: StoreLike, validate: bool = True) -> AsyncGeffReader:
+        """
+        Open a geff, reading its metadata, id arrays and property names concurrently.
+
+        Args:
+            source (str | Path | zarr store): Either a path to the root of the geff zarr
+                (where the .attrs contains the geff metadata), or a zarr store object
+            validate (bool, optional): Flag indicating whether to perform validation on the
+                geff file before loading into memory. Validation is synchronous, and runs
+                in a worker thread. Defaults to True.
+
+        Returns:
+            AsyncGeffReader: The reader of the geff.
+
+        Raises:
+            ValueError: If the group has no geff metadata.
+        """
+        source = utils.remove_tilde(source)
+        if validate:
+            await asyncio.to_thread(utils.validate, source)
+
+        group = await zarr_async.open_group(source, mode="r")
+        if "geff" not in group.attrs:
+            raise ValueError(
+                f"No geff key found in {group}. This may indicate the path is incorrect or "
+                f"zarr group name is not specified (e.g. /dataset.zarr/tracks/ instead of "
+                f"/dataset.zarr/)."
+            )
+        metadata = GeffMetadata(**group.attrs["geff"])
+
+        nodes, edges, node_prop_names, edge_prop_names = await asyncio.gather(
+            group.getitem("nodes/ids"),
+            group.getitem("edges/ids"),
+            _group_keys(group, "nodes/props"),
+            _group_keys(group, "edges/props"),
+        )
+        return cls(
+            group,
+            metadata,
+            cast("AsyncArray[Any]", nodes),
+            cast("AsyncArray[Any]", edges),
+            node_prop_names,
+            edge_prop_names,
+        )
+
+    async def _open_props(self, kind: str, names: list[str]) -> dict[str, AsyncPropDict]:
+        prop_dicts = await asyncio.gather(
+            *(_open_prop(self.group, f"{kind}/props/{name}") for name in names)
+        )
+        return dict(zip(names, prop_dicts, strict=True))
+
+    async def read_node_props(self, names: list[str] | None = None) -> None:
+        """
+        Open the node properties with the given names, concurrently.
+
+        Call `build` to get the output `InMemoryGeff` with the opened properties.
+
+        Args:
+            names (lists of str, optional): The names of the node properties to load. If
+            None all node properties will be loaded.
+        """
+        if names is None:
+            names = self.node_prop_names
+        self.node_props.update(await self._open_props("nodes", names))
+
+    async def read_edge_props(self, names: list[str] | None = None) -> None:
+        """
+        Open the edge properties with the given names, concurrently.
+
+        Call `build` to get the output `InMemoryGeff` with the opened properties.
+
+        Args:
+            names (lists of str, optional): The names of the edge properties to load. If
+            None all edge properties will be loaded.
+        """
+        if names is None:
+            names = self.edge_prop_names
+        self.edge_props.update(await self._open_props("edges", names))
+
+    async def build(
+        self,
+        node_mask: NDArray[np.bool_] | None = None,
+        edge_mask: NDArray[np.bool_] | None = None,
+    ) -> InMemoryGeff:
+        """
+        Build an `InMemoryGeff` by loading the data from a GEFF zarr.
+
+        The node ids, edge ids and all property arrays are fetched at once. If a node mask
+        is given, the edge properties are fetched after the edges between the selected
+        nodes are known. Only the chunks that contain selected nodes or edges are read.
+
+        Args:
+            node_mask (np.ndarray of bool): A boolean numpy array to mask build a graph
+            of a subset of nodes, where `node_mask` is equal to True. It must be a 1D
+            array of length number of nodes.
+            edge_mask (np.ndarray of bool): A boolean numpy array to mask build a graph
+            of a subset of edge, where `edge_mask` is equal to True. It must be a 1D
+            array of length number of edges.
+
+        Returns:
+            InMemoryGeff: A dictionary of in memory numpy arrays representing the graph.
+        """
+        reads: list[Awaitable[Any]] = [
+            read_selection_async(self.nodes, node_mask),
+            read_selection_async(self.edges, edge_mask),
+            _read_props(self.node_props, node_mask),
+        ]
+        if node_mask is None:
+            reads.append(_read_props(self.edge_props, edge_mask))
+            nodes, edges, node_props, edge_props = await asyncio.gather(*reads)
+        else:
+            nodes, edges, node_props = await asyncio.gather(*reads)
+            # remove edges if any of it's nodes has been masked
+            keep = edges_within(nodes, edges)
+            edge_rows = np.flatnonzero(edge_mask) if edge_mask is not None else np.arange(len(keep))
+            edges = edges[keep]
+            edge_props = await _read_props(self.edge_props, edge_rows[keep])
+
+        return {
+            "metadata": self.metadata,
+            "node_ids": nodes,
+            "node_props": node_props,
+            "edge_ids": edges,
+            "edge_props": edge_props,
+        }
+
+
+async def read_to_memory_async(
+    source: StoreLike,
+    validate: bool = True,
+    node_props: list[str] | None = None,
+    edge_props: list[str] | None = None,
+) -> InMemoryGeff:
+    """
+    Read a GEFF zarr file into memory with the async API of zarr 3.
+
+    The asynchronous version of `geff.geff_reader.read_to_memory`. Gather several calls to
+    read many geffs at once.
+
+    Args:
+        source (str | Path | zarr store): Either a path to the root of the geff zarr
+            (where the .attrs contains the geff metadata), or a zarr store object
+        validate (bool, optional): Flag indicating whether to perform validation on the
+            geff file before loading into memory. If set to False and there are
+            format issues, will likely fail with a cryptic error. Defaults to True.
+        node_props (list of str, optional): The names of the node properties to load,
+            if None all properties will be loaded, defaults to None.
+        edge_props (list of str, optional): The names of the edge properties to load,
+            if None all properties will be loaded, defaults to None.
+
+    Returns:
+        A InMemoryGeff object containing the graph as a TypeDict of in memory numpy arrays
+        (metadata, node_ids, edge_ids, node_props, edge_props)
+    """
+    file_reader = await AsyncGeffReader.open(source, validate)
+    await asyncio.gather(
+        file_reader.read_node_props(node_props), file_reader.read_edge_props(edge_props)
+    )
+    return await file_reader.build()
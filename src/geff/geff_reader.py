@@ -1,14 +1,400 @@
+import os
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, cast
+
 import numpy as np
 import zarr
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 from zarr.storage import StoreLike
 
+from geff.id_index import IdIndex, edges_within
 from geff.metadata_schema import GeffMetadata
 from geff.typing import InMemoryGeff, PropDictNpArray, PropDictZArray
 
 from . import utils
 
 
+def _get_array(group: zarr.Group, name: str) -> zarr.Array:
+    """Get an array of a group, narrowed from the array or group that indexing returns."""
+    return cast("zarr.Array", group[name])
+
+
+def _read_array(group: zarr.Group, name: str) -> NDArray[Any]:
+    """Read a whole array of a group."""
+    return np.asarray(_get_array(group, name)[:])
+
+
+def _touched_chunk_runs(
+    touched: NDArray[np.bool_], chunk_len: int, n_rows: int
+) -> list[tuple[int, int]]:
+    """Merge the touched chunks of an array into runs of consecutive chunks.
+
+    Args:
+        touched (np.ndarray of bool): A flag for every chunk along the first axis, True if
+            the chunk contains at least one selected row.
+        chunk_len (int): The chunk length of the array along its first axis.
+        n_rows (int): The length of the first axis of the array.
+
+    Returns:
+        list[tuple[int, int]]: (start, stop) row ranges, aligned to chunk boundaries,
+            covering every touched chunk. Adjacent touched chunks are merged into one range.
+    """
+    # pad with False so every run has a rising and a falling edge
+    bounds = np.flatnonzero(np.diff(np.concatenate(([False], touched, [False])).astype(np.int8)))
+    return [
+        (int(first) * chunk_len, min(int(last) * chunk_len, n_rows))
+        for first, last in zip(bounds[::2], bounds[1::2], strict=True)
+    ]
+
+
+def _concatenate_pieces(array: zarr.Array, pieces: list[NDArray[Any]]) -> NDArray[Any]:
+    """Concatenate the pieces read from the runs of an array, avoiding copies if possible."""
+    if len(pieces) == 0:
+        return np.empty((0, *array.shape[1:]), dtype=array.dtype)
+    if len(pieces) == 1:
+        return pieces[0]
+    return np.concatenate(pieces)
+
+
+# a run of rows to read with one slice, and the rows to keep from it (None keeps all)
+ReadRun = tuple[slice, NDArray[Any] | None]
+
+
+def _plan_rows(array: zarr.Array, rows: NDArray[np.integer]) -> list[ReadRun]:
+    """Plan the reads of the rows of an array at ascending indices."""
+    n_rows = array.shape[0]
+    chunk_len = array.chunks[0]
+    if len(rows) > 0 and (rows[0] < 0 or rows[-1] >= n_rows):
+        raise ValueError(f"Row indices out of bounds for array with shape {array.shape}")
+
+    touched = np.zeros(-(-n_rows // chunk_len), dtype=bool)
+    touched[rows // chunk_len] = True
+    runs: list[ReadRun] = []
+    for start, stop in _touched_chunk_runs(touched, chunk_len, n_rows):
+        first, last = np.searchsorted(rows, (start, stop))
+        runs.append((slice(start, stop), rows[first:last] - start))
+    return runs
+
+
+def plan_selection(
+    array: zarr.Array, selection: NDArray[np.bool_] | NDArray[np.integer] | slice | None = None
+) -> tuple[list[ReadRun], NDArray[np.intp] | None]:
+    """Plan the reads of the rows of a zarr array selected along its first axis.
+
+    Only the chunks that contain at least one selected row are read, and consecutive
+    touched chunks are merged into one slice. The plan does not read any data, so it can
+    be used to fetch the runs with the synchronous or the asynchronous zarr API. Use
+    `assemble_selection` to combine the fetched runs.
+
+    Args:
+        array (zarr.Array | zarr.AsyncArray): The array to read from.
+        selection (np.ndarray of bool | np.ndarray of int | slice, optional): A 1D boolean
+            mask with the length of the first axis of `array`, an array of row indices, or
+            a slice of rows. If None, the whole array is read.
+
+    Returns:
+        tuple[list, np.ndarray | None]: The runs to read, as pairs of a slice of rows and
+            the rows to keep from the run (None keeps all of them), and the order of the
+            row indices if they are not sorted.
+
+    Raises:
+        ValueError: If the mask does not match the length of the first axis of the array,
+            or if a row index is out of bounds.
+    """
+    if selection is None:
+        return [(slice(None), None)], None
+    if isinstance(selection, slice):
+        return [(selection, None)], None
+    selection = np.asarray(selection)
+    if selection.dtype.kind in "iu":
+        rows = cast("NDArray[np.integer]", selection)
+        if np.all(rows[1:] >= rows[:-1]):
+            return _plan_rows(array, rows), None
+        order = np.argsort(rows, kind="stable")
+        return _plan_rows(array, rows[order]), order
+
+    mask = selection.astype(bool, copy=False)
+    if mask.shape != array.shape[:1]:
+        raise ValueError(
+            f"Mask with shape {mask.shape} does not match the first axis of array with "
+            f"shape {array.shape}"
+        )
+
+    chunk_len = array.chunks[0]
+    touched = (
+        np.logical_or.reduceat(mask, np.arange(0, len(mask), chunk_len)) if len(mask) else mask
+    )
+    runs: list[ReadRun] = []
+    for start, stop in _touched_chunk_runs(touched, chunk_len, len(mask)):
+        run_mask = mask[start:stop]
+        runs.append((slice(start, stop), None if run_mask.all() else run_mask))
+    return runs, None
+
+
+def assemble_selection(
+    array: zarr.Array,
+    runs: list[ReadRun],
+    data: list[Any],
+    order: NDArray[np.intp] | None,
+) -> NDArray[Any]:
+    """Combine the data read for the runs of `plan_selection` into the selected rows.
+
+    Args:
+        array (zarr.Array | zarr.AsyncArray): The array the runs were read from.
+        runs (list): The runs returned by `plan_selection`.
+        data (list): The data read for each run, in the same order.
+        order (np.ndarray of int, optional): The order returned by `plan_selection`.
+
+    Returns:
+        np.ndarray: The selected rows of `array`, in the order of the selection.
+    """
+    pieces = [
+        np.asarray(run_data) if keep is None else np.asarray(run_data)[keep]
+        for (_, keep), run_data in zip(runs, data, strict=True)
+    ]
+    result = _concatenate_pieces(array, pieces)
+    if order is None:
+        return result
+    unsorted = np.empty_like(result)
+    unsorted[order] = result
+    return unsorted
+
+
+def read_selection(
+    array: zarr.Array, selection: NDArray[np.bool_] | NDArray[np.integer] | slice | None = None
+) -> NDArray[Any]:
+    """Read the rows of a zarr array selected along its first axis.
+
+    Only the chunks that contain at least one selected row are decoded. Consecutive
+    touched chunks are read with a single slice, and the selection is applied to the
+    decoded numpy data, so no python lists of indices are created.
+
+    Arrays stored as a single uncompressed chunk on local disk are read from a memory
+    map instead, see `memmap_array`, so reading all rows or a slice does not copy.
+
+    Args:
+        array (zarr.Array): The array to read from.
+        selection (np.ndarray of bool | np.ndarray of int | slice, optional): A 1D boolean
+            mask with the length of the first axis of `array`, an array of row indices, or
+            a slice of rows. If None, the whole array is read.
+
+    Returns:
+        np.ndarray: The selected rows of `array`, in the order of the selection.
+
+    Raises:
+        ValueError: If the mask does not match the length of the first axis of the array,
+            or if a row index is out of bounds.
+    """
+    runs, order = plan_selection(array, selection)
+    mapped = memmap_array(array)
+    source = mapped if mapped is not None else array
+    return assemble_selection(array, runs, [source[rows] for rows, _ in runs], order)
+
+
+def memmap_array(array: zarr.Array) -> NDArray[Any] | None:
+    """Memory map a numeric array stored as a single uncompressed chunk on local disk.
+
+    Arrays written with `ArrayEncoding(layout="raw")` are stored this way. Reading the
+    rows of the map does not decode or copy the chunk, and the pages of the file are
+    shared through the page cache with other processes reading the same geff.
+
+    Args:
+        array (zarr.Array): The array to map.
+
+    Returns:
+        np.memmap | None: A read only map of the array, or None if the array is not a
+            single uncompressed chunk of numbers in a local store, or its chunk is not
+            written.
+    """
+    if (
+        array.dtype.kind not in "biufc"
+        or array.size == 0
+        or array.order != "C"
+        or any(chunk < size for chunk, size in zip(array.chunks, array.shape, strict=True))
+    ):
+        return None
+    dtype = array.dtype
+    first_chunk = (0,) * array.ndim
+    if zarr.__version__.startswith("3"):
+        from zarr.codecs import BytesCodec
+        from zarr.storage import LocalStore
+
+        if not isinstance(array.store, LocalStore) or array.compressors or array.filters:
+            return None
+        if array.metadata.zarr_format == 3:
+            serializer = array.serializer
+            if array.shards is not None or not isinstance(serializer, BytesCodec):
+                return None
+            if serializer.endian is not None:
+                dtype = dtype.newbyteorder("<" if serializer.endian.value == "little" else ">")
+        root = str(array.store.root)
+        chunk_path = os.path.join(root, array.path, array.metadata.encode_chunk_key(first_chunk))
+    else:
+        from zarr.storage import DirectoryStore  # type: ignore[attr-defined]
+
+        if not isinstance(array.store, DirectoryStore) or array.compressor or array.filters:
+            return None
+        chunk_key = array._chunk_key(first_chunk)  # type: ignore[attr-defined]
+        chunk_path = os.path.join(array.store.path, chunk_key)
+
+    n_bytes = int(np.prod(array.chunks)) * dtype.itemsize
+    if not os.path.isfile(chunk_path) or os.path.getsize(chunk_path) != n_bytes:
+        return None
+    mapped = np.memmap(chunk_path, dtype=dtype, mode="r", shape=array.chunks)
+    return mapped[tuple(slice(0, size) for size in array.shape)]
+
+
+class LazyPropDict(Mapping[str, NDArray[Any]]):
+    """
+    A prop dictionary that reads its "values" and "missing" arrays on first access.
+
+    It has the same keys as a `PropDictNpArray` and can be used in its place, for example
+    by the `construct` functions of the backends. Each array is read from the zarr the
+    first time it is accessed, restricted to the selected nodes or edges, and then cached.
+    """
+
+    def __init__(
+        self,
+        prop_dict: PropDictZArray,
+        selection: NDArray[np.bool_] | NDArray[np.integer] | slice | None = None,
+    ):
+        """
+        A prop dictionary that reads its arrays on first access.
+
+        Args:
+            prop_dict (PropDictZArray): The zarr arrays of the property.
+            selection (np.ndarray of bool | np.ndarray of int | slice, optional): The
+                selection of rows to read, see `read_selection`. If None, all rows are read.
+        """
+        self._arrays = prop_dict
+        self._selection = selection
+        self._cache: dict[str, NDArray[Any]] = {}
+
+    def __getitem__(self, key: str) -> NDArray[Any]:
+        if key not in self._cache:
+            data = read_selection(self._arrays[key], self._selection)  # type: ignore[literal-required]
+            self._cache[key] = data.astype(bool, copy=False) if key == "missing" else data
+        return self._cache[key]
+
+    def __contains__(self, key: object) -> bool:
+        # checking for a key, like "missing", must not read the array
+        return key in self._arrays
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._arrays)
+
+    def __len__(self) -> int:
+        return len(self._arrays)
+
+    def is_loaded(self, key: str) -> bool:
+        """Check if the array `key` has already been read from the zarr."""
+        return key in self._cache
+
+    def __repr__(self) -> str:
+        loaded = {key: self.is_loaded(key) for key in self}
+        return f"LazyPropDict(loaded={loaded})"
+
+
+def _submit(
+    executor: Executor | None, fn: Callable[..., NDArray[Any]], *args: Any
+) -> Future[NDArray[Any]]:
+    """Submit a read to the executor, or run it right away if there is no executor."""
+    if executor is not None:
+        return executor.submit(fn, *args)
+    future: Future[NDArray[Any]] = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def _read_missing(array: zarr.Array, selection: Any) -> NDArray[np.bool_]:
+    return read_selection(array, selection).astype(bool, copy=False)
+
+
+def _submit_props(
+    executor: Executor | None,
+    props: dict[str, PropDictZArray],
+    selection: NDArray[np.bool_] | NDArray[np.integer] | slice | None,
+    lazy: bool,
+) -> dict[str, LazyPropDict | dict[str, Future[NDArray[Any]]]]:
+    """Submit reads of the selected rows of zarr prop dictionaries, or wrap them to read
+    lazily. Call `_collect_props` to get the prop dictionaries."""
+    submitted: dict[str, LazyPropDict | dict[str, Future[NDArray[Any]]]] = {}
+    for name, prop_dict in props.items():
+        if lazy:
+            submitted[name] = LazyPropDict(prop_dict, selection)
+            continue
+        futures = {"values": _submit(executor, read_selection, prop_dict["values"], selection)}
+        if "missing" in prop_dict:
+            futures["missing"] = _submit(executor, _read_missing, prop_dict["missing"], selection)
+        submitted[name] = futures
+    return submitted
+
+
+def _collect_props(
+    submitted: dict[str, LazyPropDict | dict[str, Future[NDArray[Any]]]],
+) -> dict[str, PropDictNpArray]:
+    """Wait for the reads of `_submit_props`, in the order they were submitted."""
+    prop_dicts: dict[str, PropDictNpArray] = {}
+    for name, futures in submitted.items():
+        if isinstance(futures, LazyPropDict):
+            prop_dicts[name] = cast("PropDictNpArray", futures)
+        else:
+            prop_dicts[name] = cast(
+                "PropDictNpArray", {key: future.result() for key, future in futures.items()}
+            )
+    return prop_dicts
+
+
+def _iter_batches(
+    ids: zarr.Array,
+    props: dict[str, PropDictZArray],
+    batch_size: int | None,
+    prefetch: bool,
+) -> Iterator[tuple[NDArray[Any], dict[str, PropDictNpArray]]]:
+    """Check the batch size, then return the generator of `_read_batches`."""
+    chunk_len = ids.chunks[0]
+    if batch_size is None:
+        batch_size = chunk_len
+    elif batch_size < 1:
+        raise ValueError(f"Batch size must be positive, got {batch_size}")
+    # round up to whole chunks, so that batches do not share a chunk
+    batch_size = -(-batch_size // chunk_len) * chunk_len
+    return _read_batches(ids, dict(props), batch_size, prefetch)
+
+
+def _read_batches(
+    ids: zarr.Array,
+    props: dict[str, PropDictZArray],
+    batch_size: int,
+    prefetch: bool,
+) -> Iterator[tuple[NDArray[Any], dict[str, PropDictNpArray]]]:
+    """Read the ids and props in slices of `batch_size` rows, one batch ahead if
+    `prefetch` is True."""
+    executor = ThreadPoolExecutor(1) if prefetch else None
+
+    def submit(start: int) -> tuple[Future[NDArray[Any]], dict[str, Any]]:
+        rows = slice(start, start + batch_size)
+        return _submit(executor, read_selection, ids, rows), _submit_props(
+            executor, props, rows, lazy=False
+        )
+
+    n_rows = ids.shape[0]
+    try:
+        pending = submit(0) if prefetch and n_rows > 0 else None
+        for start in range(0, n_rows, batch_size):
+            ids_future, props_futures = pending if pending is not None else submit(start)
+            next_start = start + batch_size
+            pending = submit(next_start) if prefetch and next_start < n_rows else None
+            yield ids_future.result(), _collect_props(props_futures)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
 class GeffReader:
     """
     File reader class that allows subset reading to an intermediate dict representation.
@@ -60,19 +446,33 @@ class GeffReader:
         self.edge_props: dict[str, PropDictZArray] = {}
 
         # get node properties names
-        if "props" in self.group["nodes"].keys():
+        if "nodes/props" in self.group:
             node_props_group = zarr.open_group(self.group.store, path="nodes/props", mode="r")
             self.node_prop_names: list[str] = [*node_props_group.group_keys()]
         else:
             self.node_prop_names = []
 
         # get edge property names
-        if "props" in self.group["edges"].keys():
+        if "edges/props" in self.group:
             edge_props_group = zarr.open_group(self.group.store, path="edges/props", mode="r")
             self.edge_prop_names: list[str] = [*edge_props_group.group_keys()]
         else:
             self.edge_prop_names = []
 
+        # get the frame offset table of time sorted nodes
+        self.time_index: tuple[NDArray[Any], NDArray[np.int64]] | None = None
+        if "nodes/time_index" in self.group:
+            time_index_group = zarr.open_group(self.group.store, path="nodes/time_index", mode="r")
+            self.time_index = (
+                _read_array(time_index_group, "frames"),
+                _read_array(time_index_group, "offsets"),
+            )
+
+        # the adjacency index, and the index of all node ids, are loaded on first use
+        self.has_adjacency = "edges/adjacency" in self.group
+        self._adjacency: dict[str, Any] | None = None
+        self._node_index: IdIndex | None = None
+
     def read_node_props(self, names: list[str] | None = None):
         """
         Read the node property with the name `name` from a GEFF.
@@ -90,9 +490,9 @@ class GeffReader:
 
         for name in names:
             prop_group = zarr.open_group(self.group.store, path=f"nodes/props/{name}", mode="r")
-            prop_dict: PropDictZArray = {"values": prop_group["values"]}
+            prop_dict: PropDictZArray = {"values": _get_array(prop_group, "values")}
             if "missing" in prop_group.keys():
-                prop_dict["missing"] = prop_group["missing"]
+                prop_dict["missing"] = _get_array(prop_group, "missing")
             self.node_props[name] = prop_dict
 
     def read_edge_props(self, names: list[str] | None = None):
@@ -112,20 +512,81 @@ class GeffReader:
 
         for name in names:
             prop_group = zarr.open_group(self.group.store, path=f"edges/props/{name}", mode="r")
-            prop_dict: PropDictZArray = {"values": prop_group["values"]}
+            prop_dict: PropDictZArray = {"values": _get_array(prop_group, "values")}
             if "missing" in prop_group.keys():
-                prop_dict["missing"] = prop_group["missing"]
+                prop_dict["missing"] = _get_array(prop_group, "missing")
             self.edge_props[name] = prop_dict
 
+    def query(self, ranges: dict[str, tuple[float | None, float | None]]) -> NDArray[np.bool_]:
+        """
+        Select the nodes whose property values fall inside the given ranges.
+
+        Properties written with chunk statistics (`chunk_min` and `chunk_max` arrays) are
+        used to skip the chunks that cannot contain a match, and chunks already excluded
+        by a previous range are not decoded either. Nodes that are missing a queried
+        property are never selected.
+
+        Args:
+            ranges (dict[str, tuple[float | None, float | None]]): A dictionary from 1D
+                node property names to inclusive (min, max) bounds. Use None for an open
+                bound.
+
+        Returns:
+            np.ndarray of bool: A node mask that is True for the nodes matching all ranges,
+            which can be passed to `build` as `node_mask`.
+
+        Raises:
+            ValueError: If a property does not exist or is not one dimensional.
+        """
+        mask = np.ones(self.nodes.shape[0], dtype=bool)
+        for name, (low, high) in ranges.items():
+            if name not in self.node_prop_names:
+                raise ValueError(f"Node property {name} not found in {self.node_prop_names}")
+            prop_group = zarr.open_group(self.group.store, path=f"nodes/props/{name}", mode="r")
+            values = _get_array(prop_group, "values")
+            if values.ndim != 1:
+                raise ValueError(
+                    f"Can only query one dimensional properties, {name} has shape {values.shape}"
+                )
+            array_keys = set(prop_group.array_keys())
+
+            candidates = mask
+            if "chunk_min" in array_keys and "chunk_max" in array_keys:
+                overlap = np.ones(_get_array(prop_group, "chunk_min").shape[0], dtype=bool)
+                if low is not None:
+                    overlap &= _read_array(prop_group, "chunk_max") >= low
+                if high is not None:
+                    overlap &= _read_array(prop_group, "chunk_min") <= high
+                candidates = mask & np.repeat(overlap, values.chunks[0])[: len(mask)]
+
+            selected = read_selection(values, candidates)
+            keep = np.ones(len(selected), dtype=bool)
+            if low is not None:
+                keep &= selected >= low
+            if high is not None:
+                keep &= selected <= high
+            if "missing" in array_keys:
+                keep &= ~read_selection(_get_array(prop_group, "missing"), candidates).astype(bool)
+
+            mask = np.zeros_like(mask)
+            mask[np.flatnonzero(candidates)[keep]] = True
+        return mask
+
     def build(
         self,
-        node_mask: NDArray[bool] | None = None,
-        edge_mask: NDArray[bool] | None = None,
+        node_mask: NDArray[np.bool_] | None = None,
+        edge_mask: NDArray[np.bool_] | None = None,
+        lazy: bool = False,
+        max_workers: int | None = None,
     ) -> InMemoryGeff:
         """
         Build an `InMemoryGeff` by loading the data from a GEFF zarr.
 
-        A set of nodes and edges can be selected using `node_mask` and `edge_mask`.
+        A set of nodes and edges can be selected using `node_mask` and `edge_mask`. Only
+        the chunks that contain selected nodes or edges are decoded.
+
+        With `lazy=True` the node and edge ids are read right away, but the property
+        arrays are only read when they are first accessed, see `LazyPropDict`.
 
         Args:
             node_mask (np.ndarray of bool): A boolean numpy array to mask build a graph
@@ -134,52 +595,305 @@ class GeffReader:
             edge_mask (np.ndarray of bool): A boolean numpy array to mask build a graph
             of a subset of edge, where `edge_mask` is equal to True. It must be a 1D
             array of length number of edges.
+            lazy (bool, optional): If True, defer reading each property array until it is
+            first accessed. Defaults to False.
+            max_workers (int, optional): If given, the node ids, edge ids and every
+            property array are read concurrently by a pool of this many threads, which
+            helps when reading is latency bound, like on network storage. The output is
+            the same as for a sequential read. Defaults to None, reading sequentially.
         Returns:
             InMemoryGeff: A dictionary of in memory numpy arrays representing the graph.
         """
-        nodes = np.array(self.nodes[node_mask.tolist() if node_mask is not None else ...])
-        node_props: dict[str, PropDictNpArray] = {}
-        for name, props in self.node_props.items():
-            node_props[name] = {
-                "values": np.array(
-                    props["values"][node_mask.tolist() if node_mask is not None else ...]
+        return self._build(node_mask, edge_mask, lazy=lazy, max_workers=max_workers)
+
+    def iter_node_batches(
+        self, batch_size: int | None = None, prefetch: bool = False
+    ) -> Iterator[tuple[NDArray[Any], dict[str, PropDictNpArray]]]:
+        """
+        Iterate over the nodes in batches of consecutive rows, without reading all nodes.
+
+        Each batch has the node ids and the node properties loaded with
+        `read_node_props`, with rows aligned to the ids. Batches end on the chunk
+        boundaries of the node ids, so that no chunk of the ids is decoded twice.
+
+        Args:
+            batch_size (int, optional): The number of nodes of each batch, rounded up to a
+                whole number of chunks of the node ids. The last batch may be smaller.
+                Defaults to None, using one chunk per batch.
+            prefetch (bool, optional): If True, the next batch is read in a background
+                thread while the current batch is processed. Defaults to False.
+
+        Yields:
+            tuple[np.ndarray, dict[str, PropDictNpArray]]: The node ids of the batch, and
+                a dictionary from property names to the values and missing arrays of the
+                batch.
+
+        Raises:
+            ValueError: If `batch_size` is not positive.
+        """
+        return _iter_batches(self.nodes, self.node_props, batch_size, prefetch)
+
+    def iter_edge_batches(
+        self, batch_size: int | None = None, prefetch: bool = False
+    ) -> Iterator[tuple[NDArray[Any], dict[str, PropDictNpArray]]]:
+        """
+        Iterate over the edges in batches of consecutive rows, without reading all edges.
+
+        Each batch has the edge ids and the edge properties loaded with
+        `read_edge_props`, with rows aligned to the ids. Batches end on the chunk
+        boundaries of the edge ids, so that no chunk of the ids is decoded twice.
+
+        Args:
+            batch_size (int, optional): The number of edges of each batch, rounded up to a
+                whole number of chunks of the edge ids. The last batch may be smaller.
+                Defaults to None, using one chunk per batch.
+            prefetch (bool, optional): If True, the next batch is read in a background
+                thread while the current batch is processed. Defaults to False.
+
+        Yields:
+            tuple[np.ndarray, dict[str, PropDictNpArray]]: The edge ids of the batch, with
+                shape (E, 2), and a dictionary from property names to the values and
+                missing arrays of the batch.
+
+        Raises:
+            ValueError: If `batch_size` is not positive.
+        """
+        return _iter_batches(self.edges, self.edge_props, batch_size, prefetch)
+
+    def read_frame(self, frame: Any) -> InMemoryGeff:
+        """
+        Build an `InMemoryGeff` of the nodes in a single frame, and the edges between them.
+
+        Requires a geff written with `sort_by_time=True`, so that the frame is read as a
+        contiguous slice of the node arrays without evaluating a mask.
+
+        Args:
+            frame (Any): The value of the time property of the frame.
+
+        Returns:
+            InMemoryGeff: A dictionary of in memory numpy arrays representing the frame.
+
+        Raises:
+            ValueError: If the geff has no time index.
+        """
+        return self.read_time_range(frame, frame)
+
+    def read_time_range(self, start: Any, stop: Any) -> InMemoryGeff:
+        """
+        Build an `InMemoryGeff` of the nodes with start <= time <= stop, and the edges
+        between them.
+
+        Requires a geff written with `sort_by_time=True`, so that the frames are read as a
+        contiguous slice of the node arrays without evaluating a mask.
+
+        Args:
+            start (Any): The first frame to include.
+            stop (Any): The last frame to include.
+
+        Returns:
+            InMemoryGeff: A dictionary of in memory numpy arrays representing the frames.
+
+        Raises:
+            ValueError: If the geff has no time index.
+        """
+        if self.time_index is None:
+            raise ValueError(
+                "Geff has no time index, write it with `sort_by_time=True` to read frames"
+            )
+        frames, offsets = self.time_index
+        first = offsets[np.searchsorted(frames, start, side="left")]
+        last = offsets[np.searchsorted(frames, stop, side="right")]
+        return self._build(slice(int(first), int(last)))
+
+    def successors(self, node_ids: ArrayLike) -> NDArray[Any]:
+        """
+        Get the ids of the targets of the out-edges of the given nodes.
+
+        Uses the adjacency index written with `adjacency=True` to read only the edge rows
+        of the given nodes. Without a stored index, all edges are loaded once to build it
+        in memory.
+
+        Args:
+            node_ids (array-like): The ids of the source nodes.
+
+        Returns:
+            np.ndarray: The unique ids of the successor nodes.
+
+        Raises:
+            ValueError: If a node id is not in the graph.
+        """
+        rows = self._incident_edge_rows(self._node_indices(node_ids), "out")
+        return np.unique(read_selection(self.edges, rows)[:, 1])
+
+    def predecessors(self, node_ids: ArrayLike) -> NDArray[Any]:
+        """
+        Get the ids of the sources of the in-edges of the given nodes.
+
+        Uses the adjacency index written with `adjacency=True` to read only the edge rows
+        of the given nodes. Without a stored index, all edges are loaded once to build it
+        in memory.
+
+        Args:
+            node_ids (array-like): The ids of the target nodes.
+
+        Returns:
+            np.ndarray: The unique ids of the predecessor nodes.
+
+        Raises:
+            ValueError: If a node id is not in the graph.
+        """
+        rows = self._incident_edge_rows(self._node_indices(node_ids), "in")
+        return np.unique(read_selection(self.edges, rows)[:, 0])
+
+    def edges_incident_to(self, node_ids: ArrayLike) -> NDArray[Any]:
+        """
+        Get the edges that have any of the given nodes as source or target.
+
+        Uses the adjacency index written with `adjacency=True` to read only the edge rows
+        of the given nodes. Without a stored index, all edges are loaded once to build it
+        in memory.
+
+        Args:
+            node_ids (array-like): The ids of the nodes.
+
+        Returns:
+            np.ndarray: The incident edge ids with shape (E', 2), in the order of the
+            edges/ids array.
+
+        Raises:
+            ValueError: If a node id is not in the graph.
+        """
+        indices = self._node_indices(node_ids)
+        rows = np.union1d(
+            self._incident_edge_rows(indices, "out"), self._incident_edge_rows(indices, "in")
+        )
+        return read_selection(self.edges, rows)
+
+    def _get_node_index(self) -> IdIndex:
+        """Get the index of the positions of all node ids, loading them on first use."""
+        if self._node_index is None:
+            self._node_index = IdIndex(self.nodes[:])
+        return self._node_index
+
+    def _node_indices(self, node_ids: ArrayLike) -> NDArray[np.intp]:
+        """Find the unique, sorted indices of node ids in the nodes/ids array."""
+        node_ids = np.unique(np.asarray(node_ids))
+        indices = self._get_node_index().positions(node_ids)
+        if np.any(indices < 0):
+            raise ValueError(f"Node ids {node_ids[indices < 0].tolist()} not found in the graph")
+        return np.sort(indices)
+
+    def _incident_edge_rows(
+        self, node_indices: NDArray[np.integer] | slice, direction: str
+    ) -> NDArray[np.int64]:
+        """Find the sorted rows of the out- or in-edges of the nodes at sorted indices."""
+        if self._adjacency is None:
+            if self.has_adjacency:
+                adjacency_group = zarr.open_group(
+                    self.group.store, path="edges/adjacency", mode="r"
                 )
-            }
-            if "missing" in props:
-                node_props[name]["missing"] = np.array(
-                    props["missing"][node_mask.tolist() if node_mask is not None else ...],
-                    dtype=bool,
+                # the pointers are read in full, the indices only where needed
+                self._adjacency = {
+                    name: _read_array(adjacency_group, name)
+                    if name.endswith("indptr")
+                    else _get_array(adjacency_group, name)
+                    for name in ("out_indptr", "out_indices", "in_indptr", "in_indices")
+                }
+            else:
+                self._adjacency = utils.compute_adjacency(
+                    read_selection(self.nodes), read_selection(self.edges)
                 )
+        indptr = self._adjacency[f"{direction}_indptr"]
+        indices = self._adjacency[f"{direction}_indices"]
 
-        # remove edges if any of it's nodes has been masked
-        edges = np.array(self.edges[:])
-        if node_mask is not None:
-            edge_mask_removed_nodes = np.isin(edges, nodes).all(axis=1)
+        if isinstance(node_indices, slice):
+            positions: NDArray[np.integer] | slice = slice(
+                int(indptr[node_indices.start]), int(indptr[node_indices.stop])
+            )
+        else:
+            starts = indptr[node_indices]
+            counts = indptr[node_indices + 1] - starts
+            # concatenate the ranges starts[i]:starts[i] + counts[i]
+            positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(
+                counts.sum()
+            )
+        if isinstance(indices, np.ndarray):
+            rows = indices[positions]
+        else:
+            rows = read_selection(indices, positions)
+        return np.sort(rows)
+
+    def _build(
+        self,
+        node_selection: NDArray[np.bool_] | slice | None = None,
+        edge_mask: NDArray[np.bool_] | None = None,
+        lazy: bool = False,
+        max_workers: int | None = None,
+    ) -> InMemoryGeff:
+        """Build an `InMemoryGeff` from a node mask or a contiguous slice of nodes."""
+        executor = ThreadPoolExecutor(max_workers) if max_workers is not None else None
+        try:
+            return self._build_with(executor, node_selection, edge_mask, lazy)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def _build_with(
+        self,
+        executor: Executor | None,
+        node_selection: NDArray[np.bool_] | slice | None,
+        edge_mask: NDArray[np.bool_] | None,
+        lazy: bool,
+    ) -> InMemoryGeff:
+        # all reads that do not depend on each other are submitted before waiting
+        nodes_future = _submit(executor, read_selection, self.nodes, node_selection)
+        node_props = _submit_props(executor, self.node_props, node_selection, lazy)
+
+        edge_selection: NDArray[np.bool_] | NDArray[np.integer] | None = edge_mask
+        edge_props: dict[str, LazyPropDict | dict[str, Future[NDArray[Any]]]] = {}
+        if node_selection is not None and self.has_adjacency:
+            # an edge is kept if it is both an out-edge and an in-edge of selected nodes,
+            # so only the edge rows of the selected nodes are read
+            node_indices = (
+                node_selection
+                if isinstance(node_selection, slice)
+                else np.flatnonzero(node_selection)
+            )
+            edge_rows = np.intersect1d(
+                self._incident_edge_rows(node_indices, "out"),
+                self._incident_edge_rows(node_indices, "in"),
+                assume_unique=True,
+            )
             if edge_mask is not None:
-                edge_mask = np.logical_and(edge_mask, edge_mask_removed_nodes)
-            else:
-                edge_mask = edge_mask_removed_nodes
-        edges = edges[edge_mask if edge_mask is not None else ...]
-
-        edge_props: dict[str, PropDictNpArray] = {}
-        for name, props in self.edge_props.items():
-            edge_props[name] = {
-                "values": np.array(
-                    props["values"][edge_mask.tolist() if edge_mask is not None else ...]
-                )
-            }
-            if "missing" in props:
-                edge_props[name]["missing"] = np.array(
-                    props["missing"][edge_mask.tolist() if edge_mask is not None else ...],
-                    dtype=bool,
+                edge_rows = edge_rows[edge_mask[edge_rows]]
+            edge_selection = edge_rows
+            edges_future = _submit(executor, read_selection, self.edges, edge_selection)
+            edge_props = _submit_props(executor, self.edge_props, edge_selection, lazy)
+            nodes = nodes_future.result()
+            edges = edges_future.result()
+        else:
+            # only the edge chunks touched by the edge mask are decoded
+            edges_future = _submit(executor, read_selection, self.edges, edge_mask)
+            if node_selection is None:
+                edge_props = _submit_props(executor, self.edge_props, edge_selection, lazy)
+            nodes = nodes_future.result()
+            edges = edges_future.result()
+            # remove edges if any of it's nodes has been masked
+            if node_selection is not None:
+                keep = edges_within(nodes, edges)
+                edge_rows = (
+                    np.flatnonzero(edge_mask) if edge_mask is not None else np.arange(len(keep))
                 )
+                edge_selection = edge_rows[keep]
+                edges = edges[keep]
+                edge_props = _submit_props(executor, self.edge_props, edge_selection, lazy)
 
         return {
             "metadata": self.metadata,
             "node_ids": nodes,
-            "node_props": node_props,
+            "node_props": _collect_props(node_props),
             "edge_ids": edges,
-            "edge_props": edge_props,
+            "edge_props": _collect_props(edge_props),
         }
 
 
@@ -190,6 +904,8 @@ def read_to_memory(
     validate: bool = True,
     node_props: list[str] | None = None,
     edge_props: list[str] | None = None,
+    lazy: bool = False,
+    max_workers: int | None = None,
 ) -> InMemoryGeff:
     """
     Read a GEFF zarr file to into memory as a series of numpy arrays in a dictionary.
@@ -207,6 +923,10 @@ def read_to_memory(
             if None all properties will be loaded, defaults to None.
         edge_props (list of str, optional): The names of the edge properties to load,
             if None all properties will be loaded, defaults to None.
+        lazy (bool, optional): If True, the property arrays are only read when they are
+            first accessed, see `LazyPropDict`. Defaults to False.
+        max_workers (int, optional): If given, the arrays are read concurrently by a pool
+            of this many threads. Defaults to None, reading sequentially.
 
     Returns:
         A InMemoryGeff object containing the graph as a TypeDict of in memory numpy arrays
@@ -218,5 +938,5 @@ def read_to_memory(
     file_reader.read_node_props(node_props)
     file_reader.read_edge_props(edge_props)
 
-    in_memory_geff = file_reader.build()
+    in_memory_geff = file_reader.build(lazy=lazy, max_workers=max_workers)
     return in_memory_geff
@@ -0,0 +1,400 @@
+from __future__ import annotations
+
+import warnings
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+from geff.io_utils import (
+    RoiAccumulator,
+    create_or_update_metadata,
+    create_or_update_props_metadata,
+    get_graph_existing_metadata,
+    setup_zarr_group,
+)
+from geff.metadata_schema import GeffMetadata, PropMetadata, axes_from_lists
+from geff.utils import remove_tilde
+from geff.valid_values import validate_data_type
+from geff.write_arrays import ArrayEncoding, EncodingLike, create_resizable_array, get_encoding
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from types import TracebackType
+
+    import zarr
+    from numpy.typing import ArrayLike
+    from zarr.storage import StoreLike
+
+
+def _can_promote(dtype: np.dtype, other: np.dtype) -> bool:
+    """Whether two dtypes can be promoted to a common dtype: both numeric or both strings."""
+    kinds = {dtype.kind, other.kind}
+    return kinds <= set("biuf") or kinds == {"U"}
+
+
+class GeffWriter:
+    """
+    Write a geff in batches of nodes and edges, for graphs that do not fit in memory.
+
+    The ids and every property are stored in zarr arrays that grow by appending each
+    batch, so memory is bounded by the batch size. Properties do not need to be present
+    in every batch: rows of batches without a property, or before its first batch, are
+    marked in its `missing` array. The metadata, with the ROI of the spatiotemporal
+    properties and the dtypes of the non-string properties, is written on close.
+
+    Example:
+        >>> with GeffWriter("tracks.zarr", axis_names=["t", "y", "x"]) as writer:
+        ...     for t, (ids, positions, links) in enumerate(tracker):
+        ...         writer.append_nodes(
+        ...             ids,
+        ...             {
+        ...                 "t": (np.full(len(ids), t), None),
+        ...                 "y": (positions[:, 0], None),
+        ...                 "x": (positions[:, 1], None),
+        ...             },
+        ...         )
+        ...         writer.append_edges(links)
+    """
+
+    def __init__(
+        self,
+        store: StoreLike,
+        directed: bool = True,
+        metadata: GeffMetadata | None = None,
+        axis_names: list[str] | None = None,
+        axis_units: list[str | None] | None = None,
+        axis_types: list[str | None] | None = None,
+        zarr_format: Literal[2, 3] = 2,
+        encoding: EncodingLike = None,
+        promote_dtypes: bool = False,
+    ):
+        """
+        Write a geff in batches of nodes and edges.
+
+        Args:
+            store (str | Path | zarr store): The path/str to the output zarr, or the store
+                itself. Opens in append mode, so will only overwrite geff-controlled
+                groups.
+            directed (bool, optional): Whether the graph is directed. Defaults to True.
+            metadata (GeffMetadata, optional): The original metadata of the graph, which
+                is updated with the axes, directedness and property dtypes on close.
+                Defaults to None.
+            axis_names (list[str], optional): The names of the spatiotemporal node
+                properties. They must be present in every node batch. Defaults to None.
+                Will override the axes of the metadata if provided.
+            axis_units (list[str], optional): The units of the spatiotemporal properties.
+                Defaults to None.
+            axis_types (list[str], optional): The types of the spatiotemporal
+                properties. Usually one of "time", "space", or "channel". Defaults to None.
+            zarr_format (Literal[2, 3], optional): The version of zarr to write.
+                Defaults to 2.
+            encoding (ArrayEncoding | Mapping[str, ArrayEncoding], optional): The
+                chunking, compression and sharding of the arrays, for all groups or per
+                "nodes" and "edges" group, see `geff.write_arrays.ArrayEncoding`. If no
+                chunk size is set, arrays are chunked by `DEFAULT_CHUNK_SIZE` rows.
+                Defaults to None, using the default encoding.
+            promote_dtypes (bool, optional): If True, a numeric property with values that
+                cannot be cast to the dtype of the previous batches, or a string property
+                with longer strings, is rewritten with the promoted dtype. Rewriting loads
+                that property of all previous batches into memory. If False, the values
+                of every batch must be castable to the dtype of the first batch. The node
+                and edge ids are promoted the same way, and to a common dtype on close.
+                Defaults to False.
+        """
+        self.store = remove_tilde(store)
+        self.directed = directed
+        self.metadata = metadata
+        self.axis_names, self.axis_units, self.axis_types = get_graph_existing_metadata(
+            metadata, axis_names, axis_units, axis_types
+        )
+        self.encoding = encoding
+        self.promote_dtypes = promote_dtypes
+        self.group = setup_zarr_group(self.store, zarr_format)
+        self.n_nodes = 0
+        self.n_edges = 0
+        self.closed = False
+        self._ids: dict[str, zarr.Array] = {}
+        self._props: dict[str, dict[str, zarr.Array]] = {"nodes": {}, "edges": {}}
+        self._missing: dict[str, dict[str, zarr.Array]] = {"nodes": {}, "edges": {}}
+        self._roi = RoiAccumulator(self.axis_names or [])
+
+    @property
+    def roi(self) -> tuple[tuple[float, ...], tuple[float, ...]] | None:
+        """The min and max values of the spatiotemporal properties of the nodes appended
+        so far, or None if there are no axis names or no nodes."""
+        return self._roi.roi
+
+    def __enter__(self) -> GeffWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        # an interrupted write is left without metadata, so it is not read as a geff
+        if exc_type is None:
+            self.close()
+
+    def append_nodes(
+        self,
+        ids: ArrayLike,
+        props: Mapping[str, tuple[ArrayLike, ArrayLike | None]] | None = None,
+    ) -> None:
+        """
+        Append a batch of nodes and their properties.
+
+        Args:
+            ids (array-like): The ids of the nodes of the batch, with shape (N,).
+            props (dict[str, tuple[array-like, array-like | None]], optional): A
+                dictionary from property names to (values, missing) arrays with N rows,
+                where the missing array can be None. Defaults to None.
+
+        Raises:
+            ValueError: If the writer is closed, if a spatiotemporal property is missing,
+                or if the arrays do not match the ids or the previous batches.
+        """
+        ids = np.asarray(ids)
+        if ids.ndim != 1:
+            raise ValueError(f"Node ids must have shape (N,), got {ids.shape}")
+        props = props or {}
+        # an empty batch does not need the spatiotemporal properties
+        axis_names = self.axis_names if len(ids) > 0 else None
+        if axis_names is not None:
+            for axis in axis_names:
+                missing = props.get(axis, (None, None))[1]
+                if axis not in props or (missing is not None and np.any(missing)):
+                    raise ValueError(f"Spatiotemporal property '{axis}' not found in batch")
+        self._append("nodes", ids, props)
+        if axis_names is not None:
+            self._roi.update({axis: props[axis][0] for axis in axis_names})
+        self.n_nodes += len(ids)
+
+    def append_edges(
+        self,
+        ids: ArrayLike,
+        props: Mapping[str, tuple[ArrayLike, ArrayLike | None]] | None = None,
+    ) -> None:
+        """
+        Append a batch of edges and their properties.
+
+        Args:
+            ids (array-like): The source and target node ids of the edges of the batch,
+                with shape (E, 2). Must have the same dtype as the node ids.
+            props (dict[str, tuple[array-like, array-like | None]], optional): A
+                dictionary from property names to (values, missing) arrays with E rows,
+                where the missing array can be None. Defaults to None.
+
+        Raises:
+            ValueError: If the writer is closed, or if the arrays do not match the ids or
+                the previous batches.
+        """
+        ids = np.asarray(ids)
+        if ids.ndim != 2 or ids.shape[1] != 2:
+            raise ValueError(f"Edge ids must have shape (E, 2), got {ids.shape}")
+        self._append("edges", ids, props or {})
+        self.n_edges += len(ids)
+
+    def _append(
+        self,
+        group: str,
+        ids: np.ndarray,
+        props: Mapping[str, tuple[ArrayLike, ArrayLike | None]],
+    ) -> None:
+        if self.closed:
+            raise ValueError("Cannot append to a closed GeffWriter")
+        n_rows = self.n_nodes if group == "nodes" else self.n_edges
+        n_batch = len(ids)
+        batch = {}
+        for name, (values, missing) in props.items():
+            values = np.asarray(values)
+            if len(values) != n_batch:
+                raise ValueError(
+                    f"Property '{name}' has {len(values)} values for {n_batch} {group}"
+                )
+            if missing is not None:
+                missing = np.asarray(missing, dtype=bool)
+                if missing.shape != (n_batch,):
+                    raise ValueError(
+                        f"Property '{name}' has a missing array of shape {missing.shape} "
+                        f"for {n_batch} {group}"
+                    )
+            batch[name] = (values, missing)
+
+        # check the whole batch before writing, so that a rejected batch leaves the arrays
+        # of the previous batches as they are
+        self._check_rows(self._ids, group, f"{group}/ids", ids)
+        for name, (values, _) in batch.items():
+            self._check_rows(self._props[group], name, f"{group}/props/{name}/values", values)
+
+        encoding = get_encoding(self.encoding, group)
+        self._append_rows(self._ids, group, f"{group}/ids", ids, n_rows, encoding)
+        for name, (values, missing) in batch.items():
+            path = f"{group}/props/{name}/values"
+            if name not in self._props[group] and n_rows > 0:
+                # the rows of the previous batches are missing this property
+                self._missing_array(group, name, n_rows, encoding, fill=True)
+            self._append_rows(self._props[group], name, path, values, n_rows, encoding)
+            if missing is not None and name not in self._missing[group]:
+                self._missing_array(group, name, n_rows, encoding, fill=False)
+            if name in self._missing[group]:
+                if missing is None:
+                    missing = np.zeros(n_batch, dtype=bool)
+                self._missing[group][name].append(missing)
+
+        # the rows of this batch are missing the properties of the previous batches
+        for name, array in self._props[group].items():
+            if name not in batch:
+                array.append(np.zeros((n_batch, *array.shape[1:]), dtype=array.dtype))
+                if name not in self._missing[group]:
+                    self._missing_array(group, name, n_rows, encoding, fill=False)
+                self._missing[group][name].append(np.ones(n_batch, dtype=bool))
+
+    def _check_rows(
+        self, arrays: dict[str, zarr.Array], key: str, path: str, data: np.ndarray
+    ) -> None:
+        """Check that data can be appended to an array, if the array exists.
+
+        Raises:
+            ValueError: If the dtype of the data cannot be cast, or promoted with
+                `promote_dtypes`, to the dtype of the array, or if the shapes of the rows
+                differ.
+        """
+        if key not in arrays:
+            return
+        array = arrays[key]
+        castable = np.can_cast(data.dtype, array.dtype, casting="safe")
+        if not castable and not (self.promote_dtypes and _can_promote(array.dtype, data.dtype)):
+            raise ValueError(
+                f"Cannot append {data.dtype} values to '{path}' with dtype {array.dtype}. "
+                "Use the same dtype in every batch, and a fixed width like '<U16' for strings."
+            )
+        if data.shape[1:] != array.shape[1:]:
+            raise ValueError(
+                f"Cannot append values of shape {data.shape[1:]} to '{path}' with shape "
+                f"{array.shape[1:]}"
+            )
+
+    def _append_rows(
+        self,
+        arrays: dict[str, zarr.Array],
+        key: str,
+        path: str,
+        data: np.ndarray,
+        n_rows: int,
+        encoding: ArrayEncoding,
+    ) -> None:
+        """Append data to an array, creating it with `n_rows` unset rows if needed. The
+        data must have been checked with `_check_rows`."""
+        if key not in arrays:
+            arrays[key] = create_resizable_array(
+                self.group, path, (n_rows, *data.shape[1:]), data.dtype, encoding
+            )
+        array = arrays[key]
+        if not np.can_cast(data.dtype, array.dtype, casting="safe"):
+            array = arrays[key] = self._promote(array, path, data.dtype, encoding)
+        array.append(data.astype(array.dtype, copy=False))
+
+    def _promote(
+        self, array: zarr.Array, path: str, dtype: np.dtype, encoding: ArrayEncoding
+    ) -> zarr.Array:
+        """Rewrite an array with the dtype promoted to hold values of `dtype`."""
+        data = array[:]
+        promoted = create_resizable_array(
+            self.group, path, array.shape, np.result_type(array.dtype, dtype), encoding
+        )
+        promoted[:] = data
+        return promoted
+
+    def _missing_array(
+        self, group: str, name: str, n_rows: int, encoding: ArrayEncoding, fill: bool
+    ) -> None:
+        """Create the missing array of a property, with `n_rows` rows set to `fill`."""
+        self._missing[group][name] = create_resizable_array(
+            self.group,
+            f"{group}/props/{name}/missing",
+            (n_rows,),
+            np.dtype(bool),
+            encoding,
+            fill_value=fill,
+        )
+
+    def close(self, write_metadata: bool = True) -> None:
+        """
+        Finish the geff by writing empty id arrays for groups without any batch, and the
+        metadata with the ROI and the property dtypes.
+
+        Closing an already closed writer does nothing.
+
+        Args:
+            write_metadata (bool, optional): If False, only the arrays are finished, and
+                writing the metadata is left to the caller. Defaults to True.
+
+        Raises:
+            TypeError: If the node ids and edge ids have different dtypes.
+        """
+        if self.closed:
+            return
+        self.closed = True
+
+        dtypes = [array.dtype for array in self._ids.values()]
+        dtype = dtypes[0] if dtypes else np.dtype(np.int64)
+        for group, empty in [("nodes", np.empty((0,), dtype)), ("edges", np.empty((0, 2), dtype))]:
+            if group not in self._ids:
+                encoding = get_encoding(self.encoding, group)
+                self._append_rows(self._ids, group, f"{group}/ids", empty, 0, encoding)
+        node_dtype, edge_dtype = self._ids["nodes"].dtype, self._ids["edges"].dtype
+        if (
+            node_dtype != edge_dtype
+            and self.promote_dtypes
+            and _can_promote(node_dtype, edge_dtype)
+        ):
+            dtype = np.result_type(node_dtype, edge_dtype)
+            for group in ("nodes", "edges"):
+                if self._ids[group].dtype != dtype:
+                    encoding = get_encoding(self.encoding, group)
+                    self._ids[group] = self._promote(
+                        self._ids[group], f"{group}/ids", dtype, encoding
+                    )
+        if self._ids["nodes"].dtype != self._ids["edges"].dtype:
+            raise TypeError(
+                "Node ids and edge ids must have same dtype: "
+                f"{self._ids['nodes'].dtype=}, {self._ids['edges'].dtype=}"
+            )
+        if not validate_data_type(dtype):
+            warnings.warn(
+                f"Java Zarr implementations do not support dtype {dtype}. "
+                "Please use a supported type.",
+                stacklevel=2,
+            )
+        self.group.require_group("nodes/props")
+        self.group.require_group("edges/props")
+        if not write_metadata:
+            return
+
+        roi_min, roi_max = self._roi.roi or (None, None)
+        axes = axes_from_lists(
+            self.axis_names,
+            axis_units=self.axis_units,
+            axis_types=self.axis_types,
+            roi_min=roi_min,
+            roi_max=roi_max,
+        )
+        metadata = create_or_update_metadata(self.metadata, self.directed, axes)
+        components: list[tuple[str, Literal["node", "edge"]]] = [
+            ("nodes", "node"),
+            ("edges", "edge"),
+        ]
+        for group, c_type in components:
+            # fixed width strings do not match the "str" dtype in validation, so only
+            # the dtypes of non-string properties are recorded
+            props_md = [
+                PropMetadata.model_validate({"identifier": name, "dtype": array.dtype.name})
+                for name, array in self._props[group].items()
+                if array.dtype.kind != "U"
+            ]
+            if props_md:
+                metadata = create_or_update_props_metadata(metadata, props_md, c_type)
+        metadata.write(self.store)
+        self.metadata = metadata
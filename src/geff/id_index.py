@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from numpy.typing import ArrayLike, NDArray
+
+JoinStrategy = Literal["dense", "hash", "sorted"]
+
+# a dense table of positions is used if it has at most this many slots per id
+DENSE_MAX_SLOTS_PER_ID = 8
+# a bitmap of one byte per slot is used for membership tests if it has at most this many
+# slots per id, or at most as many slots as there are values to look up
+BITMAP_MAX_SLOTS_PER_ID = 64
+# number of values looked up at once, to bound the size of temporaries
+BLOCK_SIZE = 1 << 20
+# multiplier of the fibonacci hash of integer ids
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+class IdIndex:
+    """Find the positions of ids in an array of unique ids.
+
+    The lookup strategy is picked for the ids:
+
+    - "dense": integer ids that span a range of at most `DENSE_MAX_SLOTS_PER_ID` times
+      the number of ids are looked up directly in a table of positions.
+    - "hash": other integer ids are looked up in a bucketed hash table.
+    - "sorted": ids of other dtypes, like strings, are sorted once and joined with
+      `np.searchsorted`.
+
+    Membership tests with `contains` use a bitmap of the integer id range instead, if the
+    bitmap is not larger than `BITMAP_MAX_SLOTS_PER_ID` bytes per id, or than the number
+    of values to look up. Values are looked up in blocks, so that the temporaries stay
+    small for large query arrays like the edge ids of a graph.
+
+    Example:
+        >>> index = IdIndex(np.array([10, 11, 12, 14]))
+        >>> index.positions(np.array([[12, 13], [10, 14]]))
+        array([[ 2, -1],
+               [ 0,  3]])
+        >>> index.contains(np.array([11, 15]))
+        array([ True, False])
+    """
+
+    def __init__(self, ids: ArrayLike, strategy: JoinStrategy | None = None):
+        """
+        Build the index of an array of ids.
+
+        Args:
+            ids (array-like): A 1D array of unique ids. If ids are repeated, any of their
+                positions can be returned.
+            strategy (str, optional): One of "dense", "hash" or "sorted", to force a
+                lookup strategy. If None, the best strategy for the ids is picked.
+
+        Raises:
+            ValueError: If the ids are not one dimensional, or if the strategy cannot be
+                used for the ids.
+        """
+        self.ids = np.asarray(ids)
+        if self.ids.ndim != 1:
+            raise ValueError(f"Ids must be one dimensional, got shape {self.ids.shape}")
+
+        self._is_integer = self.ids.dtype.kind in "iu"
+        has_ids = self._is_integer and len(self.ids) > 0
+        self._low = int(self.ids.min()) if has_ids else 0
+        self._span = int(self.ids.max()) - self._low + 1 if has_ids else 0
+        self._bitmap: NDArray[np.bool_] | None = None
+
+        self.strategy: JoinStrategy = strategy or self._choose_strategy()
+        if self.strategy in ("dense", "hash") and not self._is_integer:
+            raise ValueError(f"{self.strategy} lookup requires integer ids, got {self.ids.dtype}")
+
+        if self.strategy == "dense":
+            # the trailing slot is looked up by values out of range
+            self._table = np.full(self._span + 1, -1, dtype=np.intp)
+            self._table[self._offsets(self.ids)] = np.arange(len(self.ids))
+        elif self.strategy == "hash":
+            # about two buckets per id, each holding a run of the ids sorted by bucket
+            n_bits = int(np.ceil(np.log2(max(len(self.ids), 1)))) + 1
+            self._shift = np.uint64(64 - n_bits)
+            buckets = self._hash(self.ids)
+            self._order = np.argsort(buckets, kind="stable")
+            self._bucket_ids = self.ids[self._order]
+            counts = np.bincount(buckets, minlength=2**n_bits)
+            self._bucket_starts = np.concatenate(([0], np.cumsum(counts)))
+        elif self.strategy == "sorted":
+            self._order = np.argsort(self.ids, kind="stable")
+            self._sorted_ids = self.ids[self._order]
+        else:
+            raise ValueError(f"Unknown lookup strategy {self.strategy}")
+
+    def _choose_strategy(self) -> JoinStrategy:
+        if not self._is_integer:
+            return "sorted"
+        if self._span <= DENSE_MAX_SLOTS_PER_ID * len(self.ids):
+            return "dense"
+        return "hash"
+
+    def _offsets(self, values: NDArray) -> NDArray[np.uint64]:
+        """Offsets of integer values from the lowest id, clipped to the span.
+
+        Computed in modular uint64 arithmetic, so that any integer dtype works without
+        overflow checks. Values below the lowest id wrap to large offsets, so every value
+        out of range gets the offset `span`.
+        """
+        offsets = values.astype(np.int64, copy=False).view(np.uint64) - np.uint64(self._low % 2**64)
+        return np.minimum(offsets, np.uint64(self._span), out=offsets)
+
+    def _hash(self, values: NDArray) -> NDArray[np.intp]:
+        """Fibonacci hash of integer values to their bucket."""
+        with np.errstate(over="ignore"):
+            hashed = values.astype(np.int64).view(np.uint64) * _HASH_MULTIPLIER
+        return (hashed >> self._shift).astype(np.intp)
+
+    def _positions_block(self, values: NDArray) -> NDArray[np.intp]:
+        if self.strategy == "sorted":
+            if len(self.ids) == 0:
+                return np.full(values.shape, -1, dtype=np.intp)
+            sorted_positions = np.searchsorted(self._sorted_ids, values)
+            np.minimum(sorted_positions, len(self.ids) - 1, out=sorted_positions)
+            positions = self._order[sorted_positions]
+            positions[self._sorted_ids[sorted_positions] != values] = -1
+            return positions
+
+        if values.dtype.kind not in "iu":
+            return np.full(values.shape, -1, dtype=np.intp)
+        if self.strategy == "dense":
+            return self._table[self._offsets(values)]
+
+        # walk the buckets of all values in lockstep, dropping the values that are found
+        # or whose bucket is exhausted
+        buckets = self._hash(values)
+        starts = self._bucket_starts[buckets]
+        counts = self._bucket_starts[buckets + 1] - starts
+        positions = np.full(values.shape, -1, dtype=np.intp)
+        active = np.flatnonzero(counts > 0)
+        depth = 0
+        while len(active) > 0:
+            slots = starts[active] + depth
+            found = self._bucket_ids[slots] == values[active]
+            positions[active[found]] = self._order[slots[found]]
+            depth += 1
+            active = active[~found & (counts[active] > depth)]
+        return positions
+
+    def _contains_block(self, values: NDArray) -> NDArray[np.bool_]:
+        if self._bitmap is not None and values.dtype.kind in "iu":
+            return self._bitmap[self._offsets(values)]
+        return self._positions_block(values) >= 0
+
+    def _prepare_bitmap(self, n_values: int) -> None:
+        """Build the membership bitmap, if it is small enough for the number of values."""
+        if (
+            self._bitmap is None
+            and self._is_integer
+            and self._span <= max(BITMAP_MAX_SLOTS_PER_ID * len(self.ids), n_values)
+        ):
+            # the trailing slot is looked up by values out of range
+            self._bitmap = np.zeros(self._span + 1, dtype=bool)
+            self._bitmap[self._offsets(self.ids)] = True
+
+    def _lookup(
+        self, values: ArrayLike, lookup_block: Callable[[NDArray], NDArray], dtype: Any
+    ) -> NDArray:
+        values = np.asarray(values)
+        flat_values = values.reshape(-1)
+        result = np.empty(len(flat_values), dtype=dtype)
+        for start in range(0, len(flat_values), BLOCK_SIZE):
+            stop = start + BLOCK_SIZE
+            result[start:stop] = lookup_block(flat_values[start:stop])
+        return result.reshape(values.shape)
+
+    def positions(self, values: ArrayLike) -> NDArray[np.intp]:
+        """
+        Find the positions of values in the ids.
+
+        Args:
+            values (array-like): An array of any shape with the ids to look up.
+
+        Returns:
+            np.ndarray of int: An array with the shape of `values`, holding the position
+            of each value in the ids, or -1 if the value is not one of the ids.
+        """
+        return self._lookup(values, self._positions_block, np.intp)
+
+    def contains(self, values: ArrayLike) -> NDArray[np.bool_]:
+        """
+        Check which values are in the ids.
+
+        Args:
+            values (array-like): An array of any shape with the ids to look up.
+
+        Returns:
+            np.ndarray of bool: An array with the shape of `values`, True where the value
+            is one of the ids.
+        """
+        values = np.asarray(values)
+        self._prepare_bitmap(values.size)
+        return self._lookup(values, self._contains_block, bool)
+
+
+def edges_within(node_ids: ArrayLike, edge_ids: ArrayLike) -> NDArray[np.bool_]:
+    """Find the edges whose source and target are both in the given nodes.
+
+    A replacement of `np.isin(edge_ids, node_ids).all(axis=1)` that uses the best
+    `IdIndex` strategy for the node ids, and keeps the temporaries small.
+
+    Args:
+        node_ids (array-like): A 1D array of node ids.
+        edge_ids (array-like): An array of edges with shape (E, 2).
+
+    Returns:
+        np.ndarray of bool: A mask of length E that is True for the edges with both nodes
+        in `node_ids`.
+    """
+    edge_ids = np.asarray(edge_ids).reshape(-1, 2)
+    index = IdIndex(node_ids)
+    index._prepare_bitmap(edge_ids.size)
+    within = np.empty(len(edge_ids), dtype=bool)
+    for start in range(0, len(edge_ids), BLOCK_SIZE // 2):
+        stop = start + BLOCK_SIZE // 2
+        contained = index._lookup(edge_ids[start:stop], index._contains_block, bool)
+        np.logical_and(contained[:, 0], contained[:, 1], out=within[start:stop])
+    return within
@@ -1,4 +1,4 @@
-from typing import Any, Literal, Protocol, TypeVar, overload
+from typing import TYPE_CHECKING, Any, Literal, Protocol, TypeVar, overload
 
 import networkx as nx
 from numpy.typing import NDArray
@@ -11,6 +11,15 @@ from geff.typing import InMemoryGeff, PropDictNpArray
 
 from .supported_backends import SupportedBackend
 
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore[import-untyped]
+    import polars as pl
+    import rustworkx as rx
+    import spatial_graph as sg
+    from scipy import sparse  # type: ignore[import-untyped]
+
+    from geff.id_index import IdIndex
+
 R = TypeVar("R", covariant=True)
 
 # !!! Add new overloads for `read` and `get_construct_func` when a new backend is added !!!
@@ -101,6 +110,36 @@ def get_construct_func(
 ) -> ConstructFunc[nx.Graph | nx.DiGraph]: ...
 
 
+@overload
+def get_construct_func(
+    backend: Literal[SupportedBackend.PANDAS],
+) -> ConstructFunc[tuple["pd.DataFrame", "pd.DataFrame"]]: ...
+
+
+@overload
+def get_construct_func(
+    backend: Literal[SupportedBackend.POLARS],
+) -> ConstructFunc[tuple["pl.DataFrame", "pl.DataFrame"]]: ...
+
+
+@overload
+def get_construct_func(
+    backend: Literal[SupportedBackend.SCIPY],
+) -> ConstructFunc[tuple["sparse.csr_array", NDArray[Any], "IdIndex"]]: ...
+
+
+@overload
+def get_construct_func(
+    backend: Literal[SupportedBackend.RUSTWORKX],
+) -> ConstructFunc["rx.PyGraph | rx.PyDiGraph"]: ...
+
+
+@overload
+def get_construct_func(
+    backend: Literal[SupportedBackend.SPATIAL_GRAPH],
+) -> ConstructFunc["sg.SpatialGraph"]: ...
+
+
 @overload
 def get_construct_func(
     backend: Literal[SupportedBackend.GRAPH_DICT],
@@ -120,6 +159,27 @@ def get_construct_func(backend: SupportedBackend) -> ConstructFunc[Any]:
     match backend:
         case SupportedBackend.NETWORKX:
             return construct_nx
+        case SupportedBackend.PANDAS:
+            # optional dependencies are only imported when their backend is chosen
+            from geff.pandas.io import construct_pd
+
+            return construct_pd
+        case SupportedBackend.POLARS:
+            from geff.polars.io import construct_pl
+
+            return construct_pl
+        case SupportedBackend.SCIPY:
+            from geff.scipy.io import construct_scipy
+
+            return construct_scipy
+        case SupportedBackend.RUSTWORKX:
+            from geff.rustworkx.io import construct_rx
+
+            return construct_rx
+        case SupportedBackend.SPATIAL_GRAPH:
+            from geff.spatial_graph.io import construct_sg
+
+            return construct_sg
         case SupportedBackend.GRAPH_DICT:
             return construct_identity
         # Add cases for new backends, remember to add overloads
@@ -138,6 +198,61 @@ def read(
 ) -> tuple[nx.Graph | nx.DiGraph, GeffMetadata]: ...
 
 
+@overload
+def read(
+    store: StoreLike,
+    validate: bool,
+    node_props: list[str] | None,
+    edge_props: list[str] | None,
+    backend: Literal[SupportedBackend.PANDAS],
+    backend_kwargs: dict[str, Any] | None = None,
+) -> tuple[tuple["pd.DataFrame", "pd.DataFrame"], GeffMetadata]: ...
+
+
+@overload
+def read(
+    store: StoreLike,
+    validate: bool,
+    node_props: list[str] | None,
+    edge_props: list[str] | None,
+    backend: Literal[SupportedBackend.POLARS],
+    backend_kwargs: dict[str, Any] | None = None,
+) -> tuple[tuple["pl.DataFrame", "pl.DataFrame"], GeffMetadata]: ...
+
+
+@overload
+def read(
+    store: StoreLike,
+    validate: bool,
+    node_props: list[str] | None,
+    edge_props: list[str] | None,
+    backend: Literal[SupportedBackend.SCIPY],
+    backend_kwargs: dict[str, Any] | None = None,
+) -> tuple[tuple["sparse.csr_array", NDArray[Any], "IdIndex"], GeffMetadata]: ...
+
+
+@overload
+def read(
+    store: StoreLike,
+    validate: bool,
+    node_props: list[str] | None,
+    edge_props: list[str] | None,
+    backend: Literal[SupportedBackend.RUSTWORKX],
+    backend_kwargs: dict[str, Any] | None = None,
+) -> tuple["rx.PyGraph | rx.PyDiGraph", GeffMetadata]: ...
+
+
+@overload
+def read(
+    store: StoreLike,
+    validate: bool,
+    node_props: list[str] | None,
+    edge_props: list[str] | None,
+    backend: Literal[SupportedBackend.SPATIAL_GRAPH],
+    backend_kwargs: dict[str, Any] | None = None,
+) -> tuple["sg.SpatialGraph", GeffMetadata]: ...
+
+
 @overload
 def read(
     store: StoreLike,
@@ -157,6 +272,11 @@ def read(
     # using Literal because mypy can't seem to narrow the enum type when chaining functions
     backend: Literal[
         SupportedBackend.NETWORKX,
+        SupportedBackend.PANDAS,
+        SupportedBackend.POLARS,
+        SupportedBackend.SCIPY,
+        SupportedBackend.RUSTWORKX,
+        SupportedBackend.SPATIAL_GRAPH,
         SupportedBackend.GRAPH_DICT,
     ] = SupportedBackend.NETWORKX,
     backend_kwargs: dict[str, Any] | None = None,
@@ -176,7 +296,9 @@ def read(
             if None all properties will be loaded, defaults to None.
         backend (SupportedBackend): Flag for the chosen backend, default is "networkx".
         backend_kwargs (dict of {str: Any}): Additional kwargs that may be accepted by
-            the backend when reading the data.
+            the backend when reading the data, like `{"expand": True}` for the pandas and
+            polars backends, `{"weight": "score"}` for the scipy backend, or
+            `{"position_attr": "pos"}` for the spatial_graph backend.
 
     Returns:
         tuple[Any, GeffMetadata]: Graph object of the chosen backend, and the GEFF metadata.
@@ -7,8 +7,18 @@ class SupportedBackend(str, Enum):
 
     Attributes:
         NETWORKX (str): Flag for the `networkx` backend.
+        PANDAS (str): Flag for the `pandas` backend, node and edge DataFrames.
+        POLARS (str): Flag for the `polars` backend, node and edge DataFrames.
+        SCIPY (str): Flag for the `scipy` backend, a sparse adjacency matrix.
+        RUSTWORKX (str): Flag for the `rustworkx` backend.
+        SPATIAL_GRAPH (str): Flag for the `spatial_graph` backend.
     """
 
     NETWORKX = "networkx"
+    PANDAS = "pandas"
+    POLARS = "polars"
+    SCIPY = "scipy"
+    RUSTWORKX = "rustworkx"
+    SPATIAL_GRAPH = "spatial_graph"
     # GRAPH_DICT can be removed when another backend is added, it is currently needed for overloads
     GRAPH_DICT = "graph_dict"
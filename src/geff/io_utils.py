@@ -1,15 +1,17 @@
 import copy
 import warnings
-from collections.abc import Callable, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from typing import Any, Literal
 
 import numpy as np
 import zarr
+from numpy.typing import ArrayLike
 from pydantic import validate_call
 from zarr.storage import StoreLike
 
 import geff
 from geff.metadata_schema import GeffMetadata, PropMetadata
+from geff.typing import PropDictNpArray
 from geff.utils import remove_tilde
 
 
@@ -144,37 +146,146 @@ def create_or_update_props_metadata(
     return metadata
 
 
-def calculate_roi_from_nodes(
-    nodes_iter: Any,
-    axis_names: list[str],
-    node_accessor_func: Callable,
-) -> tuple[tuple[float, ...], tuple[float, ...]]:
-    """Calculate ROI (region of interest) from graph nodes.
+class RoiAccumulator:
+    """Incrementally compute the ROI (region of interest) of spatiotemporal properties.
+
+    Each call to `update` reduces a chunk of property columns with vectorized `min` and
+    `max`, so streaming writers can feed their nodes in chunks without holding all
+    positions in memory.
+
+    Example:
+        >>> accumulator = RoiAccumulator(["t", "x"])
+        >>> accumulator.update({"t": np.array([0, 1]), "x": np.array([5.0, 2.0])})
+        >>> accumulator.update({"t": np.array([2]), "x": np.array([3.0])})
+        >>> accumulator.roi
+        ((0, 2.0), (2, 5.0))
+    """
+
+    def __init__(self, axis_names: Sequence[str]):
+        """
+        Incrementally compute the ROI of spatiotemporal properties.
+
+        Args:
+            axis_names (Sequence[str]): The names of the spatiotemporal properties.
+        """
+        self.axis_names = list(axis_names)
+        self._min: list[Any] | None = None
+        self._max: list[Any] | None = None
+
+    def update(self, columns: Mapping[str, ArrayLike]) -> None:
+        """Extend the ROI with a chunk of nodes.
+
+        Args:
+            columns (Mapping[str, ArrayLike]): The values of every spatiotemporal property
+                for the nodes of the chunk, as 1D arrays of the same length.
+
+        Raises:
+            ValueError: If a spatiotemporal property is not in the columns.
+        """
+        missing_names = {name for name in self.axis_names if name not in columns}
+        if missing_names:
+            raise ValueError(f"Spatiotemporal properties {missing_names} not found in node")
+        arrays = [np.asarray(columns[name]) for name in self.axis_names]
+        if len(arrays) == 0 or arrays[0].size == 0:
+            return
+
+        chunk_min = [array.min().item() for array in arrays]
+        chunk_max = [array.max().item() for array in arrays]
+        if self._min is None or self._max is None:
+            self._min, self._max = chunk_min, chunk_max
+        else:
+            self._min = [min(old, new) for old, new in zip(self._min, chunk_min, strict=True)]
+            self._max = [max(old, new) for old, new in zip(self._max, chunk_max, strict=True)]
+
+    @property
+    def roi(self) -> tuple[tuple[float, ...], tuple[float, ...]] | None:
+        """The min and max values of each spatiotemporal property, or None if no nodes
+        have been added."""
+        if self._min is None or self._max is None:
+            return None
+        return tuple(self._min), tuple(self._max)
+
+
+def calculate_roi(
+    columns: Mapping[str, ArrayLike], axis_names: Sequence[str]
+) -> tuple[tuple[float, ...], tuple[float, ...]] | None:
+    """Calculate ROI (region of interest) from the columns of spatiotemporal properties.
 
     Args:
-        nodes_iter: Iterator over graph nodes
+        columns: The values of the properties of all nodes, as 1D arrays, for example
+            the arrays that are being written to the geff
         axis_names: Names of the spatial axes
-        node_accessor_func: Function to extract node data from each node
 
     Returns:
-        tuple[tuple[float, ...], tuple[float, ...]]: Min and max values for each axis
+        tuple[tuple[float, ...], tuple[float, ...]] | None: Min and max values for each
+            axis, or None if there are no nodes
     """
-    _min = None
-    _max = None
-
-    for node in nodes_iter:
-        node_data = node_accessor_func(node)
-        try:
-            pos = np.array([node_data[name] for name in axis_names])
-        except KeyError as e:
-            missing_names = {name for name in axis_names if name not in node_data}
-            raise ValueError(f"Spatiotemporal properties {missing_names} not found in node") from e
-
-        if _min is None or _max is None:
-            _min = pos
-            _max = pos
+    accumulator = RoiAccumulator(axis_names)
+    accumulator.update(columns)
+    return accumulator.roi
+
+
+def prop_columns(
+    props: Mapping[str, PropDictNpArray], expand: bool = False
+) -> Iterator[tuple[str, np.ndarray, np.ndarray | None]]:
+    """Iterate over the columns of a table of properties.
+
+    Args:
+        props (Mapping[str, PropDictNpArray]): A dictionary from property names to prop
+            dictionaries with "values" and optionally "missing" arrays.
+        expand (bool, optional): If True, properties with a second dimension are split
+            into one column per element, named "{name}_{index}". If False they stay one
+            column of rows. Defaults to False.
+
+    Yields:
+        tuple[str, np.ndarray, np.ndarray | None]: The name, values and missing mask of
+            each column. The missing mask is None if no value is missing.
+
+    Raises:
+        ValueError: If a property has more than two dimensions.
+    """
+    for name, prop_dict in props.items():
+        values = prop_dict["values"]
+        missing = prop_dict.get("missing")
+        if missing is not None and not missing.any():
+            missing = None
+        if values.ndim > 2:
+            raise ValueError(
+                f"Property {name} with shape {values.shape} cannot be converted to a column, "
+                "only properties with one or two dimensions are supported"
+            )
+        if values.ndim == 2 and expand:
+            for index in range(values.shape[1]):
+                yield f"{name}_{index}", values[:, index], missing
         else:
-            _min = np.min([_min, pos], axis=0)
-            _max = np.max([_max, pos], axis=0)
+            yield name, values, missing
+
+
+def prop_dicts(n_items: int, props: Mapping[str, PropDictNpArray]) -> list[dict[str, Any]]:
+    """Build the attribute dictionary of every node or edge from column-wise properties.
+
+    Each property column is converted to python objects with a single `tolist` call, and
+    only the rows that are not missing are visited, instead of indexing the arrays and
+    the graph once per id and property.
 
-    return tuple(_min.tolist()), tuple(_max.tolist())  # type: ignore
+    Args:
+        n_items (int): The number of nodes or edges.
+        props (Mapping[str, PropDictNpArray]): A dictionary from property names to
+            dictionaries with a "values" key with an array of values and an optional
+            "missing" key for missing values.
+
+    Returns:
+        list[dict[str, Any]]: The attributes of every node or edge, in the order of the
+            ids. Missing properties are left out.
+    """
+    attrs: list[dict[str, Any]] = [{} for _ in range(n_items)]
+    for name, prop_dict in props.items():
+        # get either individual items or lists instead of setting with np.array
+        values = prop_dict["values"].tolist()
+        if "missing" in prop_dict:
+            for idx in np.flatnonzero(~prop_dict["missing"]).tolist():
+                attrs[idx][name] = values[idx]
+        else:
+            for item_attrs, value in zip(attrs, values, strict=True):
+                item_attrs[name] = value
+    return attrs
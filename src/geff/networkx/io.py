@@ -6,9 +6,9 @@ import networkx as nx
 
 from geff.geff_reader import read_to_memory
 from geff.io_utils import (
-    calculate_roi_from_nodes,
     create_or_update_metadata,
     get_graph_existing_metadata,
+    prop_dicts,
 )
 from geff.metadata_schema import GeffMetadata, axes_from_lists
 from geff.write_dicts import write_dicts
@@ -18,30 +18,13 @@ if TYPE_CHECKING:
     from zarr.storage import StoreLike
 
     from geff.typing import PropDictNpArray
+    from geff.write_arrays import EncodingLike
 
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def get_roi(graph: nx.Graph, axis_names: list[str]) -> tuple[tuple[float, ...], tuple[float, ...]]:
-    """Get the roi of a networkx graph.
-
-    Args:
-        graph (nx.Graph): A non-empty networkx graph
-        axis_names (str): All nodes on graph have these property holding their position
-
-    Returns:
-        tuple[tuple[float, ...], tuple[float, ...]]: A tuple with the min values in each
-            spatial dim, and a tuple with the max values in each spatial dim
-    """
-    return calculate_roi_from_nodes(
-        graph.nodes(data=True),
-        axis_names,
-        lambda node_tuple: node_tuple[1],  # Extract data from (node_id, data) tuple
-    )
-
-
 def write_nx(
     graph: nx.Graph,
     store: StoreLike,
@@ -50,6 +33,9 @@ def write_nx(
     axis_units: list[str | None] | None = None,
     axis_types: list[str | None] | None = None,
     zarr_format: Literal[2, 3] = 2,
+    sort_by_time: bool = False,
+    adjacency: bool = False,
+    encoding: EncodingLike = None,
 ):
     """Write a networkx graph to the geff file format
 
@@ -71,33 +57,52 @@ def write_nx(
             if provided.
         zarr_format (Literal[2, 3], optional): The version of zarr to write.
             Defaults to 2.
+        sort_by_time (bool, optional): If True, the nodes are stored sorted by the
+            property of the axis with type "time", together with a frame offset table
+            for fast single frame reads. Defaults to False.
+        adjacency (bool, optional): If True, also write a compressed sparse row index of
+            the edges of every node, for fast neighborhood reads. Defaults to False.
+        encoding (ArrayEncoding | Mapping[str, ArrayEncoding], optional): The chunking,
+            compression and sharding of the arrays, for all groups or per "nodes" and
+            "edges" group, see `geff.write_arrays.ArrayEncoding`. Defaults to None, using
+            the default encoding.
+
+    Raises:
+        ValueError: If `sort_by_time` is True and there is no axis of type "time".
     """
 
     axis_names, axis_units, axis_types = get_graph_existing_metadata(
         metadata, axis_names, axis_units, axis_types
     )
 
-    node_props = list({k for _, data in graph.nodes(data=True) for k in data})
-
-    edge_data = [((u, v), data) for u, v, data in graph.edges(data=True)]
-    edge_props = list({k for _, _, data in graph.edges(data=True) for k in data})
-    write_dicts(
+    time_axis = None
+    if sort_by_time:
+        time_axes = [
+            name
+            for name, axis_type in zip(axis_names or [], axis_types or [], strict=False)
+            if axis_type == "time"
+        ]
+        if len(time_axes) == 0:
+            raise ValueError("Cannot sort nodes by time, no axis has type 'time'")
+        time_axis = time_axes[0]
+
+    edge_data = (((u, v), data) for u, v, data in graph.edges(data=True))
+    # the properties and the roi are collected in one pass over the nodes
+    roi = write_dicts(
         store,
         graph.nodes(data=True),
         edge_data,
-        node_props,
-        edge_props,
+        None,
+        None,
         axis_names,
         zarr_format=zarr_format,
+        time_axis=time_axis,
+        adjacency=adjacency,
+        encoding=encoding,
     )
 
     # write metadata
-    roi_min: tuple[float, ...] | None
-    roi_max: tuple[float, ...] | None
-    if axis_names is not None and graph.number_of_nodes() > 0:
-        roi_min, roi_max = get_roi(graph, axis_names)
-    else:
-        roi_min, roi_max = None, None
+    roi_min, roi_max = roi if roi is not None else (None, None)
 
     axes = axes_from_lists(
         axis_names,
@@ -115,41 +120,6 @@ def write_nx(
     metadata.write(store)
 
 
-def _set_property_values(
-    graph: nx.Graph,
-    ids: NDArray[Any],
-    name: str,
-    prop_dict: PropDictNpArray,
-    nodes: bool = True,
-) -> None:
-    """Add properties in-place to a networkx graph's
-    nodes or edges by creating attributes on the nodes/edges
-
-    Args:
-        graph (nx.DiGraph): The networkx graph, already populated with nodes or edges,
-            that needs properties added
-        ids (np.ndarray): Node or edge ids from Geff. If nodes, 1D. If edges, 2D.
-        name (str): The name of the property.
-        prop_dict (PropDict[np.ndarray]): A dictionary containing a "values" key with
-            an array of values and an optional "missing" key for missing values.
-        nodes (bool, optional): If True, extract and set node properties.  If False,
-            extract and set edge properties. Defaults to True.
-    """
-    sparse = "missing" in prop_dict
-    for idx in range(len(ids)):
-        _id = ids[idx]
-        val = prop_dict["values"][idx]
-        # If property is sparse and missing for this node, skip setting property
-        ignore = prop_dict["missing"][idx] if sparse else False
-        if not ignore:
-            # Get either individual item or list instead of setting with np.array
-            if nodes:
-                graph.nodes[_id.item()][name] = val.tolist()
-            else:
-                source, target = _id.tolist()
-                graph.edges[source, target][name] = val.tolist()
-
-
 def construct_nx(
     metadata: GeffMetadata,
     node_ids: NDArray[Any],
@@ -178,13 +148,14 @@ def construct_nx(
     """
     graph = nx.DiGraph() if metadata.directed else nx.Graph()
 
-    graph.add_nodes_from(node_ids.tolist())
-    for name, prop_dict in node_props.items():
-        _set_property_values(graph, node_ids, name, prop_dict, nodes=True)
+    node_attrs = prop_dicts(len(node_ids), node_props)
+    graph.add_nodes_from(zip(node_ids.tolist(), node_attrs, strict=True))
 
-    graph.add_edges_from(edge_ids.tolist())
-    for name, prop_dict in edge_props.items():
-        _set_property_values(graph, edge_ids, name, prop_dict, nodes=False)
+    edge_attrs = prop_dicts(len(edge_ids), edge_props)
+    graph.add_edges_from(
+        (source, target, attrs)
+        for (source, target), attrs in zip(edge_ids.tolist(), edge_attrs, strict=True)
+    )
 
     return graph
 
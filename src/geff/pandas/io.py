@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+try:
+    import pandas as pd  # type: ignore[import-untyped]
+except ImportError as e:
+    raise ImportError(
+        "This module requires pandas to be installed. "
+        "Please install it with `pip install 'geff[pandas]'`."
+    ) from e
+
+from geff.geff_reader import read_to_memory
+from geff.io_utils import prop_columns
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+    from zarr.storage import StoreLike
+
+    from geff.metadata_schema import GeffMetadata
+    from geff.typing import PropDictNpArray
+
+
+def _column(values: NDArray[Any], missing: NDArray[np.bool_] | None) -> Any:
+    """Convert the values of a property to a pandas column, with the nullable dtype of
+    the values if some are missing."""
+    if values.ndim == 2:
+        column = pd.Series(list(values), dtype=object)
+        if missing is not None:
+            column[missing] = None
+        return column
+    if missing is None:
+        return values
+    kind = values.dtype.kind
+    if kind in "iu":
+        return pd.arrays.IntegerArray(values, missing)
+    if kind == "f":
+        return pd.arrays.FloatingArray(values, missing)
+    if kind == "b":
+        return pd.arrays.BooleanArray(values, missing)
+    column = pd.array(values, dtype="string" if kind == "U" else object)
+    column[missing] = pd.NA if kind == "U" else None
+    return column
+
+
+def _frame(
+    id_columns: dict[str, NDArray[Any]], props: dict[str, PropDictNpArray], expand: bool
+) -> pd.DataFrame:
+    columns: dict[str, Any] = dict(id_columns)
+    for name, values, missing in prop_columns(props, expand):
+        if name in columns:
+            raise ValueError(f"Property column {name} has the same name as another column")
+        columns[name] = _column(values, missing)
+    return pd.DataFrame(columns, copy=False)
+
+
+def construct_pd(
+    metadata: GeffMetadata,
+    node_ids: NDArray[Any],
+    edge_ids: NDArray[Any],
+    node_props: dict[str, PropDictNpArray],
+    edge_props: dict[str, PropDictNpArray],
+    expand: bool = False,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Construct pandas DataFrames of the nodes and the edges from the GEFF data.
+
+    The node frame has an "id" column and a column per node property, the edge frame has
+    "source" and "target" columns and a column per edge property. Properties with
+    missing values use the nullable pandas dtypes, like "Int64" or "string", with the
+    missing values as NA. Other columns hold the numpy arrays without copying them.
+
+    Args:
+        metadata (GeffMetadata): The metadata of the graph.
+        node_ids (np.ndarray): An array containing the node ids. Must have same dtype as
+            edge_ids.
+        edge_ids (np.ndarray): An array containing the edge ids. Must have same dtype
+            as node_ids.
+        node_props (dict[str, tuple[np.ndarray, np.ndarray | None]] | None): A dictionary
+            from node property names to (values, missing) arrays, which should have same
+            length as node_ids.
+        edge_props (dict[str, tuple[np.ndarray, np.ndarray | None]] | None): A dictionary
+            from edge property names to (values, missing) arrays, which should have same
+            length as edge_ids.
+        expand (bool, optional): If True, properties with a second dimension are split
+            into one column per element, named "{name}_{index}". If False, they are
+            object columns with an array per row. Defaults to False.
+
+    Returns:
+        (tuple[pd.DataFrame, pd.DataFrame]): The node and edge DataFrames.
+
+    Raises:
+        ValueError: If a property has more than two dimensions, or a property column has
+            the name of an id column.
+    """
+    nodes = _frame({"id": node_ids}, node_props, expand)
+    edges = _frame({"source": edge_ids[:, 0], "target": edge_ids[:, 1]}, edge_props, expand)
+    return nodes, edges
+
+
+def read_pd(
+    store: StoreLike,
+    validate: bool = True,
+    node_props: list[str] | None = None,
+    edge_props: list[str] | None = None,
+    expand: bool = False,
+) -> tuple[tuple[pd.DataFrame, pd.DataFrame], GeffMetadata]:
+    """Read a geff zarr into pandas DataFrames of the nodes and the edges.
+
+    See `construct_pd` for the layout of the frames.
+
+    Args:
+        store (str | Path | zarr store): The path/str to the geff zarr, or the store
+            itself.
+        validate (bool, optional): Flag indicating whether to perform validation on the
+            geff file before loading into memory. If set to False and there are
+            format issues, will likely fail with a cryptic error. Defaults to True.
+        node_props (list of str, optional): The names of the node properties to load,
+            if None all properties will be loaded, defaults to None.
+        edge_props (list of str, optional): The names of the edge properties to load,
+            if None all properties will be loaded, defaults to None.
+        expand (bool, optional): If True, properties with a second dimension are split
+            into one column per element. Defaults to False.
+
+    Returns:
+        A tuple of the (nodes, edges) DataFrames and the GEFF metadata.
+    """
+    in_memory_geff = read_to_memory(store, validate, node_props, edge_props)
+    frames = construct_pd(**in_memory_geff, expand=expand)
+    return frames, in_memory_geff["metadata"]
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+try:
+    import polars as pl
+except ImportError as e:
+    raise ImportError(
+        "This module requires polars to be installed. "
+        "Please install it with `pip install 'geff[polars]'`."
+    ) from e
+
+from geff.geff_reader import read_to_memory
+from geff.io_utils import prop_columns
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+    from zarr.storage import StoreLike
+
+    from geff.metadata_schema import GeffMetadata
+    from geff.typing import PropDictNpArray
+
+
+def _series(name: str, values: NDArray[Any], missing: NDArray[np.bool_] | None) -> pl.Series:
+    """Convert the values of a property to a polars series, with nulls where the values
+    are missing."""
+    series = pl.Series(name, values)
+    if missing is None:
+        return series
+    return pl.select(pl.when(pl.Series(~missing)).then(series)).to_series().alias(name)
+
+
+def _frame(
+    id_columns: dict[str, NDArray[Any]], props: dict[str, PropDictNpArray], expand: bool
+) -> pl.DataFrame:
+    columns = [pl.Series(name, ids) for name, ids in id_columns.items()]
+    for name, values, missing in prop_columns(props, expand):
+        if any(column.name == name for column in columns):
+            raise ValueError(f"Property column {name} has the same name as another column")
+        columns.append(_series(name, values, missing))
+    return pl.DataFrame(columns)
+
+
+def construct_pl(
+    metadata: GeffMetadata,
+    node_ids: NDArray[Any],
+    edge_ids: NDArray[Any],
+    node_props: dict[str, PropDictNpArray],
+    edge_props: dict[str, PropDictNpArray],
+    expand: bool = False,
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """
+    Construct polars DataFrames of the nodes and the edges from the GEFF data.
+
+    The node frame has an "id" column and a column per node property, the edge frame has
+    "source" and "target" columns and a column per edge property. Missing values are
+    nulls.
+
+    Args:
+        metadata (GeffMetadata): The metadata of the graph.
+        node_ids (np.ndarray): An array containing the node ids. Must have same dtype as
+            edge_ids.
+        edge_ids (np.ndarray): An array containing the edge ids. Must have same dtype
+            as node_ids.
+        node_props (dict[str, tuple[np.ndarray, np.ndarray | None]] | None): A dictionary
+            from node property names to (values, missing) arrays, which should have same
+            length as node_ids.
+        edge_props (dict[str, tuple[np.ndarray, np.ndarray | None]] | None): A dictionary
+            from edge property names to (values, missing) arrays, which should have same
+            length as edge_ids.
+        expand (bool, optional): If True, properties with a second dimension are split
+            into one column per element, named "{name}_{index}". If False, they are
+            fixed size `pl.Array` columns. Defaults to False.
+
+    Returns:
+        (tuple[pl.DataFrame, pl.DataFrame]): The node and edge DataFrames.
+
+    Raises:
+        ValueError: If a property has more than two dimensions, or a property column has
+            the name of an id column.
+    """
+    nodes = _frame({"id": node_ids}, node_props, expand)
+    edges = _frame({"source": edge_ids[:, 0], "target": edge_ids[:, 1]}, edge_props, expand)
+    return nodes, edges
+
+
+def read_pl(
+    store: StoreLike,
+    validate: bool = True,
+    node_props: list[str] | None = None,
+    edge_props: list[str] | None = None,
+    expand: bool = False,
+) -> tuple[tuple[pl.DataFrame, pl.DataFrame], GeffMetadata]:
+    """Read a geff zarr into polars DataFrames of the nodes and the edges.
+
+    See `construct_pl` for the layout of the frames.
+
+    Args:
+        store (str | Path | zarr store): The path/str to the geff zarr, or the store
+            itself.
+        validate (bool, optional): Flag indicating whether to perform validation on the
+            geff file before loading into memory. If set to False and there are
+            format issues, will likely fail with a cryptic error. Defaults to True.
+        node_props (list of str, optional): The names of the node properties to load,
+            if None all properties will be loaded, defaults to None.
+        edge_props (list of str, optional): The names of the edge properties to load,
+            if None all properties will be loaded, defaults to None.
+        expand (bool, optional): If True, properties with a second dimension are split
+            into one column per element. Defaults to False.
+
+    Returns:
+        A tuple of the (nodes, edges) DataFrames and the GEFF metadata.
+    """
+    in_memory_geff = read_to_memory(store, validate, node_props, edge_props)
+    frames = construct_pl(**in_memory_geff, expand=expand)
+    return frames, in_memory_geff["metadata"]
@@ -15,38 +15,23 @@ except ImportError as e:
 
 
 from geff.geff_reader import read_to_memory
+from geff.id_index import IdIndex
 from geff.io_utils import (
-    calculate_roi_from_nodes,
     create_or_update_metadata,
     get_graph_existing_metadata,
+    prop_dicts,
 )
 from geff.metadata_schema import GeffMetadata, axes_from_lists
 from geff.write_dicts import write_dicts
 
 if TYPE_CHECKING:
-    from zarr.storage import StoreLike
-
-    from geff.typing import InMemoryGeff
+    from collections.abc import Iterable
 
+    from numpy.typing import NDArray
+    from zarr.storage import StoreLike
 
-def get_roi_rx(
-    graph: rx.PyGraph, axis_names: list[str]
-) -> tuple[tuple[float, ...], tuple[float, ...]]:
-    """Get the roi of a rustworkx graph.
-
-    Args:
-        graph: A non-empty rustworkx graph
-        axis_names: All nodes on graph have these property holding their position
-
-    Returns:
-        tuple[tuple[float, ...], tuple[float, ...]]: A tuple with the min values in each
-            spatial dim, and a tuple with the max values in each spatial dim
-    """
-    return calculate_roi_from_nodes(
-        graph.nodes(),
-        axis_names,
-        lambda node_data: node_data,  # node_data is already the dict for rustworkx
-    )
+    from geff.typing import PropDictNpArray
+    from geff.write_arrays import EncodingLike
 
 
 def write_rx(
@@ -58,6 +43,7 @@ def write_rx(
     axis_units: list[str | None] | None = None,
     axis_types: list[str | None] | None = None,
     zarr_format: Literal[2, 3] = 2,
+    encoding: EncodingLike = None,
 ) -> None:
     """Write a rustworkx graph to the geff file format
 
@@ -84,6 +70,9 @@ def write_rx(
         axis_units: The units of the axes.
         axis_types: The types of the axes.
         zarr_format: The zarr format to use.
+        encoding: The chunking, compression and sharding of the arrays, for all groups
+            or per "nodes" and "edges" group, see `geff.write_arrays.ArrayEncoding`.
+            Defaults to None, using the default encoding.
     """
 
     axis_names, axis_units, axis_types = get_graph_existing_metadata(
@@ -92,54 +81,37 @@ def write_rx(
 
     if graph.num_nodes() == 0:
         # Handle empty graph case - still need to write empty structure
-        node_data: list[tuple[int, dict[str, Any]]] = []
-        edge_data: list[tuple[tuple[int, int], dict[str, Any]]] = []
-        node_props: list[str] = []
-        edge_props: list[str] = []
-
         warnings.warn(f"Graph is empty - only writing metadata to {store}", stacklevel=2)
 
+    # Prepare node and edge data, read in a single pass by write_dicts
+    node_data: Iterable[tuple[Any, dict[str, Any]]]
+    if node_id_dict is None:
+        node_data = zip(graph.node_indices(), graph.nodes(), strict=False)
+        # edges added without data have None as payload
+        edge_data = (((u, v), data or {}) for u, v, data in graph.weighted_edge_list())
     else:
-        # Prepare node data
-        if node_id_dict is None:
-            node_data = [
-                (i, data) for i, data in zip(graph.node_indices(), graph.nodes(), strict=False)
-            ]
-        else:
-            node_data = [
-                (node_id_dict[i], data)
-                for i, data in zip(graph.node_indices(), graph.nodes(), strict=False)
-            ]
-
-        # Prepare edge data
-        if node_id_dict is None:
-            edge_data = [((u, v), data) for u, v, data in graph.weighted_edge_list()]
-        else:
-            edge_data = [
-                ((node_id_dict[u], node_id_dict[v]), data)
-                for u, v, data in graph.weighted_edge_list()
-            ]
-
-        node_props = list({k for _, data in node_data for k in data})
-        edge_props = list({k for _, data in edge_data for k in data})
-
-    write_dicts(
+        node_data = (
+            (node_id_dict[i], data)
+            for i, data in zip(graph.node_indices(), graph.nodes(), strict=False)
+        )
+        edge_data = (
+            ((node_id_dict[u], node_id_dict[v]), data or {})
+            for u, v, data in graph.weighted_edge_list()
+        )
+
+    roi = write_dicts(
         geff_store=store,
         node_data=node_data,
         edge_data=edge_data,
-        node_prop_names=node_props,
-        edge_prop_names=edge_props,
+        node_prop_names=None,
+        edge_prop_names=None,
         axis_names=axis_names,
         zarr_format=zarr_format,
+        encoding=encoding,
     )
 
     # write metadata
-    roi_min: tuple[float, ...] | None
-    roi_max: tuple[float, ...] | None
-    if axis_names is not None and graph.num_nodes() > 0:
-        roi_min, roi_max = get_roi_rx(graph, axis_names)
-    else:
-        roi_min, roi_max = None, None
+    roi_min, roi_max = roi if roi is not None else (None, None)
 
     axes = axes_from_lists(
         axis_names,
@@ -157,74 +129,60 @@ def write_rx(
     metadata.write(store)
 
 
-def construct_rx(graph_dict: InMemoryGeff) -> rx.PyDiGraph | rx.PyGraph:
+def construct_rx(
+    metadata: GeffMetadata,
+    node_ids: NDArray[Any],
+    edge_ids: NDArray[Any],
+    node_props: dict[str, PropDictNpArray],
+    edge_props: dict[str, PropDictNpArray],
+) -> rx.PyDiGraph | rx.PyGraph:
     """
-    Convert a InMemoryGeff to a rustworkx graph.
+    Construct a rustworkx graph from the GEFF data.
     The graph will have a `to_rx_id_map` attribute that maps geff node ids
     to rustworkx node indices.
 
     Args:
-        graph_dict: The InMemoryGeff to convert to a rustworkx graph.
+        metadata (GeffMetadata): The metadata of the graph.
+        node_ids (np.ndarray): An array containing the node ids. Must have same dtype as
+            edge_ids.
+        edge_ids (np.ndarray): An array containing the edge ids. Must have same dtype
+            as node_ids.
+        node_props (dict[str, tuple[np.ndarray, np.ndarray | None]] | None): A dictionary
+            from node property names to (values, missing) arrays, which should have same
+            length as node_ids.
+        edge_props (dict[str, tuple[np.ndarray, np.ndarray | None]] | None): A dictionary
+            from edge property names to (values, missing) arrays, which should have same
+            length as edge_ids.
 
     Returns:
-        rx.PyGraph: A rustworkx graph.
+        rx.PyGraph | rx.PyDiGraph: A rustworkx graph.
     """
-    metadata = graph_dict["metadata"]
-
     graph = rx.PyDiGraph() if metadata.directed else rx.PyGraph()
     graph.attrs = metadata.model_dump()
 
-    # Add nodes with populated properties
-    node_ids = graph_dict["node_ids"].tolist()
-    node_props: list[dict[str, Any]] = [{} for _ in node_ids]
-
-    # Populate node properties first
-    indices = np.arange(len(node_ids))
-
-    for name, prop_dict in graph_dict["node_props"].items():
-        values = prop_dict["values"]
-        if "missing" in prop_dict:
-            current_indices = indices[~prop_dict["missing"]]
-            values = values[current_indices]
-        else:
-            current_indices = indices
-
-        values = values.tolist()
-        current_indices = current_indices.tolist()
-
-        for idx, val in zip(current_indices, values, strict=True):
-            node_props[idx][name] = val
-
-    # Add nodes with their properties
-    rx_node_ids = graph.add_nodes_from(node_props)
+    # Add nodes with their properties, built column by column
+    rx_node_ids = np.asarray(
+        graph.add_nodes_from(prop_dicts(len(node_ids), node_props)), dtype=np.int64
+    )
 
     # Create mapping from geff node id to rustworkx node index
-    to_rx_id_map = dict(zip(node_ids, rx_node_ids, strict=False))
+    to_rx_id_map = dict(zip(node_ids.tolist(), rx_node_ids.tolist(), strict=True))
 
     # Add edges if they exist
-    if len(graph_dict["edge_ids"]) > 0:
-        # converting to local rx ids
-        edge_ids = np.vectorize(to_rx_id_map.__getitem__)(graph_dict["edge_ids"])
-        # Prepare edge data with properties
-        edges_data: list[dict[str, Any]] = [{} for _ in edge_ids]
-        indices = np.arange(len(edge_ids))
-
-        for name, prop_dict in graph_dict["edge_props"].items():
-            values = prop_dict["values"]
-            if "missing" in prop_dict:
-                current_indices = indices[~prop_dict["missing"]]
-                values = values[current_indices]
-            else:
-                current_indices = indices
-
-            values = values.tolist()
-            current_indices = current_indices.tolist()
-
-            for idx, val in zip(current_indices, values, strict=True):
-                edges_data[idx][name] = val
-
-        # Add edges with their properties
-        graph.add_edges_from([(e[0], e[1], d) for e, d in zip(edge_ids, edges_data, strict=True)])
+    if len(edge_ids) > 0:
+        # converting to local rx ids, looking up all endpoints at once
+        positions = IdIndex(node_ids).positions(edge_ids)
+        if (positions < 0).any():
+            raise ValueError("Some edges have node ids that are not in the node ids")
+        rx_edge_ids = rx_node_ids[positions]
+        # columns converted with one `tolist` each are faster than rows of lists
+        sources, targets = rx_edge_ids[:, 0].tolist(), rx_edge_ids[:, 1].tolist()
+        if edge_props:
+            edges_data = prop_dicts(len(rx_edge_ids), edge_props)
+            graph.add_edges_from(list(zip(sources, targets, edges_data, strict=True)))
+        else:
+            # edges without properties have None as payload
+            graph.add_edges_from_no_data(list(zip(sources, targets, strict=True)))
 
     graph.attrs["to_rx_id_map"] = to_rx_id_map
 
@@ -257,6 +215,6 @@ def read_rx(
         A tuple containing the rustworkx graph and the metadata.
     """
     graph_dict = read_to_memory(store, validate, node_props, edge_props)
-    graph = construct_rx(graph_dict)
+    graph = construct_rx(**graph_dict)
 
     return graph, graph_dict["metadata"]
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+try:
+    from scipy import sparse  # type: ignore[import-untyped]
+except ImportError as e:
+    raise ImportError(
+        "This module requires scipy to be installed. "
+        "Please install it with `pip install 'geff[scipy]'`."
+    ) from e
+
+from geff.geff_reader import read_to_memory
+from geff.id_index import IdIndex
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from zarr.storage import StoreLike
+
+    from geff.metadata_schema import GeffMetadata
+    from geff.typing import PropDictNpArray
+
+
+def construct_scipy(
+    metadata: GeffMetadata,
+    node_ids: NDArray[Any],
+    edge_ids: NDArray[Any],
+    node_props: dict[str, PropDictNpArray],
+    edge_props: dict[str, PropDictNpArray],
+    weight: str | None = None,
+) -> tuple[sparse.csr_array, NDArray[Any], IdIndex]:
+    """
+    Construct a `scipy` sparse adjacency matrix from the GEFF data.
+
+    Row and column `i` of the matrix belong to the node `node_ids[i]`. The entry of an
+    edge is at (source row, target column), and undirected edges are entered in both
+    directions, so that the matrix is symmetric. Parallel edges are summed. The node ids
+    of the edges are mapped to rows with an `IdIndex`, without python loops.
+
+    Node properties, and edge properties other than the weight, are not used.
+
+    Args:
+        metadata (GeffMetadata): The metadata of the graph.
+        node_ids (np.ndarray): An array containing the node ids. Must have same dtype as
+            edge_ids.
+        edge_ids (np.ndarray): An array containing the edge ids. Must have same dtype
+            as node_ids.
+        node_props (dict[str, tuple[np.ndarray, np.ndarray | None]] | None): A dictionary
+            from node property names to (values, missing) arrays, which should have same
+            length as node_ids.
+        edge_props (dict[str, tuple[np.ndarray, np.ndarray | None]] | None): A dictionary
+            from edge property names to (values, missing) arrays, which should have same
+            length as edge_ids.
+        weight (str, optional): The name of a numeric edge property to use as the
+            entries of the matrix. Defaults to None, using 1.0 for every edge.
+
+    Returns:
+        (tuple[sparse.csr_array, np.ndarray, IdIndex]): The adjacency matrix, the node id
+            of each row and column, and the index that maps node ids to rows with
+            `IdIndex.positions`.
+
+    Raises:
+        ValueError: If an edge has a node that is not in `node_ids`, or if the weight
+            property does not exist, is not numeric or one dimensional, or is missing on
+            some edges.
+    """
+    index = IdIndex(node_ids)
+    rows = index.positions(edge_ids)
+    if np.any(rows < 0):
+        raise ValueError("Some edges have node ids that are not in the node ids")
+
+    if weight is None:
+        data = np.ones(len(edge_ids), dtype=np.float64)
+    else:
+        if weight not in edge_props:
+            raise ValueError(f"Weight property {weight} not found in {list(edge_props)}")
+        prop_dict = edge_props[weight]
+        data = prop_dict["values"]
+        if data.ndim != 1 or data.dtype.kind not in "biuf":
+            raise ValueError(
+                f"Weight property {weight} must be one dimensional and numeric, got "
+                f"{data.dtype} values with shape {data.shape}"
+            )
+        if "missing" in prop_dict and np.any(prop_dict["missing"]):
+            raise ValueError(f"Weight property {weight} is missing on some edges")
+
+    sources, targets = rows[:, 0], rows[:, 1]
+    if not metadata.directed:
+        # enter every edge in both directions, and self loops once
+        other = sources != targets
+        sources, targets = (
+            np.concatenate([sources, targets[other]]),
+            np.concatenate([targets, sources[other]]),
+        )
+        data = np.concatenate([data, data[other]])
+
+    n_nodes = len(node_ids)
+    adjacency = sparse.coo_array((data, (sources, targets)), shape=(n_nodes, n_nodes)).tocsr()
+    return adjacency, node_ids, index
+
+
+def read_scipy(
+    store: StoreLike,
+    validate: bool = True,
+    weight: str | None = None,
+) -> tuple[tuple[sparse.csr_array, NDArray[Any], IdIndex], GeffMetadata]:
+    """Read a geff zarr into a `scipy` sparse adjacency matrix.
+
+    Only the edge property used as the weight is read. See `construct_scipy` for the
+    layout of the matrix.
+
+    Args:
+        store (str | Path | zarr store): The path/str to the geff zarr, or the store
+            itself.
+        validate (bool, optional): Flag indicating whether to perform validation on the
+            geff file before loading into memory. If set to False and there are
+            format issues, will likely fail with a cryptic error. Defaults to True.
+        weight (str, optional): The name of a numeric edge property to use as the
+            entries of the matrix. Defaults to None, using 1.0 for every edge.
+
+    Returns:
+        A tuple of the (adjacency matrix, node ids, id index) and the GEFF metadata.
+    """
+    edge_props = [weight] if weight is not None else []
+    in_memory_geff = read_to_memory(store, validate, node_props=[], edge_props=edge_props)
+    matrix = construct_scipy(**in_memory_geff, weight=weight)
+    return matrix, in_memory_geff["metadata"]
@@ -19,6 +19,7 @@ if TYPE_CHECKING:
     from zarr.storage import StoreLike
 
     from geff.typing import PropDictNpArray
+    from geff.write_arrays import EncodingLike
 
 import geff
 from geff.geff_reader import read_to_memory
@@ -34,6 +35,7 @@ def write_sg(
     axis_units: list[str] | None = None,
     axis_types: list[str] | None = None,
     zarr_format: Literal[2, 3] = 2,
+    encoding: EncodingLike = None,
 ):
     """Write a SpatialGraph to the geff file format.
 
@@ -68,6 +70,12 @@ def write_sg(
         zarr_format (Literal[2, 3], optional):
 
             The version of zarr to write. Defaults to 2.
+
+        encoding (ArrayEncoding | Mapping[str, ArrayEncoding], optional):
+
+            The chunking, compression and sharding of the arrays, for all groups or
+            per "nodes" and "edges" group, see `geff.write_arrays.ArrayEncoding`.
+            Defaults to None, using the default encoding.
     """
 
     store = remove_tilde(store)
@@ -107,6 +115,7 @@ def write_sg(
         },
         metadata=metadata,
         zarr_format=zarr_format,
+        encoding=encoding,
     )
 
 
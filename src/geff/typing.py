@@ -1,5 +1,6 @@
 from typing import Any, TypedDict
 
+import numpy as np
 import zarr
 from numpy.typing import NDArray
 from typing_extensions import NotRequired
@@ -28,7 +29,7 @@ class PropDictNpArray(TypedDict):
     """
 
     values: NDArray[Any]
-    missing: NotRequired[NDArray[bool]]
+    missing: NotRequired[NDArray[np.bool_]]
 
 
 class PropDictZArray(TypedDict):
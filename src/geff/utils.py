@@ -1,21 +1,46 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
 import networkx as nx
 import networkx.algorithms.isomorphism as iso
 import numpy as np
 import zarr
+from pydantic import BaseModel, Field
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from numpy.typing import NDArray
     from zarr.storage import StoreLike
 
 from urllib.parse import urlparse
 
+from .id_index import IdIndex
 from .metadata_schema import GeffMetadata
 
+ValidationCheck = Literal[
+    "structure",
+    "unique_node_ids",
+    "edges_reference_nodes",
+    "self_edges",
+    "repeated_edges",
+    "time_index",
+    "chunk_stats",
+    "adjacency",
+]
+
+# number of offending ids or edges listed in a validation issue
+REPORT_MAX_EXAMPLES = 100
+# the dtype kinds of the properties with chunk statistics: booleans, integers and floats
+STATS_KINDS = "biuf"
+# a deep validation reads and checks the ids in batches of whole chunks of at least this
+# many rows
+DEEP_BATCH_ROWS = 1 << 18
+
 
 def is_remote_url(path: str) -> bool:
     """Returns True if the path is a remote URL (http, https, ftp, sftp), otherwise False.
@@ -52,6 +77,21 @@ def remove_tilde(store: StoreLike) -> StoreLike:
     return store
 
 
+def get_time_axis(metadata: GeffMetadata) -> str | None:
+    """Get the name of the first axis of type "time" in the metadata.
+
+    Args:
+        metadata (GeffMetadata): The metadata of the graph.
+
+    Returns:
+        str | None: The name of the time axis, or None if there is no time axis.
+    """
+    for axis in metadata.axes or []:
+        if axis.type == "time":
+            return axis.name
+    return None
+
+
 def validate_props_metadata(props_metadata_dict, component_group, component_type):
     """Validate that properties described in metadata are compatible with the data in zarr arrays.
 
@@ -81,98 +121,594 @@ def validate_props_metadata(props_metadata_dict, component_group, component_type
         )
 
 
-def validate(store: StoreLike):
-    """Check that the structure of the zarr conforms to geff specification
+def compute_chunk_stats(
+    values: NDArray[Any], chunk_len: int, missing: NDArray[Any] | None = None
+) -> tuple[NDArray[Any], NDArray[Any]] | None:
+    """Compute the per-chunk minimum and maximum of a property values array.
+
+    The statistics are aligned to chunks of `chunk_len` rows along the first axis and
+    reduced over that axis only, so a values array of shape (N, ...) gives statistics of
+    shape (n_chunks, ...). Missing values and NaNs are ignored. A chunk with no present
+    values gets an empty range (minimum above maximum), so it can never match a query.
 
     Args:
-        store (str | Path | zarr store): Check the geff zarr, either str/Path/store
+        values (np.ndarray): The property values array.
+        chunk_len (int): The chunk length of the values array along its first axis.
+        missing (np.ndarray, optional): The boolean missing array of the property.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray] | None: The (chunk_min, chunk_max) arrays, or None
+            if the values are not booleans, integers or floats, like complex or string
+            values, which have no statistics.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind not in STATS_KINDS:
+        return None
+
+    starts = np.arange(0, len(values), chunk_len)
+    if len(starts) == 0:
+        empty = np.empty((0, *values.shape[1:]), dtype=values.dtype)
+        return empty, empty.copy()
+
+    if values.dtype.kind == "f":
+        bounds = (-np.inf, np.inf)
+    elif values.dtype.kind == "b":
+        bounds = (False, True)
+    else:
+        bounds = (np.iinfo(values.dtype).min, np.iinfo(values.dtype).max)
+    lowest, highest = np.asarray(bounds, dtype=values.dtype)
+
+    low_values = high_values = values
+    if missing is not None:
+        missing = np.asarray(missing, dtype=bool).reshape(-1, *([1] * (values.ndim - 1)))
+        low_values = np.where(missing, highest, values)
+        high_values = np.where(missing, lowest, values)
+    # fmin/fmax ignore NaNs unless a whole chunk is NaN
+    chunk_min = np.fmin.reduceat(low_values, starts, axis=0)
+    chunk_max = np.fmax.reduceat(high_values, starts, axis=0)
+    return chunk_min, chunk_max
+
+
+def _get_group(group: zarr.Group, name: str) -> zarr.Group:
+    """Get a subgroup of a group, narrowed from the array or group that indexing returns."""
+    return cast("zarr.Group", group[name])
+
+
+def _get_array(group: zarr.Group, name: str) -> zarr.Array:
+    """Get an array of a group, narrowed from the array or group that indexing returns."""
+    return cast("zarr.Array", group[name])
+
+
+def _read_array(group: zarr.Group, name: str) -> NDArray[Any]:
+    """Read a whole array of a group."""
+    return np.asarray(_get_array(group, name)[:])
+
+
+def validate_chunk_stats(
+    prop_group: zarr.Group, prop: str, component_type: str, deep: bool = False
+) -> None:
+    """Validate that the optional chunk statistics of a property match its values.
+
+    Only the dtypes and shapes of the statistics are checked by default, which does not
+    read the values. With `deep`, the statistics are recomputed from the values and
+    compared.
+
+    Args:
+        prop_group (zarr.Group): The property group, containing a `values` array and
+            optionally `missing`, `chunk_min` and `chunk_max` arrays.
+        prop (str): The property name, for error messages.
+        component_type (str): Component type for error messages ("Node" or "Edge")
+        deep (bool, optional): Whether to compare the statistics to the ones recomputed
+            from the values. Defaults to False.
 
     Raises:
-        AssertionError: If geff specs are violated
-        ValueError: If store is not a valid zarr store or path doesn't exist
+        AssertionError: If the chunk statistics do not match the values
     """
+    array_keys = set(prop_group.array_keys())
+    if "chunk_min" not in array_keys and "chunk_max" not in array_keys:
+        return
+    assert "chunk_min" in array_keys and "chunk_max" in array_keys, (
+        f"{component_type} property {prop} must have both chunk_min and chunk_max arrays"
+    )
+
+    values = _get_array(prop_group, "values")
+    assert values.dtype.kind in STATS_KINDS, (
+        f"{component_type} property {prop} has chunk statistics but unsupported dtype "
+        f"{values.dtype}"
+    )
+    n_chunks = -(-values.shape[0] // values.chunks[0])
+    expected_shape = (n_chunks, *values.shape[1:])
+    for name in ("chunk_min", "chunk_max"):
+        stats = _get_array(prop_group, name)
+        assert stats.shape == expected_shape, (
+            f"{component_type} property {prop} {name} has shape {stats.shape}, expected "
+            f"{expected_shape} for {n_chunks} chunks"
+        )
+        assert stats.dtype.kind in STATS_KINDS, (
+            f"{component_type} property {prop} {name} must have a boolean, integer or float "
+            f"dtype, got {stats.dtype}"
+        )
+    if not deep:
+        return
+
+    missing = _read_array(prop_group, "missing") if "missing" in array_keys else None
+    expected = compute_chunk_stats(np.asarray(values[:]), values.chunks[0], missing)
+    assert expected is not None
+    for name, expected_stats in zip(("chunk_min", "chunk_max"), expected, strict=True):
+        assert np.array_equal(_read_array(prop_group, name), expected_stats, equal_nan=True), (
+            f"{component_type} property {prop} {name} does not match the values chunks"
+        )
 
-    # Check if path exists for string/Path inputs
-    if isinstance(store, str | Path):
-        store_path = Path(store)
-        if not is_remote_url(str(store_path)) and not store_path.exists():
-            raise ValueError(f"Path does not exist: {store}")
 
-    # Open the zarr group from the store
-    try:
-        graph = zarr.open_group(store, mode="r")
-    except Exception as e:
-        raise ValueError("store must be a zarr StoreLike") from e
+def validate_time_index(nodes: zarr.Group, metadata: GeffMetadata, deep: bool = False) -> None:
+    """Validate that the optional time index matches the time property of the nodes.
 
-    # graph attrs validation
-    # Raises pydantic.ValidationError or ValueError
-    metadata = GeffMetadata.read(store)
+    Only the frames and offsets are read by default, which are small, to check that the
+    frames are strictly increasing and that the offsets split the nodes. With `deep`, the
+    index is also compared to the time property of every node.
+
+    Args:
+        nodes (zarr.Group): The nodes group, containing the `time_index` group.
+        metadata (GeffMetadata): The metadata of the graph.
+        deep (bool, optional): Whether to compare the index to the time property.
+            Defaults to False.
+
+    Raises:
+        AssertionError: If the time index does not match the nodes
+    """
+    time_index = _get_group(nodes, "time_index")
+    assert "frames" in time_index.array_keys() and "offsets" in time_index.array_keys(), (
+        "nodes time_index group must contain frames and offsets arrays"
+    )
+    time_axis = get_time_axis(metadata)
+    assert time_axis is not None, "nodes have a time_index but metadata has no time axis"
+    props = _get_group(nodes, "props")
+    assert time_axis in props, f"Time property {time_axis} not found in node props"
+
+    frames = _read_array(time_index, "frames")
+    offsets = _read_array(time_index, "offsets")
+    time_array = _get_array(_get_group(props, time_axis), "values")
+    assert len(offsets) == len(frames) + 1, (
+        f"time_index offsets has length {len(offsets)}, expected {len(frames) + 1}"
+    )
+    assert offsets[0] == 0 and offsets[-1] == time_array.shape[0], (
+        "time_index offsets must start at 0 and end at the number of nodes"
+    )
+    assert np.all(np.diff(offsets) >= 0), "time_index offsets must be monotonically increasing"
+    assert np.all(np.diff(frames) > 0), "time_index frames must be strictly increasing"
+    if not deep:
+        return
+
+    assert np.array_equal(np.repeat(frames, np.diff(offsets)), time_array[:]), (
+        "time_index does not match the time property, nodes must be sorted by time"
+    )
+
+
+def compute_adjacency(node_ids: NDArray[Any], edge_ids: NDArray[Any]) -> dict[str, NDArray[Any]]:
+    """Compute the compressed sparse row adjacency of the edges in both directions.
+
+    The out-edges of the node at index `i` of `node_ids` are the rows
+    `out_indices[out_indptr[i]:out_indptr[i + 1]]` of `edge_ids`, in ascending order.
+    The in-edges are stored the same way in `in_indptr` and `in_indices`.
+
+    Args:
+        node_ids (np.ndarray): The node ids, with shape (N,).
+        edge_ids (np.ndarray): The edge ids, with shape (E, 2).
+
+    Returns:
+        dict[str, np.ndarray]: The int64 arrays `out_indptr` and `in_indptr` with shape
+            (N + 1,), and `out_indices` and `in_indices` with shape (E,).
+
+    Raises:
+        ValueError: If the edges contain node ids that are not in `node_ids`.
+    """
+    node_ids = np.asarray(node_ids)
+    positions = IdIndex(node_ids).positions(np.asarray(edge_ids).reshape(-1, 2))
+    if np.any(positions < 0):
+        raise ValueError("Edges contain node ids that are not in the node ids")
+
+    adjacency = {}
+    for direction, column in (("out", 0), ("in", 1)):
+        counts = np.bincount(positions[:, column], minlength=len(node_ids))
+        adjacency[f"{direction}_indptr"] = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        adjacency[f"{direction}_indices"] = np.argsort(positions[:, column], kind="stable").astype(
+            np.int64
+        )
+    return adjacency
+
+
+def validate_adjacency(nodes: zarr.Group, edges: zarr.Group, deep: bool = False) -> None:
+    """Validate that the optional adjacency index matches the node and edge ids.
+
+    Only the dtypes, the shapes and the first and last offsets are checked by default,
+    which does not read the ids. With `deep`, the index is recomputed from the ids and
+    compared.
+
+    Args:
+        nodes (zarr.Group): The nodes group.
+        edges (zarr.Group): The edges group, containing the `adjacency` group.
+        deep (bool, optional): Whether to compare the index to the one recomputed from
+            the ids. Defaults to False.
+
+    Raises:
+        AssertionError: If the adjacency index does not match the edges
+    """
+    adjacency = _get_group(edges, "adjacency")
+    names = ("out_indptr", "out_indices", "in_indptr", "in_indices")
+    assert set(names) <= set(adjacency.array_keys()), (
+        f"edges adjacency group must contain {', '.join(names)} arrays"
+    )
+    n_nodes = _get_array(nodes, "ids").shape[0]
+    n_edges = _get_array(edges, "ids").shape[0]
+    for name in names:
+        array = _get_array(adjacency, name)
+        assert array.dtype.kind in "iu", (
+            f"edges adjacency {name} must have an integer dtype, got {array.dtype}"
+        )
+        expected_len = n_nodes + 1 if name.endswith("indptr") else n_edges
+        assert array.shape == (expected_len,), (
+            f"edges adjacency {name} has shape {array.shape}, expected ({expected_len},)"
+        )
+        if name.endswith("indptr"):
+            assert array[0] == 0 and array[-1] == n_edges, (
+                f"edges adjacency {name} must start at 0 and end at the number of edges"
+            )
+    if not deep:
+        return
+
+    node_ids = _read_array(nodes, "ids")
+    edge_ids = _read_array(edges, "ids")
+    assert IdIndex(node_ids).contains(edge_ids).all(), (
+        "edges have an adjacency index but contain node ids that are not in the node ids"
+    )
+    expected = compute_adjacency(node_ids, edge_ids)
+    for name in names:
+        assert np.array_equal(_read_array(adjacency, name), expected[name]), (
+            f"edges adjacency {name} does not match the edge ids"
+        )
 
+
+def _validate_structure(graph: zarr.Group, metadata: GeffMetadata) -> None:
+    """Check that the groups and arrays of the zarr conform to the geff specification.
+
+    Raises:
+        AssertionError: If geff specs are violated
+    """
     assert "nodes" in graph, "graph group must contain a nodes group"
-    nodes = graph["nodes"]
+    nodes = _get_group(graph, "nodes")
 
     # ids and props are required and should be same length
     assert "ids" in nodes.array_keys(), "nodes group must contain an ids array"
     assert "props" in nodes.group_keys(), "nodes group must contain a props group"
 
     # Property array length should match id length
-    id_len = nodes["ids"].shape[0]
-    for prop in nodes["props"].keys():
-        prop_group = nodes["props"][prop]
+    id_len = _get_array(nodes, "ids").shape[0]
+    node_props = _get_group(nodes, "props")
+    for prop in node_props.keys():
+        prop_group = _get_group(node_props, prop)
         assert "values" in prop_group.array_keys(), (
             f"node property group {prop} must have values group"
         )
-        prop_len = prop_group["values"].shape[0]
+        prop_len = _get_array(prop_group, "values").shape[0]
         assert prop_len == id_len, (
             f"Node property {prop} values has length {prop_len}, which does not match "
             f"id length {id_len}"
         )
         if "missing" in prop_group.array_keys():
-            missing_len = prop_group["missing"].shape[0]
+            missing_len = _get_array(prop_group, "missing").shape[0]
             assert missing_len == id_len, (
                 f"Node property {prop} missing mask has length {missing_len}, which "
                 f"does not match id length {id_len}"
             )
+        validate_chunk_stats(prop_group, prop, "Node")
     # Node properties metadata validation
     if metadata.node_props_metadata is not None:
         validate_props_metadata(metadata.node_props_metadata, nodes, "Node")
 
+    if "time_index" in nodes.group_keys():
+        validate_time_index(nodes, metadata)
+
     # TODO: Do we want to prevent missing values on spatialtemporal properties
 
     if "edges" in graph.group_keys():
-        edges = graph["edges"]
+        edges = _get_group(graph, "edges")
 
         # Edges only require ids which contain nodes for each edge
         assert "ids" in edges, "edge group must contain ids array"
-        id_shape = edges["ids"].shape
+        id_shape = _get_array(edges, "ids").shape
         assert id_shape[-1] == 2, (
             f"edges ids must have a last dimension of size 2, received shape {id_shape}"
         )
 
         # Edge property array length should match edge id length
-        edge_id_len = edges["ids"].shape[0]
+        edge_id_len = id_shape[0]
         if "props" in edges:
-            for prop in edges["props"].keys():
-                prop_group = edges["props"][prop]
+            edge_props = _get_group(edges, "props")
+            for prop in edge_props.keys():
+                prop_group = _get_group(edge_props, prop)
                 assert "values" in prop_group.array_keys(), (
                     f"Edge property group {prop} must have values group"
                 )
-                prop_len = prop_group["values"].shape[0]
+                prop_len = _get_array(prop_group, "values").shape[0]
                 assert prop_len == edge_id_len, (
                     f"Edge property {prop} values has length {prop_len}, which does not "
                     f"match id length {edge_id_len}"
                 )
                 if "missing" in prop_group.array_keys():
-                    missing_len = prop_group["missing"].shape[0]
+                    missing_len = _get_array(prop_group, "missing").shape[0]
                     assert missing_len == edge_id_len, (
                         f"Edge property {prop} missing mask has length {missing_len}, "
                         f"which does not match id length {edge_id_len}"
                     )
+                validate_chunk_stats(prop_group, prop, "Edge")
 
         # Edge properties metadata validation
         if metadata.edge_props_metadata is not None:
             validate_props_metadata(metadata.edge_props_metadata, edges, "Edge")
 
+        if "adjacency" in edges.group_keys():
+            validate_adjacency(nodes, edges)
+
+
+class ValidationIssue(BaseModel):
+    """A violation of the geff specification found by a deep validation."""
+
+    check: ValidationCheck = Field(..., description="The check that found the violation.")
+    message: str = Field(..., description="A description of the violation.")
+    count: int = Field(..., description="The number of offending ids or edges.")
+    examples: list[Any] = Field(
+        default_factory=list,
+        description=(
+            f"Up to {REPORT_MAX_EXAMPLES} of the offending node ids or (source, target) edges."
+        ),
+    )
+
+
+class ValidationReport(BaseModel):
+    """The result of `validate(store, level="deep")`.
+
+    Instead of raising on the first violation, a deep validation collects every issue
+    it finds. If the structure of the zarr is invalid, the report only holds the
+    structure issue, because the referential checks need well formed ids.
+    """
+
+    n_nodes: int = Field(default=0, description="The number of node ids.")
+    n_edges: int = Field(default=0, description="The number of edges.")
+    issues: list[ValidationIssue] = Field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        """True if no issue was found."""
+        return not self.issues
+
+
+def _issue(check: ValidationCheck, message: str, offending: NDArray[Any]) -> ValidationIssue:
+    return ValidationIssue(
+        check=check,
+        message=message,
+        count=len(offending),
+        examples=offending[:REPORT_MAX_EXAMPLES].tolist(),
+    )
+
+
+def _row_batches(array: zarr.Array) -> list[tuple[int, int]]:
+    """Split the rows of an array into ranges aligned to its chunks, of at least
+    `DEEP_BATCH_ROWS` rows unless the array is shorter."""
+    n_rows = array.shape[0]
+    chunk_len = array.chunks[0]
+    step = chunk_len * max(1, DEEP_BATCH_ROWS // chunk_len)
+    return [(start, min(start + step, n_rows)) for start in range(0, n_rows, step)]
+
+
+def _check_edge_batch(
+    edges: zarr.Array, start: int, stop: int, index: IdIndex, directed: bool
+) -> tuple[NDArray[Any], NDArray[Any], NDArray[np.int64], NDArray[np.int64]]:
+    """Run the referential checks on a batch of edges.
+
+    Returns:
+        tuple: The edges with nodes that are not in the node ids, the nodes with self
+        edges, the sorted unique keys of the other edges, and the keys repeated within
+        the batch. The key of an edge is computed from the positions of its nodes in the
+        index, the nodes of undirected edges are ordered first.
+    """
+    edge_ids = np.asarray(edges[start:stop])
+    positions = index.positions(edge_ids)
+    missing = (positions < 0).any(axis=1)
+    self_nodes = edge_ids[edge_ids[:, 0] == edge_ids[:, 1], 0]
+    positions = positions[~missing].astype(np.int64, copy=False)
+    if not directed:
+        positions.sort(axis=1)
+    keys, counts = np.unique(positions[:, 0] * len(index.ids) + positions[:, 1], return_counts=True)
+    return edge_ids[missing], self_nodes, keys, keys[counts > 1]
+
+
+def _validate_derived(graph: zarr.Group, metadata: GeffMetadata) -> list[ValidationIssue]:
+    """Compare the optional arrays derived from the ids and properties, like the adjacency
+    index, to the ones recomputed from the data."""
+    issues = []
+    nodes = _get_group(graph, "nodes")
+    if "time_index" in nodes.group_keys():
+        try:
+            validate_time_index(nodes, metadata, deep=True)
+        except AssertionError as e:
+            issues.append(ValidationIssue(check="time_index", message=str(e), count=1))
+    for group_name, component_type in (("nodes", "Node"), ("edges", "Edge")):
+        if group_name not in graph.group_keys() or "props" not in _get_group(graph, group_name):
+            continue
+        props = _get_group(_get_group(graph, group_name), "props")
+        for prop in props.group_keys():
+            try:
+                validate_chunk_stats(_get_group(props, prop), prop, component_type, deep=True)
+            except AssertionError as e:
+                issues.append(ValidationIssue(check="chunk_stats", message=str(e), count=1))
+    if "edges" in graph.group_keys() and "adjacency" in _get_group(graph, "edges").group_keys():
+        try:
+            validate_adjacency(nodes, _get_group(graph, "edges"), deep=True)
+        except AssertionError as e:
+            issues.append(ValidationIssue(check="adjacency", message=str(e), count=1))
+    return issues
+
+
+def _validate_ids(
+    graph: zarr.Group, metadata: GeffMetadata, executor: Executor | None
+) -> ValidationReport:
+    """Check that the node ids are unique, and that the edges reference existing nodes,
+    are not self edges and are not repeated."""
+
+    def run(fn: Callable[..., Any], *args: Any) -> Future | Any:
+        return executor.submit(fn, *args) if executor is not None else fn(*args)
+
+    def result(value: Future | Any) -> Any:
+        return value.result() if isinstance(value, Future) else value
+
+    nodes = _get_array(_get_group(graph, "nodes"), "ids")
+    node_chunks = [run(nodes.__getitem__, slice(*rows)) for rows in _row_batches(nodes)]
+    node_ids = np.concatenate([np.asarray(nodes[:0]), *(result(chunk) for chunk in node_chunks)])
+    report = ValidationReport(n_nodes=len(node_ids))
+
+    # sorting once gives both the repeated ids and the unique ids to index
+    sorted_ids = np.sort(node_ids)
+    is_repeat = sorted_ids[1:] == sorted_ids[:-1]
+    if is_repeat.any():
+        repeated = np.unique(sorted_ids[1:][is_repeat])
+        report.issues.append(
+            _issue("unique_node_ids", f"{len(repeated)} node ids are repeated", repeated)
+        )
+    index = IdIndex(sorted_ids[np.concatenate(([True], ~is_repeat))[: len(sorted_ids)]])
+
+    if "edges" not in graph.group_keys():
+        return report
+    edges = _get_array(_get_group(graph, "edges"), "ids")
+    report.n_edges = edges.shape[0]
+    batches = [
+        run(_check_edge_batch, edges, start, stop, index, metadata.directed)
+        for start, stop in _row_batches(edges)
+    ]
+    results = [result(batch) for batch in batches]
+    missing_edges = np.concatenate([np.asarray(edges[:0]), *(batch[0] for batch in results)])
+    self_edge_nodes = np.unique(
+        np.concatenate([np.asarray(nodes[:0]), *(batch[1] for batch in results)])
+    )
+    keys = [batch[2] for batch in results]
+    repeated_keys = [batch[3] for batch in results]
+
+    if len(missing_edges) > 0:
+        report.issues.append(
+            _issue(
+                "edges_reference_nodes",
+                f"{len(missing_edges)} edges have node ids that are not in the node ids",
+                missing_edges,
+            )
+        )
+    if len(self_edge_nodes) > 0:
+        report.issues.append(
+            _issue(
+                "self_edges",
+                f"{len(self_edge_nodes)} nodes have an edge to themselves",
+                self_edge_nodes,
+            )
+        )
+    # the keys of every batch are unique, so a key is repeated across batches if it
+    # appears twice in the merged keys
+    if len(keys) > 1:
+        merged = np.sort(np.concatenate(keys), kind="stable")
+        repeated_keys.append(merged[1:][merged[1:] == merged[:-1]])
+    repeated = np.unique(np.concatenate([np.empty(0, dtype=np.int64), *repeated_keys]))
+    if len(repeated) > 0:
+        n_ids = len(index.ids)
+        repeated_edges = np.stack(
+            [index.ids[repeated // n_ids], index.ids[repeated % n_ids]], axis=1
+        )
+        report.issues.append(
+            _issue("repeated_edges", f"{len(repeated_edges)} edges are repeated", repeated_edges)
+        )
+    return report
+
+
+@overload
+def validate(
+    store: StoreLike, level: Literal["structure"] = "structure", workers: int | None = None
+) -> None: ...
+
+
+@overload
+def validate(
+    store: StoreLike, level: Literal["deep"], workers: int | None = None
+) -> ValidationReport: ...
+
+
+def validate(
+    store: StoreLike,
+    level: Literal["structure", "deep"] = "structure",
+    workers: int | None = None,
+) -> ValidationReport | None:
+    """Check that the zarr conforms to geff specification
+
+    The "structure" level checks the groups, the metadata and the shapes of the arrays,
+    and raises on the first violation. It does not read the ids or property values, so
+    that opening a large geff stays cheap. The "deep" level also checks the ids: that the
+    node ids are unique, and that every edge references existing nodes, is not a self
+    edge and is not repeated. The ids are read chunk by chunk, the node ids are sorted
+    once and the edges are checked in batches of whole chunks. It also compares the
+    optional time index, chunk statistics and adjacency index to the ones recomputed from
+    the data.
+    Instead of raising, the deep level returns a report of every issue found.
+
+    Args:
+        store (str | Path | zarr store): Check the geff zarr, either str/Path/store
+        level (Literal["structure", "deep"], optional): How thoroughly to validate.
+            Defaults to "structure".
+        workers (int, optional): With the "deep" level, the number of threads that read
+            and check the id chunks. Defaults to None, checking them in the calling
+            thread.
+
+    Returns:
+        ValidationReport | None: With the "deep" level, the report of the issues found.
+        None with the "structure" level.
+
+    Raises:
+        AssertionError: If geff specs are violated, with the "structure" level
+        ValueError: If store is not a valid zarr store or path doesn't exist
+    """
+
+    # Check if path exists for string/Path inputs
+    if isinstance(store, str | Path):
+        store_path = Path(store)
+        if not is_remote_url(str(store_path)) and not store_path.exists():
+            raise ValueError(f"Path does not exist: {store}")
+
+    # Open the zarr group from the store
+    try:
+        graph = zarr.open_group(store, mode="r")
+    except Exception as e:
+        raise ValueError("store must be a zarr StoreLike") from e
+
+    # graph attrs validation
+    # Raises pydantic.ValidationError or ValueError
+    metadata = GeffMetadata.read(store)
+
+    if level == "structure":
+        _validate_structure(graph, metadata)
+        return None
+    if level != "deep":
+        raise ValueError(f"Unknown validation level {level}, expected 'structure' or 'deep'")
+
+    try:
+        _validate_structure(graph, metadata)
+    except AssertionError as e:
+        return ValidationReport(
+            issues=[ValidationIssue(check="structure", message=str(e), count=1)]
+        )
+
+    executor = ThreadPoolExecutor(workers) if workers is not None else None
+    try:
+        report = _validate_ids(graph, metadata, executor)
+        report.issues.extend(_validate_derived(graph, metadata))
+        return report
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
 
 def nx_is_equal(g1: nx.Graph, g2: nx.Graph) -> bool:
     """Utility function to check that two Network graphs are perfectly identical.
@@ -1,6 +1,19 @@
-import networkx as nx
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 import numpy as np
-from numpy.typing import ArrayLike
+import zarr
+
+from geff.id_index import IdIndex, edges_within
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from numpy.typing import ArrayLike, NDArray
+
+# the edges of a zarr array are read in batches of whole chunks of at least this many rows
+EDGE_BATCH_ROWS = 1 << 20
 
 
 def validate_nodes_for_edges(
@@ -29,9 +42,7 @@ def validate_nodes_for_edges(
     edge_ids = np.asarray(edge_ids)
 
     # Build a boolean mask: True for valid edges
-    valid_src = np.isin(edge_ids[:, 0], node_ids)
-    valid_tgt = np.isin(edge_ids[:, 1], node_ids)
-    mask = valid_src & valid_tgt
+    mask = edges_within(node_ids, edge_ids)
 
     # Find invalid edges
     invalid_edges = [tuple(edge) for edge in edge_ids[~mask]]
@@ -81,12 +92,40 @@ def validate_no_repeated_edges(edge_ids: ArrayLike) -> tuple[bool, list[tuple[in
     return (len(repeated_edges) == 0, repeated_edges)
 
 
+def _remap_edges(
+    node_ids: NDArray[np.int64], edge_ids: NDArray[np.int64]
+) -> tuple[NDArray[np.int64], NDArray[np.intp], NDArray[np.intp]]:
+    """Remap the edge endpoints to positions in `node_ids`.
+
+    Endpoints that are not in `node_ids` are given positions after the nodes, so that
+    they behave like the nodes that `nx.DiGraph` adds for them.
+
+    Returns:
+        tuple: The id of every position, starting with `node_ids`, and the positions of
+        the sources and the targets.
+    """
+    positions = IdIndex(node_ids).positions(edge_ids)
+    unknown = positions < 0
+    if not unknown.any():
+        return node_ids, positions[:, 0], positions[:, 1]
+    extra_ids, extra_positions = np.unique(edge_ids[unknown], return_inverse=True)
+    positions[unknown] = len(node_ids) + extra_positions.reshape(-1)
+    return np.concatenate((node_ids, extra_ids)), positions[:, 0], positions[:, 1]
+
+
 def validate_tracklets(
     node_ids: ArrayLike, edge_ids: ArrayLike, tracklet_ids: ArrayLike
 ) -> tuple[bool, list[str]]:
     """
-    Validates if each tracklet forms a single, cycle-free path using NetworkX
-    for improved performance.
+    Validates if each tracklet forms a single, cycle-free path.
+
+    A tracklet with at least two nodes is valid if its nodes and the edges between them
+    form one path without branches, merges or cycles, and if it is maximal: the path
+    cannot be extended by a predecessor of its first node that has no other successor,
+    or by a successor of its last node that has no other predecessor. The checks use
+    degree counts of the edges between positions of the node ids, and follow the
+    predecessors within each tracklet by pointer jumping to find cycles and the start of
+    every path. Repeated edges count once.
 
     Args:
         node_ids (ArrayLike): Sequence of node identifiers.
@@ -97,83 +136,162 @@ def validate_tracklets(
     Returns:
         tuple[bool, list[str]]:
             - is_valid (bool): True if all tracklets are valid, otherwise False.
-            - errors (list[str]): List of error messages for invalid tracklets.
+            - errors (list[str]): List of error messages for invalid tracklets, in the
+              order in which the tracklets first appear in `tracklet_ids`.
     """
-    errors = []
-
     ID_DTYPE = np.int64
-    nodes = node_ids.astype(ID_DTYPE, copy=False)
-    edges = edge_ids.astype(ID_DTYPE, copy=False)
-    tracklets = tracklet_ids.astype(ID_DTYPE, copy=False)
-
-    # Group nodes by tracklet ID.
-    tracklet_to_nodes: dict[np.int64, list[np.int64]] = {}
-    for node, t_id in zip(nodes, tracklets, strict=False):
-        tracklet_to_nodes.setdefault(t_id, []).append(node)
-
-    # Build the graph.
-    G = nx.DiGraph(tuple(edge) for edge in edges)
-    # Ensure all nodes from node_ids are in the graph, even if isolated.
-    G.add_nodes_from(nodes)
-
-    # Validate each tracklet.
-    for t_id, t_nodes in tracklet_to_nodes.items():
-        # by definition, a tracklet
-        if len(t_nodes) < 2:
-            continue
-
-        # Gets a subgraph for the current tracklet.
-        S = G.subgraph(t_nodes)
-
-        # Check - no branches or merges (junctions).
-        max_in_degree = max((d for _, d in S.in_degree()), default=0)
-        max_out_degree = max((d for _, d in S.out_degree()), default=0)
-
-        if max_in_degree > 1 or max_out_degree > 1:
-            errors.append(f"Tracklet {t_id}: Invalid path structure (branch or merge detected).")
-            continue
-
-        # Check - No cycles.
-        if not nx.is_directed_acyclic_graph(S):
-            errors.append(f"Tracklet {t_id}: Cycle detected.")
-            continue
-
-        # Check - Fully connected.
-        if not nx.is_weakly_connected(S):
-            errors.append(f"Tracklet {t_id}: Not fully connected.")
-            continue
-
-        # Check - Tracklet is maximal linear segment.
-        start_node = next(n for n, d in S.in_degree() if d == 0)
-        end_node = next(n for n, d in S.out_degree() if d == 0)
-
-        # Check if the path could be extended backward
-        preds_in_G = list(G.predecessors(start_node))
-        if len(preds_in_G) == 1:
-            predecessor = preds_in_G[0]
-            # If the predecessor is also part of a linear segment...
-            if G.out_degree(predecessor) == 1:
+    nodes = np.asarray(node_ids).astype(ID_DTYPE, copy=False)
+    edges = np.asarray(edge_ids).astype(ID_DTYPE, copy=False).reshape(-1, 2)
+    tracklets = np.asarray(tracklet_ids).astype(ID_DTYPE, copy=False)
+    n_nodes = len(nodes)
+
+    ids, sources, targets = _remap_edges(nodes, edges)
+    n_positions = len(ids)
+    # drop repeated edges
+    keys = np.sort(sources.astype(np.int64) * n_positions + targets)
+    keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))[: len(keys)]]
+    sources, targets = keys // n_positions, keys % n_positions
+
+    tracklet_values, first_index, node_tracklet = np.unique(
+        tracklets, return_index=True, return_inverse=True
+    )
+    node_tracklet = node_tracklet.reshape(-1)
+    n_tracklets = len(tracklet_values)
+    tracklet_size = np.bincount(node_tracklet, minlength=n_tracklets)
+    # the tracklet of every position, -1 for endpoints that are not in the node ids
+    position_tracklet = np.full(n_positions, -1, dtype=np.intp)
+    position_tracklet[:n_nodes] = node_tracklet
+
+    in_degree = np.bincount(targets, minlength=n_positions)
+    out_degree = np.bincount(sources, minlength=n_positions)
+    # the degrees within the subgraph of each tracklet
+    inner = position_tracklet[sources] == position_tracklet[targets]
+    inner &= position_tracklet[sources] >= 0
+    inner_sources, inner_targets = sources[inner], targets[inner]
+    inner_in = np.bincount(inner_targets, minlength=n_positions)[:n_nodes]
+    inner_out = np.bincount(inner_sources, minlength=n_positions)[:n_nodes]
+
+    def any_node(mask: NDArray[np.bool_]) -> NDArray[np.bool_]:
+        """Whether any node of each tracklet is in the mask."""
+        return np.bincount(node_tracklet[mask], minlength=n_tracklets) > 0
+
+    is_branched = any_node((inner_in > 1) | (inner_out > 1))
+
+    # follow the predecessors within the tracklet to the start of the path, which has no
+    # inner predecessor, by pointer jumping. A path is not longer than its tracklet, which
+    # bounds the number of jumps, and the nodes of a cycle never reach a start.
+    is_start = inner_in == 0
+    root = np.arange(n_nodes)
+    root[inner_targets] = inner_sources
+    active = np.flatnonzero(~is_start[root])
+    for _ in range(int(tracklet_size.max(initial=1)).bit_length() + 1):
+        if len(active) == 0:
+            break
+        root[active] = root[root[active]]
+        active = active[~is_start[root[active]]]
+    has_cycle = any_node(~is_start[root])
+    n_starts = np.bincount(node_tracklet[is_start], minlength=n_tracklets)
+
+    # the first and last node of the path of each tracklet, and the predecessor and
+    # successor of every node with a single one
+    start = np.zeros(n_tracklets, dtype=np.intp)
+    start[node_tracklet[is_start]] = np.flatnonzero(is_start)
+    is_end = inner_out == 0
+    end = np.zeros(n_tracklets, dtype=np.intp)
+    end[node_tracklet[is_end]] = np.flatnonzero(is_end)
+    predecessor = np.zeros(n_positions, dtype=np.intp)
+    predecessor[targets] = sources
+    successor = np.zeros(n_positions, dtype=np.intp)
+    successor[sources] = targets
+    extends_backward = in_degree[start] == 1
+    extends_backward &= out_degree[predecessor[start]] == 1
+    extends_forward = out_degree[end] == 1
+    extends_forward &= in_degree[successor[end]] == 1
+
+    # the first failing check of every tracklet, a tracklet with one node is valid by
+    # definition
+    failure = np.select(
+        [
+            tracklet_size < 2,
+            is_branched,
+            has_cycle,
+            n_starts > 1,
+            extends_backward,
+            extends_forward,
+        ],
+        [0, 1, 2, 3, 4, 5],
+        default=0,
+    )
+    errors = []
+    for tracklet in sorted(np.flatnonzero(failure).tolist(), key=first_index.__getitem__):
+        t_id = tracklet_values[tracklet]
+        match failure[tracklet]:
+            case 1:
                 errors.append(
-                    f"Tracklet {t_id}: Not maximal. Path can extend backward to node {predecessor}."
+                    f"Tracklet {t_id}: Invalid path structure (branch or merge detected)."
                 )
-                continue
-
-        # Check if the path could be extended forward
-        succs_in_G = list(G.successors(end_node))
-        if len(succs_in_G) == 1:
-            successor = succs_in_G[0]
-            # If the successor is also part of a linear segment...
-            if G.in_degree(successor) == 1:
+            case 2:
+                errors.append(f"Tracklet {t_id}: Cycle detected.")
+            case 3:
+                errors.append(f"Tracklet {t_id}: Not fully connected.")
+            case 4:
                 errors.append(
-                    f"Tracklet {t_id}: Not maximal. Path can extend forward to node {successor}."
+                    f"Tracklet {t_id}: Not maximal. Path can extend backward to node "
+                    f"{ids[predecessor[start[tracklet]]]}."
+                )
+            case 5:
+                errors.append(
+                    f"Tracklet {t_id}: Not maximal. Path can extend forward to node "
+                    f"{ids[successor[end[tracklet]]]}."
                 )
-                continue
 
     return not errors, errors
 
 
+def _find_roots(parent: NDArray[np.intp], positions: NDArray[np.intp]) -> NDArray[np.intp]:
+    """Find the roots of positions in a union-find forest, compressing their paths."""
+    roots = parent[positions]
+    while True:
+        up = parent[roots]
+        if np.array_equal(up, roots):
+            break
+        roots = up
+    parent[positions] = roots
+    return roots
+
+
+def _union(parent: NDArray[np.intp], sources: NDArray[np.intp], targets: NDArray[np.intp]) -> None:
+    """Merge the trees of the sources and targets of edges in a union-find forest.
+
+    All edges are merged at once: in every round, the larger root of each edge whose
+    endpoints are in different trees is attached to the smallest root it is joined with.
+    Parents always point to smaller positions, so no cycles can form.
+    """
+    while len(sources) > 0:
+        source_roots = _find_roots(parent, sources)
+        target_roots = _find_roots(parent, targets)
+        split = source_roots != target_roots
+        sources, targets = sources[split], targets[split]
+        low = np.minimum(source_roots[split], target_roots[split])
+        high = np.maximum(source_roots[split], target_roots[split])
+        np.minimum.at(parent, high, low)
+
+
+def _edge_batches(edge_ids: ArrayLike | zarr.Array) -> Iterator[NDArray[Any]]:
+    """Yield the edges in batches of `EDGE_BATCH_ROWS` rows, to keep the temporaries
+    small. Zarr arrays are read in batches of whole chunks."""
+    if isinstance(edge_ids, zarr.Array):
+        chunk_len = edge_ids.chunks[0]
+        step = chunk_len * max(1, EDGE_BATCH_ROWS // chunk_len)
+    else:
+        edge_ids = np.asarray(edge_ids).reshape(-1, 2)
+        step = EDGE_BATCH_ROWS
+    for start in range(0, edge_ids.shape[0], step):
+        yield np.asarray(edge_ids[start : start + step])
+
+
 def validate_lineages(
-    node_ids: ArrayLike, edge_ids: ArrayLike, lineage_ids: ArrayLike
+    node_ids: ArrayLike, edge_ids: ArrayLike | zarr.Array, lineage_ids: ArrayLike
 ) -> tuple[bool, list[str]]:
     """Validates if each lineage is a valid, isolated connected component.
 
@@ -181,10 +299,16 @@ def validate_lineages(
     to it is identical to one of the graph's weakly connected components.
     This efficiently ensures both internal connectivity and external isolation.
 
+    The components are found with an array based union-find over the positions of the
+    node ids, merging the edges batch by batch, so that the edges of a zarr array are
+    streamed chunk by chunk. A lineage is valid if it maps to exactly one component,
+    that component maps to exactly one lineage, and it has no edge to a node that is
+    not in `node_ids`.
+
     Args:
         node_ids: A sequence of unique node identifiers in the graph.
         edge_ids: A sequence of (source, target) pairs representing directed
-            edges.
+            edges, or a zarr array of them that is read in chunks.
         lineage_ids: A sequence of lineage identifiers corresponding to each
             node in `node_ids`.
 
@@ -193,35 +317,51 @@ def validate_lineages(
             - is_valid (bool): True if all lineages are valid connected
               components, False otherwise.
             - errors (list[str]): A list of error messages for each invalid
-              lineage.
+              lineage, in the order in which the lineages first appear in
+              `lineage_ids`.
     """
     ID_DTYPE = np.int64
     # Ensure consistent dtypes.
     nodes = np.asarray(node_ids, dtype=ID_DTYPE)
-    edges = np.asarray(edge_ids, dtype=ID_DTYPE)
     lineages = np.asarray(lineage_ids, dtype=ID_DTYPE)
-
-    errors: list[str] = []
-    lineage_to_nodes: dict[np.int64, list[np.int64]] = {}
-
-    for node, l_id in zip(nodes, lineages, strict=False):
-        lineage_to_nodes.setdefault(l_id, []).append(node)
-
-    # Build the graph.
-    G = nx.DiGraph(tuple(edge) for edge in edges)
-    G.add_nodes_from(nodes)
-
-    # Find all weakly connected components.
-    valid_components = {frozenset(component) for component in nx.weakly_connected_components(G)}
-
-    # Check if each lineage's node set matches a valid component.
-    for l_id, l_nodes in lineage_to_nodes.items():
-        if not l_nodes:
-            continue
-
-        l_nodes_set = frozenset(l_nodes)
-
-        if l_nodes_set not in valid_components:
-            errors.append(f"Lineage {l_id}: Does not form a valid, isolated connected component.")
-
+    n_nodes = len(nodes)
+    if n_nodes == 0:
+        return True, []
+
+    index = IdIndex(nodes)
+    parent = np.arange(n_nodes)
+    # nodes with an edge to a node that is not in the node ids, which is part of their
+    # component but of no lineage
+    is_open = np.zeros(n_nodes, dtype=bool)
+    for edges in _edge_batches(edge_ids):
+        positions = index.positions(edges.astype(ID_DTYPE, copy=False))
+        known = positions >= 0
+        inner = known.all(axis=1)
+        _union(parent, positions[inner, 0], positions[inner, 1])
+        is_open[positions[known & ~inner[:, None]]] = True
+    components = _find_roots(parent, np.arange(n_nodes))
+
+    lineage_values, first_index, node_lineage = np.unique(
+        lineages, return_index=True, return_inverse=True
+    )
+    node_lineage = node_lineage.reshape(-1)
+    n_lineages = len(lineage_values)
+    # the distinct (component, lineage) pairs, to count the lineages of every component
+    # and the components of every lineage
+    pairs = np.unique(components * n_lineages + node_lineage)
+    lineages_per_component = np.bincount(pairs // n_lineages, minlength=n_nodes)
+    components_per_lineage = np.bincount(pairs % n_lineages, minlength=n_lineages)
+    component_is_open = np.bincount(components[is_open], minlength=n_nodes) > 0
+
+    # every node of a lineage with one component has that component
+    lineage_component = np.zeros(n_lineages, dtype=np.intp)
+    lineage_component[node_lineage] = components
+    is_valid = components_per_lineage == 1
+    is_valid &= lineages_per_component[lineage_component] == 1
+    is_valid &= ~component_is_open[lineage_component]
+
+    errors: list[str] = [
+        f"Lineage {lineage_values[lineage]}: Does not form a valid, isolated connected component."
+        for lineage in sorted(np.flatnonzero(~is_valid).tolist(), key=first_index.__getitem__)
+    ]
     return not errors, errors
@@ -1,15 +1,262 @@
 import warnings
-from typing import Literal
+from collections.abc import Mapping
+from typing import Any, Final, Literal, cast
 
 import numpy as np
 import zarr
+from pydantic import BaseModel, Field, model_validator
+from pydantic.config import ConfigDict
 from zarr.storage import StoreLike
 
-from geff.utils import remove_tilde
+from geff.utils import compute_adjacency, compute_chunk_stats, get_time_axis, remove_tilde
 
 from .metadata_schema import GeffMetadata
 from .valid_values import validate_data_type
 
+# the default encoding, benchmarked on id, position and time arrays of 1e5 to 1e7 rows:
+# blosc zstd at level 3 with byte shuffle compresses as well as higher levels while
+# writing 3-4x faster than the zarr defaults, and chunks of 2**18 rows (2 MiB for 64 bit
+# values) keep the number of objects low on object stores without slowing down reads
+DEFAULT_CHUNK_SIZE: Final = 1 << 18
+DEFAULT_CODEC: Final = "zstd"
+DEFAULT_CLEVEL: Final = 3
+
+
+class ArrayEncoding(BaseModel):
+    """How the arrays of a geff are chunked, compressed and sharded.
+
+    Arrays are only chunked along their first axis, so that every chunk holds whole
+    rows. All writers accept an encoding for all groups, or a mapping from "nodes" and
+    "edges" to the encoding of the arrays of that group, for example
+    `{"nodes": ArrayEncoding(chunk_size=2**16), "edges": ArrayEncoding(chunk_size=2**20)}`.
+
+    With `layout="raw"` every array is stored as a single uncompressed chunk, which
+    `GeffReader` memory maps from local stores instead of decoding a copy.
+
+    Example:
+        >>> encoding = ArrayEncoding(chunk_size=2**20, shard_size=2**24)
+        ... write_nx(graph, "graph.zarr", zarr_format=3, encoding=encoding)
+
+        >>> write_nx(graph, "graph.zarr", encoding=ArrayEncoding(layout="raw"))
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    chunk_size: int | None = Field(
+        default=DEFAULT_CHUNK_SIZE,
+        gt=0,
+        description="The number of rows in a chunk. If None, zarr picks the chunk shape.",
+    )
+    codec: Literal["zstd", "lz4", "lz4hc", "blosclz", "zlib"] | None = Field(
+        default=DEFAULT_CODEC,
+        description="The compressor used by the blosc codec, or None for no compression.",
+    )
+    clevel: int = Field(default=DEFAULT_CLEVEL, ge=0, le=9, description="The compression level.")
+    shuffle: bool = Field(
+        default=True, description="Whether to byte shuffle the values before compressing them."
+    )
+    shard_size: int | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "The number of rows in a shard, a multiple of the chunk size. Shards store "
+            "many chunks in one object, and require zarr_format=3. Defaults to no sharding."
+        ),
+    )
+    layout: Literal["chunked", "raw"] = Field(
+        default="chunked",
+        description=(
+            "'chunked' to chunk and compress the arrays, or 'raw' to store each array as "
+            "a single uncompressed chunk that can be memory mapped. The raw layout has no "
+            "chunk size, codec or shard size."
+        ),
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def _raw_defaults(cls, data: Any) -> Any:
+        # the raw layout is not chunked or compressed, unless explicitly requested
+        if isinstance(data, dict) and data.get("layout") == "raw":
+            data = {"chunk_size": None, "codec": None, **data}
+        return data
+
+    @model_validator(mode="after")
+    def _validate_shard_size(self) -> "ArrayEncoding":
+        if self.shard_size is not None and (
+            self.chunk_size is None or self.shard_size % self.chunk_size != 0
+        ):
+            raise ValueError(
+                f"Shard size {self.shard_size} must be a multiple of the chunk size "
+                f"{self.chunk_size}"
+            )
+        if self.layout == "raw" and not (
+            self.chunk_size is None and self.codec is None and self.shard_size is None
+        ):
+            raise ValueError("The raw layout cannot have a chunk size, codec or shard size")
+        return self
+
+
+EncodingLike = ArrayEncoding | Mapping[str, ArrayEncoding] | None
+
+
+def get_encoding(encoding: EncodingLike, group: str) -> ArrayEncoding:
+    """Get the encoding of the arrays of a group.
+
+    Args:
+        encoding (ArrayEncoding | Mapping[str, ArrayEncoding] | None): The encoding of
+            all groups, or a mapping from "nodes" and "edges" to the encoding of that
+            group. If None, or if the group is not in the mapping, the default encoding
+            is used.
+        group (str): "nodes" or "edges"
+
+    Returns:
+        ArrayEncoding: The encoding of the arrays of the group.
+    """
+    if isinstance(encoding, ArrayEncoding):
+        return encoding
+    if encoding is not None and group in encoding:
+        return encoding[group]
+    return ArrayEncoding()
+
+
+def _encoding_kwargs(
+    geff_root: zarr.Group, shape: tuple[int, ...], encoding: ArrayEncoding, resizable: bool
+) -> dict[str, Any]:
+    """The keyword arguments to create a zarr array of the given shape with an encoding."""
+    zarr_format = geff_root.metadata.zarr_format if zarr.__version__.startswith("3") else 2
+    if encoding.shard_size is not None and zarr_format != 3:
+        raise ValueError("Sharding requires writing with zarr_format=3")
+
+    if encoding.layout == "raw":
+        if resizable:
+            raise ValueError("The raw layout cannot be used for arrays that are appended to")
+        raw_chunks = (max(shape[0], 1), *shape[1:])
+        if zarr.__version__.startswith("3"):
+            # a chunk of fill values must still be written to be memory mapped
+            return {
+                "chunks": raw_chunks,
+                "shards": None,
+                "compressors": None,
+                "config": {"write_empty_chunks": True},
+            }
+        return {"chunks": raw_chunks, "compressor": None}
+
+    chunk_size = encoding.chunk_size
+    if chunk_size is None and resizable:
+        # the automatic chunk shape of an empty array would be a single row
+        chunk_size = DEFAULT_CHUNK_SIZE
+    chunks: Any = True if not zarr.__version__.startswith("3") else "auto"
+    shards = None
+    if chunk_size is not None:
+        # arrays that will grow get full chunks, others need not be larger than the data
+        n_rows = None if resizable else max(shape[0], 1)
+        chunk_rows = chunk_size if n_rows is None else min(chunk_size, n_rows)
+        chunks = (chunk_rows, *shape[1:])
+        if encoding.shard_size is not None:
+            shard_rows = encoding.shard_size if n_rows is None else min(encoding.shard_size, n_rows)
+            # a shard holds whole chunks
+            shards = (-(-shard_rows // chunk_rows) * chunk_rows, *shape[1:])
+
+    if encoding.codec is None:
+        compressor = None
+    elif zarr_format == 3:
+        from zarr.codecs import BloscCodec
+
+        compressor = BloscCodec(
+            cname=encoding.codec,
+            clevel=encoding.clevel,
+            shuffle="shuffle" if encoding.shuffle else "noshuffle",
+        )
+    else:
+        from numcodecs import Blosc  # type: ignore[import-untyped]
+
+        compressor = Blosc(
+            cname=encoding.codec,
+            clevel=encoding.clevel,
+            shuffle=Blosc.SHUFFLE if encoding.shuffle else Blosc.NOSHUFFLE,
+        )
+
+    if zarr.__version__.startswith("3"):
+        return {"chunks": chunks, "shards": shards, "compressors": compressor}
+    return {"chunks": chunks, "compressor": compressor}
+
+
+def _open_geff_root(geff_store: StoreLike, zarr_format: Literal[2, 3]) -> zarr.Group:
+    """Open the geff group of a store in append mode."""
+    if zarr.__version__.startswith("3"):
+        geff_root = zarr.open(
+            geff_store, mode="a", zarr_format=zarr_format
+        )  # zarr format defaulted to 2
+    else:
+        geff_root = zarr.open(geff_store, mode="a")
+    return cast("zarr.Group", geff_root)
+
+
+def write_array(
+    geff_root: zarr.Group, path: str, data: np.ndarray, encoding: ArrayEncoding
+) -> zarr.Array:
+    """Write an array into a geff group with the given encoding, replacing any array at
+    that path.
+
+    Args:
+        geff_root (zarr.Group): The geff group, opened in append mode.
+        path (str): The path of the array in the group, for example "nodes/ids".
+        data (np.ndarray): The values of the array.
+        encoding (ArrayEncoding): The chunking, compression and sharding of the array.
+
+    Returns:
+        zarr.Array: The written array.
+
+    Raises:
+        ValueError: If sharding is requested for a zarr format 2 array.
+    """
+    kwargs = _encoding_kwargs(geff_root, data.shape, encoding, resizable=False)
+    if zarr.__version__.startswith("3"):
+        return geff_root.create_array(path, data=data, overwrite=True, **kwargs)
+    return geff_root.array(path, data=data, overwrite=True, **kwargs)
+
+
+def create_resizable_array(
+    geff_root: zarr.Group,
+    path: str,
+    shape: tuple[int, ...],
+    dtype: np.dtype,
+    encoding: ArrayEncoding,
+    fill_value: Any = None,
+) -> zarr.Array:
+    """Create an array in a geff group that is grown by appending rows.
+
+    The array gets full chunks of `encoding.chunk_size` rows, or of `DEFAULT_CHUNK_SIZE`
+    rows if the encoding leaves the chunking to zarr. The initial rows are not written,
+    and read as the fill value.
+
+    Args:
+        geff_root (zarr.Group): The geff group, opened in append mode.
+        path (str): The path of the array in the group, for example "nodes/ids".
+        shape (tuple[int, ...]): The initial shape of the array.
+        dtype (np.dtype): The data type of the array.
+        encoding (ArrayEncoding): The chunking, compression and sharding of the array.
+        fill_value (Any, optional): The value of rows that are not written. Defaults to
+            None, using the zero of the dtype, like an empty string.
+
+    Returns:
+        zarr.Array: The created array.
+
+    Raises:
+        ValueError: If sharding is requested for a zarr format 2 array.
+    """
+    kwargs = _encoding_kwargs(geff_root, shape, encoding, resizable=True)
+    if fill_value is None:
+        # without a fill value, zarr 2 reads rows that are not written as uninitialized
+        fill_value = np.zeros((), dtype=dtype)[()]
+    if zarr.__version__.startswith("3"):
+        return geff_root.create_array(
+            path, shape=shape, dtype=dtype, fill_value=fill_value, overwrite=True, **kwargs
+        )
+    return geff_root.create_dataset(
+        path, shape=shape, dtype=dtype, fill_value=fill_value, overwrite=True, **kwargs
+    )
+
 
 def write_arrays(
     geff_store: StoreLike,
@@ -21,6 +268,10 @@ def write_arrays(
     node_props_unsquish: dict[str, list[str]] | None = None,
     edge_props_unsquish: dict[str, list[str]] | None = None,
     zarr_format: Literal[2, 3] = 2,
+    chunk_stats: bool = False,
+    sort_by_time: bool = False,
+    adjacency: bool = False,
+    encoding: EncodingLike = None,
 ):
     """Write a geff file from already constructed arrays of node and edge ids and props
 
@@ -51,26 +302,193 @@ def write_arrays(
             indicication how to "unsquish" a property into individual scalars
             (e.g.: `{"pos": ["z", "y", "x"]}` will store the position property
             as three individual properties called "z", "y", and "x".
+        chunk_stats (bool): If True, write per-chunk minimum and maximum arrays next to
+            the values of each boolean, integer or float property, which readers can use
+            to skip chunks when querying. Defaults to False.
+        sort_by_time (bool): If True, sort the nodes and node properties by the property
+            of the "time" axis in `metadata.axes` and write a frame offset table, so that
+            readers can load single frames as contiguous slices. Defaults to False.
+        adjacency (bool): If True, write a compressed sparse row index of the out- and
+            in-edges of every node, so that readers can fetch the edges of a few nodes
+            without loading all edges. Defaults to False.
+        encoding (ArrayEncoding | Mapping[str, ArrayEncoding] | None): The chunking,
+            compression and sharding of the arrays, for all groups or per "nodes" and
+            "edges" group, see `ArrayEncoding`. Defaults to None, using the default
+            encoding.
+
+    Raises:
+        ValueError: If `sort_by_time` is True and the metadata has no time axis, or if
+            sharding is requested for zarr format 2.
     """
     geff_store = remove_tilde(geff_store)
 
-    write_id_arrays(geff_store, node_ids, edge_ids)
+    if sort_by_time:
+        time_axis = get_time_axis(metadata)
+        if time_axis is None:
+            raise ValueError("Cannot sort nodes by time, metadata has no axis of type 'time'")
+        node_ids, node_props, time_values = sort_nodes_by_time(
+            node_ids, node_props, time_axis, node_props_unsquish
+        )
+
+    write_id_arrays(geff_store, node_ids, edge_ids, zarr_format=zarr_format, encoding=encoding)
     if node_props is not None:
         write_props_arrays(
-            geff_store, "nodes", node_props, node_props_unsquish, zarr_format=zarr_format
+            geff_store,
+            "nodes",
+            node_props,
+            node_props_unsquish,
+            zarr_format=zarr_format,
+            chunk_stats=chunk_stats,
+            encoding=encoding,
         )
     if edge_props is not None:
         write_props_arrays(
-            geff_store, "edges", edge_props, edge_props_unsquish, zarr_format=zarr_format
+            geff_store,
+            "edges",
+            edge_props,
+            edge_props_unsquish,
+            zarr_format=zarr_format,
+            chunk_stats=chunk_stats,
+            encoding=encoding,
+        )
+    if sort_by_time:
+        write_time_index(geff_store, time_values, zarr_format=zarr_format, encoding=encoding)
+    if adjacency:
+        write_adjacency_arrays(
+            geff_store, node_ids, edge_ids, zarr_format=zarr_format, encoding=encoding
         )
     metadata.write(geff_store)
 
 
+def sort_nodes_by_time(
+    node_ids: np.ndarray,
+    node_props: dict[str, tuple[np.ndarray, np.ndarray | None]] | None,
+    time_axis: str,
+    node_props_unsquish: dict[str, list[str]] | None = None,
+) -> tuple[np.ndarray, dict[str, tuple[np.ndarray, np.ndarray | None]], np.ndarray]:
+    """Reorder nodes and their properties so that the time property is ascending.
+
+    The sort is stable, so nodes within a frame keep their relative order. Edges refer
+    to node ids and do not need to be reordered.
+
+    Args:
+        node_ids (np.ndarray): An array containing the node ids.
+        node_props (dict[str, tuple[np.ndarray, np.ndarray | None]] | None): A dictionary
+            from node property names to (values, missing) arrays.
+        time_axis (str): The name of the time property. It can also be one of the
+            names a property is unsquished into.
+        node_props_unsquish (dict[str, list[str]] | None): a dictionary indicating how
+            to "unsquish" a property into individual scalars, see `write_arrays`.
+
+    Returns:
+        tuple: The sorted node ids, the sorted node properties and the sorted time values.
+
+    Raises:
+        ValueError: If the time property is not found in the node properties.
+    """
+    node_props = node_props if node_props is not None else {}
+    if time_axis in node_props:
+        time_values = node_props[time_axis][0]
+    else:
+        for name, replace_names in (node_props_unsquish or {}).items():
+            if time_axis in replace_names and name in node_props:
+                time_values = node_props[name][0][:, replace_names.index(time_axis)]
+                break
+        else:
+            raise ValueError(f"Time property '{time_axis}' not found in node properties")
+
+    order = np.argsort(time_values, kind="stable")
+    sorted_props = {
+        name: (values[order], missing[order] if missing is not None else None)
+        for name, (values, missing) in node_props.items()
+    }
+    return node_ids[order], sorted_props, time_values[order]
+
+
+def write_time_index(
+    geff_store: StoreLike,
+    time_values: np.ndarray,
+    zarr_format: Literal[2, 3] = 2,
+    encoding: EncodingLike = None,
+) -> None:
+    """Writes a frame offset table for nodes that are sorted by time.
+
+    The table is stored in the `nodes/time_index` group as a `frames` array with the
+    unique time values, and an `offsets` array of length `len(frames) + 1`, such that the
+    nodes of `frames[i]` are the rows `offsets[i]:offsets[i + 1]` of the nodes arrays.
+
+    Args:
+        geff_store (str | Path | zarr store): The path/str to the geff zarr, or the store
+            itself. Opens in append mode, so will only overwrite geff-controlled groups.
+        time_values (np.ndarray): The time property of every node, in the order of the
+            nodes/ids array. Must be sorted in ascending order.
+        zarr_format (Literal[2, 3]): The zarr specification to use when writing the zarr.
+            Defaults to 2.
+        encoding (ArrayEncoding | Mapping[str, ArrayEncoding] | None): The chunking,
+            compression and sharding of the arrays, see `ArrayEncoding`. The encoding of
+            the "nodes" group is used. Defaults to None, using the default encoding.
+
+    Raises:
+        ValueError: If the time values are not sorted.
+    """
+    geff_store = remove_tilde(geff_store)
+
+    time_values = np.asarray(time_values)
+    if np.any(time_values[1:] < time_values[:-1]):
+        raise ValueError("Time values must be sorted to write a time index")
+    frames, starts = np.unique(time_values, return_index=True)
+    offsets = np.append(starts, len(time_values)).astype(np.int64)
+
+    geff_root = _open_geff_root(geff_store, zarr_format)
+    node_encoding = get_encoding(encoding, "nodes")
+    write_array(geff_root, "nodes/time_index/frames", frames, node_encoding)
+    write_array(geff_root, "nodes/time_index/offsets", offsets, node_encoding)
+
+
+def write_adjacency_arrays(
+    geff_store: StoreLike,
+    node_ids: np.ndarray,
+    edge_ids: np.ndarray,
+    zarr_format: Literal[2, 3] = 2,
+    encoding: EncodingLike = None,
+) -> None:
+    """Writes a compressed sparse row index of the out- and in-edges of every node.
+
+    The index is stored in the `edges/adjacency` group. The out-edges of the node at index
+    `i` of the nodes/ids array are the rows `out_indices[out_indptr[i]:out_indptr[i + 1]]`
+    of the edges/ids array, and the in-edges are stored the same way in `in_indptr` and
+    `in_indices`. Can be used to add an index to an existing geff.
+
+    Args:
+        geff_store (str | Path | zarr store): The path/str to the geff zarr, or the store
+            itself. Opens in append mode, so will only overwrite geff-controlled groups.
+        node_ids (np.ndarray): The node ids, in the order of the nodes/ids array.
+        edge_ids (np.ndarray): The edge ids, in the order of the edges/ids array.
+        zarr_format (Literal[2, 3]): The zarr specification to use when writing the zarr.
+            Defaults to 2.
+        encoding (ArrayEncoding | Mapping[str, ArrayEncoding] | None): The chunking,
+            compression and sharding of the arrays, see `ArrayEncoding`. The encoding of
+            the "edges" group is used. Defaults to None, using the default encoding.
+
+    Raises:
+        ValueError: If the edges contain node ids that are not in `node_ids`.
+    """
+    geff_store = remove_tilde(geff_store)
+
+    adjacency = compute_adjacency(node_ids, edge_ids)
+
+    geff_root = _open_geff_root(geff_store, zarr_format)
+    edge_encoding = get_encoding(encoding, "edges")
+    for name, array in adjacency.items():
+        write_array(geff_root, f"edges/adjacency/{name}", array, edge_encoding)
+
+
 def write_id_arrays(
     geff_store: StoreLike,
     node_ids: np.ndarray,
     edge_ids: np.ndarray,
     zarr_format: Literal[2, 3] = 2,
+    encoding: EncodingLike = None,
 ) -> None:
     """Writes a set of node ids and edge ids to a geff group.
 
@@ -81,6 +499,9 @@ def write_id_arrays(
         edge_ids (np.ndarray): an array with same type as node_ds and shape (N, 2)
         zarr_format (Literal[2, 3]): The zarr specification to use when writing the zarr.
             Defaults to 2.
+        encoding (ArrayEncoding | Mapping[str, ArrayEncoding] | None): The chunking,
+            compression and sharding of the arrays of each group, see `ArrayEncoding`.
+            Defaults to None, using the default encoding.
     Raises:
         TypeError if node_ids and edge_ids have different types, or if either are float
     """
@@ -99,14 +520,9 @@ def write_id_arrays(
             stacklevel=2,
         )
 
-    if zarr.__version__.startswith("3"):
-        geff_root = zarr.open(
-            geff_store, mode="a", zarr_format=zarr_format
-        )  # zarr format defaulted to 2
-    else:
-        geff_root = zarr.open(geff_store, mode="a")
-    geff_root["nodes/ids"] = node_ids
-    geff_root["edges/ids"] = edge_ids
+    geff_root = _open_geff_root(geff_store, zarr_format)
+    write_array(geff_root, "nodes/ids", node_ids, get_encoding(encoding, "nodes"))
+    write_array(geff_root, "edges/ids", edge_ids, get_encoding(encoding, "edges"))
 
 
 def write_props_arrays(
@@ -115,6 +531,8 @@ def write_props_arrays(
     props: dict[str, tuple[np.ndarray, np.ndarray | None]],
     props_unsquish: dict[str, list[str]] | None = None,
     zarr_format: Literal[2, 3] = 2,
+    chunk_stats: bool = False,
+    encoding: EncodingLike = None,
 ) -> None:
     """Writes a set of properties to a geff nodes or edges group.
 
@@ -132,6 +550,13 @@ def write_props_arrays(
             three individual properties called "z", "y", and "x".
         zarr_format (Literal[2, 3]): The zarr specification to use when writing the zarr.
             Defaults to 2.
+        chunk_stats (bool): If True, also write `chunk_min` and `chunk_max` arrays with
+            the per-chunk minimum and maximum of each boolean, integer or float property,
+            computed from the in-memory values while writing. Other properties, like
+            complex or string ones, are written without statistics. Defaults to False.
+        encoding (ArrayEncoding | Mapping[str, ArrayEncoding] | None): The chunking,
+            compression and sharding of the arrays, see `ArrayEncoding`. The encoding of
+            `group` is used. Defaults to None, using the default encoding.
     Raises:
         ValueError: If the group is not a 'nodes' or 'edges' group.
     TODO: validate attrs length based on group ids shape?
@@ -153,13 +578,9 @@ def write_props_arrays(
             del props[name]
             props.update(replace_arrays)
 
-    if zarr.__version__.startswith("3"):
-        geff_root = zarr.open(
-            geff_store, mode="a", zarr_format=zarr_format
-        )  # zarr format defaulted to 2
-    else:
-        geff_root = zarr.open(geff_store, mode="a")
+    geff_root = _open_geff_root(geff_store, zarr_format)
     props_group = geff_root.require_group(f"{group}/props")
+    group_encoding = get_encoding(encoding, group)
     for prop, arrays in props.items():
         # data-type validation - ensure this property can round-trip through
         # Java Zarr readers before any data get written to disk.
@@ -172,6 +593,12 @@ def write_props_arrays(
             )
 
         prop_group = props_group.create_group(prop)
-        prop_group["values"] = values
+        values_array = write_array(prop_group, "values", values, group_encoding)
         if missing is not None:
-            prop_group["missing"] = missing
+            write_array(prop_group, "missing", missing, group_encoding)
+        if chunk_stats:
+            stats = compute_chunk_stats(values, values_array.chunks[0], missing)
+            if stats is not None:
+                chunk_min, chunk_max = stats
+                write_array(prop_group, "chunk_min", chunk_min, group_encoding)
+                write_array(prop_group, "chunk_max", chunk_max, group_encoding)
@@ -1,51 +1,111 @@
+import itertools
 import warnings
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence, Sized
 from typing import Any, Literal
 
 import numpy as np
 from zarr.storage import StoreLike
 
+from .geff_writer import GeffWriter
+from .io_utils import calculate_roi
 from .utils import remove_tilde
-from .write_arrays import write_id_arrays, write_props_arrays
+from .write_arrays import (
+    EncodingLike,
+    sort_nodes_by_time,
+    write_adjacency_arrays,
+    write_id_arrays,
+    write_props_arrays,
+    write_time_index,
+)
 
 
 def write_dicts(
     geff_store: StoreLike,
-    node_data: Sequence[tuple[Any, dict[str, Any]]],
-    edge_data: Sequence[tuple[Any, dict[str, Any]]],
-    node_prop_names: Sequence[str],
-    edge_prop_names: Sequence[str],
+    node_data: Iterable[tuple[Any, dict[str, Any]]],
+    edge_data: Iterable[tuple[Any, dict[str, Any]]],
+    node_prop_names: Sequence[str] | None,
+    edge_prop_names: Sequence[str] | None,
     axis_names: list[str] | None = None,
     zarr_format: Literal[2, 3] = 2,
-) -> None:
+    time_axis: str | None = None,
+    adjacency: bool = False,
+    encoding: EncodingLike = None,
+    batch_size: int | None = None,
+) -> tuple[tuple[float, ...], tuple[float, ...]] | None:
     """Write a dict-like graph representation to geff
 
+    The nodes and the edges are each read in a single pass, see `dict_props_to_columns`.
+    With a batch size, they are read and appended to resizable arrays in batches with a
+    `GeffWriter`, so one-shot iterables like a database cursor or the output stream of a
+    tracker can be written without holding the graph in memory.
+
     Args:
         geff_store (str | Path | zarr store): The path/str to the geff zarr, or the store
             itself. Opens in append mode, so will only overwrite geff-controlled groups.
-        node_data (Sequence[tuple[Any, dict[str, Any]]]): A sequence of tuples with
+        node_data (Iterable[tuple[Any, dict[str, Any]]]): An iterable of tuples with
             node_ids and node_data, where node_data is a dictionary from str names
             to any values.
-        edge_data (Sequence[tuple[Any, dict[str, Any]]]): A sequence of tuples with
+        edge_data (Iterable[tuple[Any, dict[str, Any]]]): An iterable of tuples with
             edge_ids and edge_data, where edge_data is a dictionary from str names
             to any values.
-        node_prop_names (Sequence[str]): A list of node properties to include in the
-            geff
-        edge_prop_names (Sequence[str]): a list of edge properties to include in the
-            geff
+        node_prop_names (Sequence[str] | None): A list of node properties to include in
+            the geff. If None, all properties found on the nodes are included.
+        edge_prop_names (Sequence[str] | None): a list of edge properties to include in
+            the geff. If None, all properties found on the edges are included.
         axis_names (Sequence[str] | None): The name of the spatiotemporal properties, if
             any. Defaults to None
         zarr_format (Literal[2, 3]): The zarr specification to use when writing the zarr.
             Defaults to 2.
+        time_axis (str | None): If given, the nodes are sorted by this spatiotemporal
+            property and a frame offset table is written, see `write_time_index`.
+            Defaults to None.
+        adjacency (bool): If True, write a compressed sparse row index of the edges of
+            every node, see `write_adjacency_arrays`. Defaults to False.
+        encoding (ArrayEncoding | Mapping[str, ArrayEncoding] | None): The chunking,
+            compression and sharding of the arrays, for all groups or per "nodes" and
+            "edges" group, see `ArrayEncoding`. Defaults to None, using the default
+            encoding.
+        batch_size (int | None): If given, the number of nodes or edges read and written
+            at once, which bounds the memory use. Properties of a batch are promoted to
+            the dtype of the next batches if needed, see `GeffWriter`. Cannot be combined
+            with `time_axis` or `adjacency`, which need all nodes or edges at once.
+            Defaults to None, reading all nodes and edges before writing.
+
+    Returns:
+        tuple[tuple[float, ...], tuple[float, ...]] | None: The min and max values of
+            the spatiotemporal properties, computed from the written arrays, or None if
+            there are no axis names or no nodes.
 
     Raises:
-        ValueError: If the position prop is given and is not present on all nodes.
+        ValueError: If the position prop is given and is not present on all nodes, or if
+            a batch size is combined with a time axis or adjacency.
     """
 
     geff_store = remove_tilde(geff_store)
 
-    node_ids = [idx for idx, _ in node_data]
-    edge_ids = [idx for idx, _ in edge_data]
+    if axis_names is not None and node_prop_names is not None:
+        node_prop_names = list(node_prop_names)
+        for axis in axis_names:
+            if axis not in node_prop_names:
+                node_prop_names.append(axis)
+
+    if batch_size is not None:
+        if time_axis is not None or adjacency:
+            raise ValueError("Writing in batches cannot sort by time or write adjacency")
+        return _write_dict_batches(
+            geff_store,
+            node_data,
+            edge_data,
+            node_prop_names,
+            edge_prop_names,
+            axis_names,
+            zarr_format,
+            encoding,
+            batch_size,
+        )
+
+    node_ids, node_props_dict = dict_props_to_columns(node_data, node_prop_names)
+    edge_ids, edge_props_dict = dict_props_to_columns(edge_data, edge_prop_names)
 
     if len(node_ids) > 0:
         nodes_arr = np.asarray(node_ids)
@@ -57,65 +117,322 @@ def write_dicts(
     else:
         edges_arr = np.empty((0, 2), dtype=nodes_arr.dtype)
 
-    write_id_arrays(geff_store, nodes_arr, edges_arr, zarr_format=zarr_format)
-
+    roi = None
     if axis_names is not None:
-        node_prop_names = list(node_prop_names)
         for axis in axis_names:
-            if axis not in node_prop_names:
-                node_prop_names.append(axis)
+            if axis not in node_props_dict:
+                node_props_dict[axis] = _absent_column(len(nodes_arr), axis)
+        _check_axes(axis_names, nodes_arr, node_props_dict)
+        roi = calculate_roi({axis: node_props_dict[axis][0] for axis in axis_names}, axis_names)
+    if time_axis is not None:
+        nodes_arr, node_props_dict, time_values = sort_nodes_by_time(
+            nodes_arr, node_props_dict, time_axis
+        )
 
-    node_props_dict = dict_props_to_arr(node_data, node_prop_names)
-    if axis_names is not None:
-        for axis in axis_names:
-            missing_arr = node_props_dict[axis][1]
-            if missing_arr is not None:
-                raise ValueError(
-                    f"Spatiotemporal property '{axis}' not found in : "
-                    f"{nodes_arr[missing_arr].tolist()}"
+    write_id_arrays(geff_store, nodes_arr, edges_arr, zarr_format=zarr_format, encoding=encoding)
+    write_props_arrays(
+        geff_store, "nodes", node_props_dict, zarr_format=zarr_format, encoding=encoding
+    )
+    if time_axis is not None:
+        write_time_index(geff_store, time_values, zarr_format=zarr_format, encoding=encoding)
+
+    write_props_arrays(
+        geff_store, "edges", edge_props_dict, zarr_format=zarr_format, encoding=encoding
+    )
+    if adjacency:
+        write_adjacency_arrays(
+            geff_store, nodes_arr, edges_arr, zarr_format=zarr_format, encoding=encoding
+        )
+    return roi
+
+
+def _write_dict_batches(
+    geff_store: StoreLike,
+    node_data: Iterable[tuple[Any, dict[str, Any]]],
+    edge_data: Iterable[tuple[Any, dict[str, Any]]],
+    node_prop_names: Sequence[str] | None,
+    edge_prop_names: Sequence[str] | None,
+    axis_names: list[str] | None,
+    zarr_format: Literal[2, 3],
+    encoding: EncodingLike,
+    batch_size: int,
+) -> tuple[tuple[float, ...], tuple[float, ...]] | None:
+    """Write the nodes and edges of `write_dicts` in batches of `batch_size` elements."""
+    if batch_size < 1:
+        raise ValueError(f"Batch size must be positive, got {batch_size}")
+    writer = GeffWriter(
+        geff_store,
+        axis_names=axis_names,
+        zarr_format=zarr_format,
+        encoding=encoding,
+        promote_dtypes=True,
+    )
+    node_dtype = np.dtype(np.int64)
+    for group, data, prop_names in [
+        ("nodes", node_data, node_prop_names),
+        ("edges", edge_data, edge_prop_names),
+    ]:
+        append = writer.append_nodes if group == "nodes" else writer.append_edges
+        wanted = set(prop_names) if prop_names is not None else None
+        found: set[str] = set()
+        elements = iter(data)
+        n_rows = 0
+        while True:
+            batch = itertools.islice(elements, batch_size)
+            ids, columns = _collect_columns(batch, wanted, min(batch_size, INITIAL_CAPACITY))
+            if len(ids) == 0:
+                break
+            props = {name: column.to_arr(len(ids)) for name, column in columns.items()}
+            found.update(props)
+            ids_arr = np.asarray(ids)
+            if group == "nodes":
+                # the writer promotes the node ids of later batches, like longer strings
+                node_dtype = (
+                    ids_arr.dtype if n_rows == 0 else np.result_type(node_dtype, ids_arr.dtype)
                 )
-    write_props_arrays(geff_store, "nodes", node_props_dict, zarr_format=zarr_format)
+                _check_axes(axis_names or [], ids_arr, props)
+            elif ids_arr.dtype.kind == "U":
+                # casting to the node dtype would truncate longer string ids
+                ids_arr = ids_arr.astype(np.result_type(node_dtype, ids_arr.dtype), copy=False)
+            else:
+                ids_arr = ids_arr.astype(node_dtype, copy=False)
+            append(ids_arr, props)
+            n_rows += len(ids)
 
-    edge_props_dict = dict_props_to_arr(edge_data, edge_prop_names)
-    write_props_arrays(geff_store, "edges", edge_props_dict, zarr_format=zarr_format)
+        # properties that are not present on any element are written as missing
+        for name in prop_names or []:
+            if name not in found and n_rows > 0:
+                _warn_absent(name)
+                empty_ids = np.empty((0,) if group == "nodes" else (0, 2), dtype=node_dtype)
+                append(empty_ids, {name: (np.zeros(0, dtype=np.int64), None)})
+    writer.close(write_metadata=False)
+    return writer.roi
 
 
-def _determine_default_value(data: Sequence[tuple[Any, dict[str, Any]]], prop_name: str) -> Any:
-    """Determine default value to fill in missing values
+def _check_axes(
+    axis_names: list[str],
+    node_ids: np.ndarray,
+    node_props: dict[str, tuple[np.ndarray, np.ndarray | None]],
+) -> None:
+    """Check that the spatiotemporal properties are present on all nodes."""
+    for axis in axis_names:
+        missing = node_props[axis][1] if axis in node_props else np.ones(len(node_ids), bool)
+        if missing is not None:
+            raise ValueError(
+                f"Spatiotemporal property '{axis}' not found in : {node_ids[missing].tolist()}"
+            )
+
 
-    Find the first non-missing value and then uses the following heuristics:
-    - Native python numerical types (int, float) -> 0
+def _default_value(value: Any) -> Any:
+    """Determine the default value to fill in missing values from a present value
+
+    Uses the following heuristics:
+    - Native python or numpy booleans -> False
+    - Native python or numpy numerical types -> 0
     - Native python string -> ""
     - Otherwise, return the  value, which is definitely the right type and
     shape, but is potentially both confusing and inefficient. Should reconsider in
     the future.
 
-    If there are no non-missing values, warns and then returns 0.
-
     Args:
-        data (Sequence[tuple[Any, dict[str, Any]]]): A sequence of elements and a dictionary
-            holding the properties of that element
-        prop_name (str): The property to get the default value for
+        value (Any): A value of the property that is not missing
 
     Returns:
         Any: A value to use as the default that is the same dtype and shape as the rest
             of the values, for casting to a numpy array without errors.
     """
-    for _, data_dict in data:
-        # find first non-missing value
-        if prop_name in data_dict:
-            value = data_dict[prop_name]
-            if isinstance(value, int | float):
-                return 0
-            elif isinstance(value, str):
-                return ""
+    if isinstance(value, bool | np.bool_):
+        return False
+    elif isinstance(value, int | float | np.number):
+        return 0
+    elif isinstance(value, str):
+        return ""
+    else:
+        return value
+
+
+# the initial number of rows of the columns if the number of elements is not known
+INITIAL_CAPACITY = 1024
+# the python scalar types that are stored in numeric buffers
+_SCALAR_DTYPES: dict[type, np.dtype] = {
+    bool: np.dtype(bool),
+    int: np.dtype(np.int64),
+    float: np.dtype(np.float64),
+}
+
+
+class _Column:
+    """The values of a property, written straight into a preallocated buffer.
+
+    The dtype of the buffer and the default fill value are inferred from the first
+    present value. Python and numpy scalars are stored in a numeric buffer, which is
+    promoted if a value of another type does not fit. Other values, like strings or
+    lists, are stored in an object buffer and converted to an array at the end. The rows
+    with missing values are set in a bit-packed mask.
+    """
+
+    __slots__ = ("default", "missing", "types", "values")
+
+    def __init__(self, value: Any, row: int, capacity: int):
+        self.default = _default_value(value)
+        dtype = _SCALAR_DTYPES.get(type(value))
+        if dtype is None and isinstance(value, np.generic) and value.dtype.kind in "biuf":
+            dtype = value.dtype
+        self.values = np.empty(capacity, dtype=dtype if dtype is not None else object)
+        # the types that are written without checking if the buffer must be promoted
+        self.types = {type(value)}
+        # one bit per row, little endian, with the rows before the first value missing
+        self.missing = np.zeros(-(-capacity // 8), dtype=np.uint8)
+        self.missing[: row // 8] = 0xFF
+        for missing_row in range(row - row % 8, row):
+            self.set_missing(missing_row)
+        self.set(row, value)
+
+    def set(self, row: int, value: Any) -> None:
+        """Write a value of a new type, promoting the buffer if the value does not fit."""
+        values = self.values
+        if values.dtype.kind != "O":
+            value_dtype = _SCALAR_DTYPES.get(type(value))
+            if value_dtype is None and isinstance(value, np.generic):
+                value_dtype = value.dtype
+            if value_dtype is not None and value_dtype.kind in "biuf":
+                dtype = np.result_type(values.dtype, value_dtype)
             else:
-                return value
+                dtype = np.dtype(object)
+            if dtype != values.dtype:
+                values = self.values = values.astype(dtype)
+            if dtype.kind != "O":
+                self.types.add(type(value))
+        try:
+            values[row] = value
+        except OverflowError:
+            # python integers that do not fit into the buffer
+            self.values = values.astype(object)
+            self.values[row] = value
+
+    def set_missing(self, row: int) -> None:
+        """Mark a row as missing."""
+        self.missing[row >> 3] |= 1 << (row & 7)
+
+    def resize(self, capacity: int) -> None:
+        """Grow the buffer and the missing mask to hold `capacity` rows."""
+        values = np.empty(capacity, dtype=self.values.dtype)
+        values[: len(self.values)] = self.values
+        self.values = values
+        missing = np.zeros(-(-capacity // 8), dtype=np.uint8)
+        missing[: len(self.missing)] = self.missing
+        self.missing = missing
+
+    def to_arr(self, n_rows: int) -> tuple[np.ndarray, np.ndarray | None]:
+        """Convert the first `n_rows` rows to (values, missing) arrays, filling the
+        missing values with the default value."""
+        missing = np.unpackbits(self.missing, count=n_rows, bitorder="little").view(bool)
+        values = self.values[:n_rows]
+        has_missing = bool(missing.any())
+        if values.dtype.kind == "O":
+            # set one by one, the default can be a sequence
+            for row in np.flatnonzero(missing).tolist():
+                values[row] = self.default
+            values = np.asarray(values.tolist())
+        else:
+            if len(self.values) > n_rows:
+                # do not hold on to the unused capacity
+                values = values.copy()
+            if has_missing:
+                values[missing] = self.default
+        return values, missing if has_missing else None
+
+
+def _warn_absent(prop_name: str) -> None:
     warnings.warn(
         f"Property {prop_name} is not present on any graph elements. Using 0 as the default.",
-        stacklevel=2,
+        stacklevel=4,
     )
-    return 0
+
+
+def _absent_column(n_rows: int, prop_name: str) -> tuple[np.ndarray, np.ndarray | None]:
+    """The (values, missing) arrays of a property that is not present on any element.
+
+    If there are elements, warns and fills the values with 0.
+    """
+    if n_rows == 0:
+        return np.asarray([]), None
+    _warn_absent(prop_name)
+    return np.zeros(n_rows, dtype=np.int64), np.ones(n_rows, dtype=bool)
+
+
+def _collect_columns(
+    data: Iterable[tuple[Any, dict[str, Any]]], wanted: set[str] | None, capacity: int
+) -> tuple[list[Any], dict[str, _Column]]:
+    """Read the ids and the wanted properties of dict-like elements into columns, see
+    `dict_props_to_columns`. The columns start with `capacity` rows."""
+    capacity = max(capacity, 1)
+    ids = []
+    columns: dict[str, _Column] = {}
+    # a live view of the names of the columns
+    known = columns.keys()
+    for row, (element_id, data_dict) in enumerate(data):
+        ids.append(element_id)
+        if row == capacity:
+            capacity *= 2
+            for existing in columns.values():
+                existing.resize(capacity)
+        for name, value in data_dict.items():
+            column = columns.get(name)
+            if column is None:
+                if wanted is None or name in wanted:
+                    columns[name] = _Column(value, row, capacity)
+            elif type(value) in column.types:
+                try:
+                    column.values[row] = value
+                except OverflowError:
+                    column.set(row, value)
+            else:
+                column.set(row, value)
+        # most elements have all properties, and skip looking for missing ones
+        if data_dict.keys() != known:
+            for name, column in columns.items():
+                if name not in data_dict:
+                    column.set_missing(row)
+    return ids, columns
+
+
+def dict_props_to_columns(
+    data: Iterable[tuple[Any, dict[str, Any]]],
+    prop_names: Sequence[str] | None = None,
+) -> tuple[list[Any], dict[str, tuple[np.ndarray, np.ndarray | None]]]:
+    """Collect the ids and all properties of dict-like elements in a single pass.
+
+    Every element is visited once, and each of its properties is written into the
+    buffer of that property, see `_Column`. The buffers are preallocated if the number of
+    elements is known, and otherwise grow by doubling. Values of a type that fits the
+    buffer are written without any conversion, and only elements that do not have
+    exactly the properties seen so far are checked for missing properties.
+
+    Args:
+        data (Iterable[tuple[Any, dict[str, Any]]]): An iterable of elements and a
+            dictionary holding the properties of that element. It is only iterated once.
+        prop_names (Sequence[str] | None): The properties to include in the dictionary of
+            property arrays. If None, all properties found on any element are included,
+            in the order they are first found.
+
+    Returns:
+        tuple[list[Any], dict[str, tuple[np.ndarray, np.ndarray | None]]]: The ids of the
+            elements, and a dictionary from property names to a tuple of (value, missing)
+            arrays, where the missing array can be None.
+    """
+    capacity = len(data) if isinstance(data, Sized) else INITIAL_CAPACITY
+    wanted = set(prop_names) if prop_names is not None else None
+    ids, columns = _collect_columns(data, wanted, capacity)
+
+    n_rows = len(ids)
+    if prop_names is None:
+        prop_names = list(columns)
+    props_dict = {
+        name: columns[name].to_arr(n_rows) if name in columns else _absent_column(n_rows, name)
+        for name in prop_names
+    }
+    return ids, props_dict
 
 
 def dict_props_to_arr(
@@ -136,25 +453,4 @@ def dict_props_to_arr(
         dict[tuple[np.ndarray, np.ndarray | None]]: A dictionary from property names
             to a tuple of (value, missing) arrays, where the missing array can be None.
     """
-    props_dict = {}
-    for name in prop_names:
-        values = []
-        missing = []
-        # iterate over the data and checks for missing content
-        missing_any = False
-        # to ensure valid dtype of missing, take first non-missing value
-        default_val = None
-        for _, data_dict in data:
-            if name in data_dict:
-                values.append(data_dict[name])
-                missing.append(False)
-            else:
-                if default_val is None:
-                    default_val = _determine_default_value(data, name)
-                values.append(default_val)
-                missing.append(True)
-                missing_any = True
-        values_arr = np.asarray(values)
-        missing_arr = np.asarray(missing, dtype=bool) if missing_any else None
-        props_dict[name] = (values_arr, missing_arr)
-    return props_dict
+    return dict_props_to_columns(data, prop_names)[1]
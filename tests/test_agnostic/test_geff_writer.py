@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+import zarr
+
+from geff.geff_reader import read_to_memory
+from geff.geff_writer import GeffWriter
+from geff.utils import validate
+from geff.write_arrays import ArrayEncoding
+
+ZARR_3 = zarr.__version__.startswith("3")
+
+
+@pytest.mark.parametrize("zarr_format", [2, 3] if ZARR_3 else [2])
+def test_geff_writer(tmp_path, zarr_format):
+    path = tmp_path / "test.zarr"
+    encoding = ArrayEncoding(chunk_size=4)
+    with GeffWriter(
+        path,
+        axis_names=["t", "x"],
+        axis_types=["time", "space"],
+        zarr_format=zarr_format,
+        encoding=encoding,
+    ) as writer:
+        for t in range(3):
+            ids = np.arange(5 * t, 5 * t + 5, dtype=np.uint32)
+            props = {"t": (np.full(5, t), None), "x": (np.linspace(0, 1, 5) + t, None)}
+            if t == 1 and zarr_format == 2:
+                props["label"] = (np.array(["a", "b", "c", "d", "e"]), None)
+            if t > 0:
+                props["score"] = (np.arange(5, dtype=float), np.arange(5) == 0)
+            writer.append_nodes(ids, props)
+            if t > 0:
+                edges = np.stack([ids - 5, ids], axis=1)
+                writer.append_edges(edges, {"weight": (np.ones(5, dtype=np.float32), None)})
+
+    validate(path)
+    graph = read_to_memory(path)
+    np.testing.assert_array_equal(graph["node_ids"], np.arange(15))
+    assert graph["node_ids"].dtype == np.uint32
+    assert graph["edge_ids"].shape == (10, 2)
+    np.testing.assert_array_equal(graph["node_props"]["t"]["values"], np.repeat(np.arange(3), 5))
+    assert "missing" not in graph["node_props"]["t"]
+
+    if zarr_format == 2:
+        label = graph["node_props"]["label"]
+        np.testing.assert_array_equal(label["missing"], np.repeat([True, False, True], 5))
+        np.testing.assert_array_equal(label["values"][5:10], ["a", "b", "c", "d", "e"])
+        assert "label" not in graph["metadata"].node_props_metadata
+    score = graph["node_props"]["score"]
+    np.testing.assert_array_equal(score["missing"], (np.arange(15) < 5) | (np.arange(15) % 5 == 0))
+    np.testing.assert_array_equal(score["values"][5:10], np.arange(5))
+    assert "missing" not in graph["edge_props"]["weight"]
+
+    metadata = graph["metadata"]
+    assert metadata.directed
+    assert [axis.min for axis in metadata.axes] == [0, 0]
+    assert [axis.max for axis in metadata.axes] == [2, 3]
+    assert metadata.node_props_metadata["score"].dtype == "float64"
+    assert metadata.edge_props_metadata["weight"].dtype == "float32"
+    assert zarr.open_array(path / "nodes/ids", mode="r").chunks == (4,)
+
+
+def test_geff_writer_empty(tmp_path):
+    path = tmp_path / "test.zarr"
+    with GeffWriter(path, directed=False):
+        pass
+    validate(path)
+    graph = read_to_memory(path)
+    assert graph["node_ids"].shape == (0,)
+    assert graph["edge_ids"].shape == (0, 2)
+    assert not graph["metadata"].directed
+
+
+def test_geff_writer_errors(tmp_path):
+    writer = GeffWriter(tmp_path / "test.zarr", axis_names=["t"])
+    with pytest.raises(ValueError, match="Spatiotemporal property 't' not found"):
+        writer.append_nodes([0, 1], {"t": ([0, 1], [False, True])})
+    with pytest.raises(ValueError, match="Edge ids must have shape"):
+        writer.append_edges([0, 1])
+    with pytest.raises(ValueError, match="has 1 values for 2 nodes"):
+        writer.append_nodes([0, 1], {"t": ([0], None)})
+
+    writer.append_nodes(np.array([0, 1]), {"t": (np.array([0, 1]), None)})
+    with pytest.raises(ValueError, match="Use the same dtype in every batch"):
+        writer.append_nodes(np.array([2]), {"t": (np.array([0.5]), None)})
+    writer.close()
+    with pytest.raises(ValueError, match="closed GeffWriter"):
+        writer.append_nodes(np.array([2]), {"t": (np.array([2]), None)})
+
+    # a rejected batch leaves the previous batches as they are
+    path = tmp_path / "rejected.zarr"
+    with GeffWriter(path) as writer:
+        writer.append_nodes(np.arange(3), {"b": (np.zeros(3), None), "a": (np.arange(3), None)})
+        with pytest.raises(ValueError, match="Use the same dtype in every batch"):
+            writer.append_nodes(
+                np.arange(3, 6), {"b": (np.ones(3), None), "a": (np.array(["x", "y", "z"]), None)}
+            )
+        with pytest.raises(ValueError, match="Cannot append values of shape"):
+            writer.append_nodes(np.arange(3, 6), {"b": (np.ones((3, 2)), None)})
+        with pytest.raises(ValueError, match="has a missing array of shape"):
+            writer.append_nodes(np.arange(3, 6), {"b": (np.ones(3), np.zeros(2))})
+        writer.append_nodes(np.arange(3, 5), {"a": (np.arange(3, 5), None)})
+    graph = read_to_memory(path)
+    np.testing.assert_array_equal(graph["node_ids"], np.arange(5))
+    np.testing.assert_array_equal(graph["node_props"]["a"]["values"], np.arange(5))
+    np.testing.assert_array_equal(
+        graph["node_props"]["b"]["missing"], [False, False, False, True, True]
+    )
+
+    # an interrupted write is not finished into a geff
+    path = tmp_path / "interrupted.zarr"
+    with pytest.raises(RuntimeError), GeffWriter(path) as writer:
+        writer.append_nodes(np.array([0, 1]))
+        raise RuntimeError
+    assert "geff" not in zarr.open_group(path, mode="r").attrs
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from geff.id_index import IdIndex, edges_within
+
+
+@pytest.mark.parametrize("strategy", ["dense", "hash", "sorted"])
+@pytest.mark.parametrize("dtype", ["int8", "uint16", "int64", "uint64"])
+def test_positions(strategy, dtype):
+    ids = np.array([100, 9, 3, 5], dtype=dtype)
+    values = np.array([[0, 3], [127, 9], [100, 4]], dtype="int16")
+    expected = [[-1, 2], [-1, 1], [0, -1]]
+
+    index = IdIndex(ids, strategy)
+    assert index.strategy == strategy
+    np.testing.assert_array_equal(index.positions(values), expected)
+    np.testing.assert_array_equal(index.contains(values), np.array(expected) >= 0)
+
+
+def test_choose_strategy():
+    assert IdIndex(np.arange(100)[::-1]).strategy == "dense"
+    assert IdIndex(np.array([20_000, 1, 10_000])).strategy == "hash"
+    assert IdIndex(np.array(["a", "c", "b"])).strategy == "sorted"
+    assert IdIndex(np.array([], dtype=int)).strategy == "dense"
+
+
+@pytest.mark.parametrize("strategy", ["dense", "hash", "sorted"])
+def test_empty(strategy):
+    index = IdIndex(np.array([], dtype=int), strategy)
+    np.testing.assert_array_equal(index.positions(np.array([1, 2])), [-1, -1])
+    np.testing.assert_array_equal(index.contains(np.array([1, 2])), [False, False])
+    assert index.positions(np.empty((0, 2), dtype=int)).shape == (0, 2)
+
+
+def test_large_and_negative_ids():
+    index = IdIndex(np.array([-5, -3, 0]), "dense")
+    np.testing.assert_array_equal(
+        index.positions(np.array([0, 3, 250], dtype="uint8")), [2, -1, -1]
+    )
+    np.testing.assert_array_equal(index.positions(np.array([-3, -4, -6])), [1, -1, -1])
+
+    big = np.iinfo(np.uint64).max
+    for strategy in ["dense", "hash", "sorted"]:
+        index = IdIndex(np.array([big - 1, big], dtype=np.uint64), strategy)
+        np.testing.assert_array_equal(
+            index.positions(np.array([0, big, big - 2], dtype=np.uint64)), [-1, 1, -1]
+        )
+
+
+def test_string_ids():
+    index = IdIndex(np.array(["b", "a", "d"]))
+    np.testing.assert_array_equal(index.positions(np.array(["a", "c", "d"])), [1, -1, 2])
+
+
+def test_invalid_strategy():
+    with pytest.raises(ValueError, match="dense lookup requires integer ids"):
+        IdIndex(np.array([1.0, 2.0]), "dense")
+    with pytest.raises(ValueError, match="Ids must be one dimensional"):
+        IdIndex(np.array([[1, 2]]))
+
+
+def test_edges_within():
+    rng = np.random.default_rng(0)
+    edge_ids = rng.integers(0, 1000, size=(5000, 2))
+    for node_ids in [
+        np.arange(0, 1000, 2),
+        rng.permutation(1000)[:10],
+        rng.permutation(1000)[:100] * 1000,
+        np.array([], dtype=int),
+    ]:
+        np.testing.assert_array_equal(
+            edges_within(node_ids, edge_ids), np.isin(edge_ids, node_ids).all(axis=1)
+        )
@@ -4,7 +4,10 @@ import numpy as np
 import pytest
 import zarr
 
-from geff.utils import validate
+import geff.utils
+from geff.metadata_schema import GeffMetadata
+from geff.utils import compute_adjacency, compute_chunk_stats, validate
+from geff.write_arrays import ArrayEncoding, write_arrays
 
 
 def test_validate(tmp_path):
@@ -200,3 +203,216 @@ def test_validate(tmp_path):
 
     # Everything passes
     validate(zpath)
+
+
+def test_compute_chunk_stats():
+    values = np.array([3, 1, 2, 8, 5, 4, 7], dtype="int16")
+    chunk_min, chunk_max = compute_chunk_stats(values, 3)
+    np.testing.assert_array_equal(chunk_min, [1, 4, 7])
+    np.testing.assert_array_equal(chunk_max, [3, 8, 7])
+    assert chunk_min.dtype == values.dtype
+
+    # missing values and nans are ignored, fully missing chunks get an empty range
+    values = np.array([3.0, np.nan, 2.0, 8.0, 5.0, 4.0])
+    missing = np.array([0, 0, 1, 1, 1, 1], dtype=bool)
+    chunk_min, chunk_max = compute_chunk_stats(values, 3, missing)
+    np.testing.assert_array_equal(chunk_min, [3.0, np.inf])
+    np.testing.assert_array_equal(chunk_max, [3.0, -np.inf])
+
+    # multidimensional values are only reduced over the first axis
+    values = np.array([[0, 5], [1, 4], [2, 3]])
+    chunk_min, chunk_max = compute_chunk_stats(values, 2)
+    np.testing.assert_array_equal(chunk_min, [[0, 4], [2, 3]])
+    np.testing.assert_array_equal(chunk_max, [[1, 5], [2, 3]])
+
+    # booleans are ordered, complex values are not
+    chunk_min, chunk_max = compute_chunk_stats(np.array([True, True, False]), 2)
+    np.testing.assert_array_equal(chunk_min, [True, False])
+    np.testing.assert_array_equal(chunk_max, [True, False])
+    assert compute_chunk_stats(np.array([1 + 2j, 3j]), 2) is None
+    assert compute_chunk_stats(np.array(["a", "b"]), 2) is None
+
+
+def test_validate_chunk_stats(tmp_path):
+    zpath = tmp_path / "test.zarr"
+    node_ids = np.arange(10)
+    t = np.arange(10, dtype="float32")
+    write_arrays(
+        zpath,
+        node_ids,
+        {"t": (t, None), "label": (np.array(["a"] * 10), None)},
+        np.array([[0, 1]]),
+        None,
+        GeffMetadata(geff_version="0.0.1", directed=True),
+        chunk_stats=True,
+    )
+    z = zarr.open(zpath)
+    assert "chunk_min" in z["nodes/props/t"]
+    assert "chunk_min" not in z["nodes/props/label"]
+    validate(zpath)
+
+    assert validate(zpath, level="deep").valid
+
+    # complex properties are written without statistics
+    cpath = tmp_path / "complex.zarr"
+    props = {"c": (t + 1j * t, None), "flag": (node_ids % 2 == 0, node_ids == 3)}
+    with pytest.warns(UserWarning, match="is not supported by Java Zarr"):
+        write_arrays(
+            cpath,
+            node_ids,
+            props,
+            np.array([[0, 1]]),
+            None,
+            GeffMetadata(geff_version="0.0.1", directed=True),
+            chunk_stats=True,
+        )
+    z_complex = zarr.open(cpath)
+    assert "chunk_min" not in z_complex["nodes/props/c"]
+    np.testing.assert_array_equal(z_complex["nodes/props/flag/chunk_min"][:], [False])
+    np.testing.assert_array_equal(z_complex["nodes/props/flag/chunk_max"][:], [True])
+    assert validate(cpath, level="deep").valid
+
+    # the values of the statistics are only compared to the values by a deep validation
+    z["nodes/props/t/chunk_max"] = np.zeros_like(z["nodes/props/t/chunk_max"][:])
+    validate(zpath)
+    report = validate(zpath, level="deep")
+    assert [issue.check for issue in report.issues] == ["chunk_stats"]
+    assert report.issues[0].message == "Node property t chunk_max does not match the values chunks"
+
+    z["nodes/props/t/chunk_max"] = np.zeros((2, 3), dtype="float32")
+    with pytest.raises(AssertionError, match=r"chunk_max has shape \(2, 3\), expected \(1,\)"):
+        validate(zpath)
+    z["nodes/props/t/chunk_max"] = np.array(["a"])
+    with pytest.raises(
+        AssertionError, match="chunk_max must have a boolean, integer or float dtype"
+    ):
+        validate(zpath)
+
+    del z["nodes/props/t"]["chunk_max"]
+    with pytest.raises(
+        AssertionError, match="Node property t must have both chunk_min and chunk_max arrays"
+    ):
+        validate(zpath)
+
+
+def test_compute_adjacency():
+    node_ids = np.array([7, 3, 5])
+    edge_ids = np.array([[3, 7], [7, 5], [3, 5], [5, 3]])
+    adjacency = compute_adjacency(node_ids, edge_ids)
+    # node 7 has out-edge 1, node 3 has out-edges 0 and 2, node 5 has out-edge 3
+    np.testing.assert_array_equal(adjacency["out_indptr"], [0, 1, 3, 4])
+    np.testing.assert_array_equal(adjacency["out_indices"], [1, 0, 2, 3])
+    np.testing.assert_array_equal(adjacency["in_indptr"], [0, 1, 2, 4])
+    np.testing.assert_array_equal(adjacency["in_indices"], [0, 3, 1, 2])
+
+    empty = compute_adjacency(np.array([], dtype=int), np.empty((0, 2), dtype=int))
+    np.testing.assert_array_equal(empty["out_indptr"], [0])
+    assert len(empty["in_indices"]) == 0
+
+    with pytest.raises(ValueError, match="not in the node ids"):
+        compute_adjacency(node_ids, np.array([[3, 4]]))
+
+
+def test_validate_adjacency(tmp_path):
+    zpath = tmp_path / "test.zarr"
+    write_arrays(
+        zpath,
+        np.arange(5),
+        {"t": (np.arange(5), None)},
+        np.array([[0, 1], [1, 2], [3, 2]]),
+        None,
+        GeffMetadata(geff_version="0.0.1", directed=True),
+        adjacency=True,
+    )
+    validate(zpath)
+
+    assert validate(zpath, level="deep").valid
+
+    # the values of the index are only compared to the ids by a deep validation
+    z = zarr.open(zpath)
+    z["edges/adjacency/in_indices"] = np.array([0, 2, 1])
+    validate(zpath)
+    report = validate(zpath, level="deep")
+    assert [issue.check for issue in report.issues] == ["adjacency"]
+    assert "edges adjacency in_indices does not match" in report.issues[0].message
+
+    z["edges/adjacency/out_indptr"] = np.array([0, 1, 2, 2, 2, 2])
+    with pytest.raises(AssertionError, match="out_indptr must start at 0 and end at the number"):
+        validate(zpath)
+    z["edges/adjacency/out_indptr"] = np.array([0, 1, 2, 3])
+    with pytest.raises(AssertionError, match=r"out_indptr has shape \(4,\), expected \(6,\)"):
+        validate(zpath)
+    z["edges/adjacency/out_indptr"] = np.array([0, 1, 2, 2, 3, 3], dtype=float)
+    with pytest.raises(AssertionError, match="out_indptr must have an integer dtype"):
+        validate(zpath)
+
+    del z["edges/adjacency"]["in_indptr"]
+    with pytest.raises(AssertionError, match="edges adjacency group must contain"):
+        validate(zpath)
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_validate_deep(tmp_path, monkeypatch, workers):
+    # one batch per chunk of two rows, so that edges are repeated across batches
+    monkeypatch.setattr(geff.utils, "DEEP_BATCH_ROWS", 1)
+    zpath = tmp_path / "test.zarr"
+    write_arrays(
+        zpath,
+        np.array([1, 2, 3, 3, 5, 7]),
+        {"t": (np.arange(6), None)},
+        np.array([[1, 2], [2, 3], [1, 9], [5, 5], [2, 1], [3, 2], [2, 3], [1, 2]]),
+        None,
+        GeffMetadata(geff_version="0.0.1", directed=True),
+        encoding=ArrayEncoding(chunk_size=2),
+    )
+    # the structure is valid
+    validate(zpath)
+
+    report = validate(zpath, level="deep", workers=workers)
+    assert not report.valid
+    assert (report.n_nodes, report.n_edges) == (6, 8)
+    issues = {issue.check: issue for issue in report.issues}
+    assert issues.keys() == {
+        "unique_node_ids",
+        "edges_reference_nodes",
+        "self_edges",
+        "repeated_edges",
+    }
+    assert issues["unique_node_ids"].examples == [3]
+    assert issues["edges_reference_nodes"].examples == [[1, 9]]
+    assert issues["self_edges"].examples == [5]
+    assert issues["repeated_edges"].count == 2
+    assert issues["repeated_edges"].examples == [[1, 2], [2, 3]]
+
+    # (1, 2) and (2, 1), and (2, 3) and (3, 2) are also repeated in an undirected graph
+    GeffMetadata(geff_version="0.0.1", directed=False).write(zpath)
+    report = validate(zpath, level="deep", workers=workers)
+    issues = {issue.check: issue for issue in report.issues}
+    assert issues["repeated_edges"].examples == [[1, 2], [2, 3]]
+
+
+def test_validate_deep_report(tmp_path):
+    zpath = tmp_path / "test.zarr"
+    node_ids = np.arange(10)
+    write_arrays(
+        zpath,
+        node_ids,
+        {"t": (node_ids, None)},
+        np.array([[0, 1], [1, 2]]),
+        None,
+        GeffMetadata(geff_version="0.0.1", directed=True),
+    )
+    report = validate(zpath, level="deep")
+    assert report.valid
+    assert (report.n_nodes, report.n_edges) == (10, 2)
+
+    # structure violations are reported instead of raised, without checking the ids
+    z = zarr.open(zpath)
+    z["nodes/props/t/values"] = np.arange(5)
+    report = validate(zpath, level="deep")
+    assert len(report.issues) == 1
+    assert report.issues[0].check == "structure"
+    assert "does not match id length 10" in report.issues[0].message
+
+    with pytest.raises(ValueError, match="Unknown validation level"):
+        validate(zpath, level="shallow")  # type: ignore[call-overload]
@@ -1,8 +1,12 @@
 import numpy as np
+import pytest
 import zarr
 
-from geff.metadata_schema import GeffMetadata
-from geff.write_arrays import write_arrays
+from geff.metadata_schema import GeffMetadata, axes_from_lists
+from geff.utils import validate
+from geff.write_arrays import ArrayEncoding, get_encoding, write_arrays
+
+ZARR_3 = zarr.__version__.startswith("3")
 
 
 class TestWriteArrays:
@@ -47,3 +51,132 @@ class TestWriteArrays:
 
     # TODO: test properties helper. It's covered by networkx tests now, so I'm okay merging,
     # but we should do it when we have time.
+
+    def test_write_arrays_sort_by_time(self, tmp_path):
+        geff_path = tmp_path / "test.geff"
+        node_ids = np.array([10, 11, 12, 13, 14], dtype=np.int32)
+        t = np.array([2, 0, 1, 0, 2], dtype=np.int32)
+        score = np.array([0.2, 0.0, 0.1, 0.3, 0.4])
+        score_missing = np.array([0, 0, 1, 0, 0], dtype=bool)
+        metadata = GeffMetadata(
+            geff_version="0.0.1",
+            directed=True,
+            axes=axes_from_lists(["t"], axis_types=["time"], axis_units=["second"]),
+        )
+
+        write_arrays(
+            geff_store=geff_path,
+            node_ids=node_ids,
+            node_props={"t": (t, None), "score": (score, score_missing)},
+            edge_ids=np.array([[11, 12], [12, 10]], dtype=np.int32),
+            edge_props=None,
+            metadata=metadata,
+            sort_by_time=True,
+        )
+
+        root = zarr.open(str(geff_path))
+        # stable sort by time
+        np.testing.assert_array_equal(root["nodes/ids"][:], [11, 13, 12, 10, 14])
+        np.testing.assert_array_equal(root["nodes/props/t/values"][:], [0, 0, 1, 2, 2])
+        np.testing.assert_array_equal(root["nodes/props/score/values"][:], score[[1, 3, 2, 0, 4]])
+        np.testing.assert_array_equal(root["nodes/props/score/missing"][:], [0, 0, 1, 0, 0])
+        np.testing.assert_array_equal(root["nodes/time_index/frames"][:], [0, 1, 2])
+        np.testing.assert_array_equal(root["nodes/time_index/offsets"][:], [0, 2, 3, 5])
+        validate(geff_path)
+        assert validate(geff_path, level="deep").valid
+
+        # the time index is only compared to the time property by a deep validation
+        root["nodes/time_index/offsets"] = np.array([0, 1, 3, 5])
+        validate(geff_path)
+        report = validate(geff_path, level="deep")
+        assert [issue.check for issue in report.issues] == ["time_index"]
+        assert "time_index does not match the time property" in report.issues[0].message
+
+        root["nodes/time_index/offsets"] = np.array([0, 3, 1, 5])
+        with pytest.raises(AssertionError, match="offsets must be monotonically increasing"):
+            validate(geff_path)
+        root["nodes/time_index/offsets"] = np.array([0, 2, 3, 4])
+        with pytest.raises(AssertionError, match="offsets must start at 0 and end at the number"):
+            validate(geff_path)
+        root["nodes/time_index/offsets"] = np.array([0, 2, 3, 5])
+        root["nodes/time_index/frames"] = np.array([0, 2, 1])
+        with pytest.raises(AssertionError, match="frames must be strictly increasing"):
+            validate(geff_path)
+
+    def test_write_arrays_sort_by_time_no_time_axis(self, tmp_path):
+        node_ids = np.array([1, 2, 3], dtype=np.int32)
+        with pytest.raises(ValueError, match="metadata has no axis of type 'time'"):
+            write_arrays(
+                geff_store=tmp_path / "test.geff",
+                node_ids=node_ids,
+                node_props={"t": (node_ids, None)},
+                edge_ids=np.empty((0, 2), dtype=np.int32),
+                edge_props=None,
+                metadata=GeffMetadata(geff_version="0.0.1", directed=True),
+                sort_by_time=True,
+            )
+
+    def test_write_arrays_encoding(self, tmp_path):
+        geff_path = tmp_path / "test.geff"
+        node_ids = np.arange(10, dtype=np.int64)
+        edge_ids = np.stack([node_ids[:-1], node_ids[1:]], axis=1)
+        score = np.linspace(0, 1, 10)
+        write_arrays(
+            geff_store=geff_path,
+            node_ids=node_ids,
+            node_props={"score": (score, score > 0.5)},
+            edge_ids=edge_ids,
+            edge_props={"score": (score[:-1], None)},
+            metadata=GeffMetadata(geff_version="0.0.1", directed=True),
+            encoding={"nodes": ArrayEncoding(chunk_size=4, codec="lz4", shuffle=False)},
+        )
+        validate(geff_path)
+
+        root = zarr.open_group(str(geff_path), mode="r")
+        assert root["nodes/ids"].chunks == (4,)
+        assert root["nodes/props/score/missing"].chunks == (4,)
+        # groups that are not in the mapping use the default encoding
+        assert root["edges/ids"].chunks == (9, 2)
+        np.testing.assert_array_equal(root["nodes/props/score/values"][:], score)
+        compressor = root["nodes/ids"].compressors[0] if ZARR_3 else root["nodes/ids"].compressor
+        assert compressor.cname == "lz4"
+
+    @pytest.mark.skipif(not ZARR_3, reason="sharding requires zarr 3")
+    def test_write_arrays_sharding(self, tmp_path):
+        geff_path = tmp_path / "test.geff"
+        node_ids = np.arange(100, dtype=np.int64)
+        kwargs = {
+            "node_ids": node_ids,
+            "node_props": {"t": (node_ids % 5, None)},
+            "edge_ids": np.empty((0, 2), dtype=np.int64),
+            "edge_props": None,
+            "metadata": GeffMetadata(geff_version="0.0.1", directed=True),
+            "encoding": ArrayEncoding(chunk_size=8, shard_size=32),
+        }
+        write_arrays(geff_store=geff_path, zarr_format=3, **kwargs)
+        root = zarr.open_group(str(geff_path), mode="r")
+        assert root["nodes/ids"].chunks == (8,)
+        assert root["nodes/ids"].shards == (32,)
+        np.testing.assert_array_equal(root["nodes/props/t/values"][:], node_ids % 5)
+
+        with pytest.raises(ValueError, match="Sharding requires writing with zarr_format=3"):
+            write_arrays(geff_store=tmp_path / "v2.geff", zarr_format=2, **kwargs)
+
+
+def test_array_encoding():
+    assert ArrayEncoding().chunk_size == 2**18
+    with pytest.raises(ValueError, match="must be a multiple of the chunk size"):
+        ArrayEncoding(chunk_size=10, shard_size=25)
+    with pytest.raises(ValueError):
+        ArrayEncoding(codec="gzip")
+
+    encoding = ArrayEncoding(chunk_size=10)
+    assert get_encoding(encoding, "edges") is encoding
+    assert get_encoding({"edges": encoding}, "edges") is encoding
+    assert get_encoding({"edges": encoding}, "nodes") == ArrayEncoding()
+    assert get_encoding(None, "nodes") == ArrayEncoding()
+
+    raw = ArrayEncoding(layout="raw")
+    assert raw.chunk_size is None and raw.codec is None
+    with pytest.raises(ValueError, match="raw layout cannot have"):
+        ArrayEncoding(layout="raw", codec="zstd")
@@ -1,7 +1,14 @@
 import numpy as np
 import pytest
 
-from geff.write_dicts import dict_props_to_arr
+from geff.geff_reader import read_to_memory
+from geff.metadata_schema import GeffMetadata
+from geff.write_dicts import (
+    INITIAL_CAPACITY,
+    dict_props_to_arr,
+    dict_props_to_columns,
+    write_dicts,
+)
 
 
 @pytest.fixture
@@ -35,5 +42,107 @@ def test_dict_prop_to_arr(data, data_type, expected):
     np.testing.assert_array_equal(values, ex_values)
 
 
+def test_dict_props_to_columns(data):
+    # a generator is only iterated once
+    ids, props_dict = dict_props_to_columns(iter(data))
+    assert ids == [0, 127, 1]
+    assert list(props_dict) == ["num", "str", "str_arr", "num_arr"]
+    np.testing.assert_array_equal(props_dict["num"][0], [1, 5, 6])
+    assert props_dict["num"][1] is None
+    np.testing.assert_array_equal(props_dict["num_arr"][0], [[1, 2], [1, 2], [1, 2]])
+    np.testing.assert_array_equal(props_dict["num_arr"][1], [True, True, False])
+
+    with pytest.warns(UserWarning, match="Property flag is not present"):
+        _, props_dict = dict_props_to_columns(data, ["str", "flag"])
+    assert list(props_dict) == ["str", "flag"]
+    np.testing.assert_array_equal(props_dict["flag"][1], [True, True, True])
+
+    _, props_dict = dict_props_to_columns([(0, {"flag": True}), (1, {}), (2, {"flag": 2.5})])
+    np.testing.assert_array_equal(props_dict["flag"][0], [1.0, 0.0, 2.5])
+    np.testing.assert_array_equal(props_dict["flag"][1], [False, True, False])
+
+
 # TODO: test write_dicts (it is pretty solidly covered by networkx and write_array tests,
 # so I'm okay merging without, but we should do it when we have time)
+
+
+def test_dict_props_to_columns_buffers():
+    # a generator longer than the initial capacity grows the buffers
+    n_rows = INITIAL_CAPACITY * 2 + 1
+    data = (
+        (row, {"flag": True, "x": row} if row % 3 else {"x": row * 0.5}) for row in range(n_rows)
+    )
+    ids, props_dict = dict_props_to_columns(data)
+    assert len(ids) == n_rows
+    flag, flag_missing = props_dict["flag"]
+    # the default of a bool property is False, not 0
+    assert flag.dtype == bool
+    np.testing.assert_array_equal(flag, np.arange(n_rows) % 3 != 0)
+    np.testing.assert_array_equal(flag_missing, np.arange(n_rows) % 3 == 0)
+    # integer values are promoted once a float value is found
+    x, x_missing = props_dict["x"]
+    assert x.dtype == np.float64
+    assert x_missing is None
+    np.testing.assert_array_equal(x[:4], [0.0, 1, 2, 1.5])
+
+    data = [(0, {"a": 1, "b": np.float32(1)}), (1, {"a": "one", "b": 2**70})]
+    _, props_dict = dict_props_to_columns(data)
+    np.testing.assert_array_equal(props_dict["a"][0], ["1", "one"])
+    assert props_dict["b"][0].tolist() == [1.0, 2**70]
+
+
+def test_write_dicts_batches(tmp_path):
+    def nodes():
+        for node in range(10):
+            # the x property becomes float, and the label longer, in later batches
+            props = {"t": node, "x": node if node < 4 else node + 0.5}
+            if node % 4 == 1:
+                props["label"] = "a" * node
+            yield node, props
+
+    def edges():
+        for node in range(9):
+            yield (node, node + 1), ({"score": 1.0} if node > 5 else {})
+
+    kwargs = {"node_prop_names": None, "edge_prop_names": ["score", "color"], "axis_names": ["t"]}
+    with pytest.warns(UserWarning, match="Property color is not present"):
+        roi = write_dicts(tmp_path / "batches.zarr", nodes(), edges(), batch_size=4, **kwargs)
+    with pytest.warns(UserWarning, match="Property color is not present"):
+        expected_roi = write_dicts(tmp_path / "memory.zarr", list(nodes()), edges(), **kwargs)
+    assert roi == expected_roi
+
+    for path in ["batches.zarr", "memory.zarr"]:
+        GeffMetadata(geff_version="0.0.1", directed=True).write(tmp_path / path)
+    graph = read_to_memory(tmp_path / "batches.zarr", validate=False)
+    expected = read_to_memory(tmp_path / "memory.zarr", validate=False)
+    np.testing.assert_array_equal(graph["node_ids"], expected["node_ids"])
+    np.testing.assert_array_equal(graph["edge_ids"], expected["edge_ids"])
+    for group in ["node_props", "edge_props"]:
+        assert graph[group].keys() == expected[group].keys()
+        for name, prop in expected[group].items():
+            assert graph[group][name]["values"].dtype == prop["values"].dtype
+            np.testing.assert_array_equal(graph[group][name]["values"], prop["values"])
+            np.testing.assert_array_equal(graph[group][name].get("missing"), prop.get("missing"))
+
+    with pytest.raises(
+        ValueError, match="Spatiotemporal property 'y' not found in : \\[0, 1, 2, 3\\]"
+    ):
+        write_dicts(tmp_path / "error.zarr", nodes(), [], None, None, ["y"], batch_size=4)
+    with pytest.raises(ValueError, match="cannot sort by time"):
+        write_dicts(tmp_path / "error.zarr", nodes(), [], None, None, time_axis="t", batch_size=4)
+
+
+def test_write_dicts_batches_string_ids(tmp_path):
+    # the node ids get longer in the last batch, the edges are as long as the first
+    # batch in one graph and as long as the last batch in the other
+    nodes = [("a", {}), ("b", {}), ("cc", {})]
+    for name, edges in [
+        ("long.zarr", [(("a", "cc"), {}), (("cc", "b"), {})]),
+        ("short.zarr", [(("a", "b"), {})]),
+    ]:
+        write_dicts(tmp_path / name, nodes, edges, None, None, batch_size=2)
+        GeffMetadata(geff_version="0.0.1", directed=True).write(tmp_path / name)
+        graph = read_to_memory(tmp_path / name)
+        assert graph["node_ids"].dtype == graph["edge_ids"].dtype == np.dtype("<U2")
+        np.testing.assert_array_equal(graph["node_ids"], ["a", "b", "cc"])
+        np.testing.assert_array_equal(graph["edge_ids"], [edge for edge, _ in edges])
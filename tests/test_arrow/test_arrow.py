@@ -0,0 +1,94 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from geff.geff_reader import read_to_memory
+from geff.metadata_schema import GeffMetadata
+from geff.networkx.io import write_nx
+
+pa = pytest.importorskip("pyarrow")
+
+from geff.arrow import from_arrow, from_parquet, to_arrow, to_parquet  # noqa: E402
+
+
+def _write_graph(path):
+    graph = nx.DiGraph()
+    graph.add_node(1, t=0, x=1.0, label="a", pos=[1.0, 2.0])
+    graph.add_node(2, t=1, x=2.0, pos=[3.0, 4.0])
+    graph.add_node(3, t=1, x=3.0, label="bb")
+    graph.add_edge(1, 2, score=0.5)
+    graph.add_edge(1, 3)
+    write_nx(graph, path, axis_names=["t", "x"])
+
+
+def _assert_geffs_equal(in_memory_geff, expected):
+    assert in_memory_geff["metadata"] == expected["metadata"]
+    np.testing.assert_array_equal(in_memory_geff["node_ids"], expected["node_ids"])
+    np.testing.assert_array_equal(in_memory_geff["edge_ids"], expected["edge_ids"])
+    for props in ["node_props", "edge_props"]:
+        assert set(in_memory_geff[props]) == set(expected[props])
+        for name, prop_dict in expected[props].items():
+            assert set(in_memory_geff[props][name]) == set(prop_dict)
+            if "missing" in prop_dict:
+                present = ~prop_dict["missing"]
+                np.testing.assert_array_equal(
+                    in_memory_geff[props][name]["missing"], prop_dict["missing"]
+                )
+            else:
+                present = slice(None)
+            np.testing.assert_array_equal(
+                in_memory_geff[props][name]["values"][present], prop_dict["values"][present]
+            )
+
+
+def test_to_arrow(tmp_path):
+    _write_graph(tmp_path / "graph.zarr")
+    nodes, edges = to_arrow(tmp_path / "graph.zarr")
+
+    assert nodes.column_names[0] == "id"
+    assert nodes.column("id").to_pylist() == [1, 2, 3]
+    assert nodes.column("label").to_pylist() == ["a", None, "bb"]
+    assert nodes.column("pos").to_pylist() == [[1.0, 2.0], [3.0, 4.0], None]
+    assert nodes.column("pos").type == pa.list_(pa.float64(), 2)
+    assert nodes.column("t").null_count == 0
+    assert edges.column_names[:2] == ["source", "target"]
+    assert edges.column("target").to_pylist() == [2, 3]
+    assert edges.column("score").to_pylist() == [0.5, None]
+
+    metadata = GeffMetadata.model_validate_json(nodes.schema.metadata[b"geff"])
+    assert metadata == read_to_memory(tmp_path / "graph.zarr")["metadata"]
+
+    nodes, _ = to_arrow(tmp_path / "graph.zarr", node_props=["t"], edge_props=[])
+    assert nodes.column_names == ["id", "t"]
+
+
+def test_from_arrow(tmp_path):
+    _write_graph(tmp_path / "graph.zarr")
+    nodes, edges = to_arrow(tmp_path / "graph.zarr")
+    from_arrow(nodes, edges, tmp_path / "copy.zarr")
+    _assert_geffs_equal(
+        read_to_memory(tmp_path / "copy.zarr"), read_to_memory(tmp_path / "graph.zarr")
+    )
+
+    # tables from other sources need metadata
+    nodes = pa.table({"id": [0, 1], "score": pa.array([0.5, None])})
+    edges = pa.table({"source": [0], "target": [1]})
+    with pytest.raises(ValueError, match="No geff metadata found"):
+        from_arrow(nodes, edges, tmp_path / "other.zarr")
+    metadata = GeffMetadata(geff_version="0.0.1", directed=False)
+    from_arrow(nodes, edges, tmp_path / "other.zarr", metadata=metadata)
+    in_memory_geff = read_to_memory(tmp_path / "other.zarr")
+    np.testing.assert_array_equal(in_memory_geff["node_props"]["score"]["missing"], [0, 1])
+    np.testing.assert_array_equal(in_memory_geff["edge_ids"], [[0, 1]])
+
+    with pytest.raises(ValueError, match="Id column target not found"):
+        from_arrow(nodes, pa.table({"source": [0]}), tmp_path / "bad.zarr", metadata=metadata)
+
+
+def test_parquet(tmp_path):
+    _write_graph(tmp_path / "graph.zarr")
+    to_parquet(tmp_path / "graph.zarr", tmp_path / "nodes.parquet", tmp_path / "edges.parquet")
+    from_parquet(tmp_path / "nodes.parquet", tmp_path / "edges.parquet", tmp_path / "copy.zarr")
+    _assert_geffs_equal(
+        read_to_memory(tmp_path / "copy.zarr"), read_to_memory(tmp_path / "graph.zarr")
+    )
@@ -0,0 +1,112 @@
+import asyncio
+
+import networkx as nx
+import numpy as np
+import pytest
+import zarr
+
+if not zarr.__version__.startswith("3"):
+    pytest.skip("the async reader requires zarr 3", allow_module_level=True)
+
+from zarr.api import asynchronous as zarr_async
+
+from geff.async_reader import AsyncGeffReader, read_selection_async, read_to_memory_async
+from geff.geff_reader import GeffReader, read_to_memory
+from geff.networkx.io import write_nx
+from geff.testing.data import create_memory_mock_geff
+
+
+def _assert_geffs_equal(in_memory_geff, expected):
+    assert in_memory_geff["metadata"] == expected["metadata"]
+    np.testing.assert_array_equal(in_memory_geff["node_ids"], expected["node_ids"])
+    np.testing.assert_array_equal(in_memory_geff["edge_ids"], expected["edge_ids"])
+    for props in ["node_props", "edge_props"]:
+        assert set(in_memory_geff[props]) == set(expected[props])
+        for name, prop_dict in expected[props].items():
+            assert set(in_memory_geff[props][name]) == set(prop_dict)
+            for key, array in prop_dict.items():
+                np.testing.assert_array_equal(in_memory_geff[props][name][key], array)
+
+
+@pytest.mark.parametrize("directed", [True, False])
+def test_build(directed):
+    store, _ = create_memory_mock_geff(
+        node_id_dtype="uint16",
+        node_axis_dtypes={"position": "double", "time": "int"},
+        extra_edge_props={"score": "float64", "color": "uint8"},
+        directed=directed,
+    )
+    file_reader = GeffReader(store)
+    file_reader.read_node_props()
+    file_reader.read_edge_props()
+    n_nodes = file_reader.nodes.shape[0]
+    n_edges = file_reader.edges.shape[0]
+
+    async def build(node_mask, edge_mask):
+        async_reader = await AsyncGeffReader.open(store)
+        assert async_reader.node_prop_names == file_reader.node_prop_names
+        assert async_reader.edge_prop_names == file_reader.edge_prop_names
+        await async_reader.read_node_props()
+        await async_reader.read_edge_props(["score"])
+        return await async_reader.build(node_mask, edge_mask)
+
+    for node_mask, edge_mask in [
+        (None, None),
+        (np.arange(n_nodes) < n_nodes // 2, None),
+        (None, np.arange(n_edges) % 2 == 0),
+        (np.arange(n_nodes) % 3 > 0, np.arange(n_edges) < n_edges // 2),
+    ]:
+        expected = file_reader.build(node_mask, edge_mask)
+        del expected["edge_props"]["color"]
+        _assert_geffs_equal(asyncio.run(build(node_mask, edge_mask)), expected)
+
+
+def test_read_to_memory_async(tmp_path):
+    paths = []
+    for i in range(3):
+        graph = nx.DiGraph()
+        graph.add_node(1, t=0, x=1.0, label=i)
+        graph.add_node(2, t=1, x=2.0)
+        graph.add_node(3, t=1, x=3.0, label=i + 1)
+        graph.add_edge(1, 2, score=0.5)
+        graph.add_edge(1, 3)
+        paths.append(tmp_path / f"graph_{i}.zarr")
+        write_nx(graph, paths[-1], axis_names=["t", "x"])
+
+    async def read_all():
+        return await asyncio.gather(*(read_to_memory_async(path) for path in paths))
+
+    for path, in_memory_geff in zip(paths, asyncio.run(read_all()), strict=True):
+        expected = read_to_memory(path)
+        assert "missing" in in_memory_geff["node_props"]["label"]
+        assert in_memory_geff["node_props"]["label"]["missing"].dtype == bool
+        _assert_geffs_equal(in_memory_geff, expected)
+
+
+def test_read_selection_async(tmp_path):
+    data = np.arange(20 * 3).reshape(20, 3)
+    zarr.open_array(tmp_path / "array.zarr", mode="w", shape=data.shape, chunks=(4, 3))[:] = data
+
+    async def read(selection):
+        array = await zarr_async.open_array(store=tmp_path / "array.zarr", mode="r")
+        return await read_selection_async(array, selection)
+
+    mask = np.zeros(20, dtype=bool)
+    mask[[1, 2, 9, 19]] = True
+    for selection, expected in [
+        (None, data),
+        (slice(3, 7), data[3:7]),
+        (mask, data[mask]),
+        (np.array([19, 0, 5, 5]), data[[19, 0, 5, 5]]),
+        (np.zeros(20, dtype=bool), data[:0]),
+    ]:
+        np.testing.assert_array_equal(asyncio.run(read(selection)), expected)
+
+    with pytest.raises(ValueError, match="Row indices out of bounds"):
+        asyncio.run(read(np.array([20])))
+
+
+def test_open_without_geff_metadata(tmp_path):
+    zarr.open_group(tmp_path / "empty.zarr", mode="w")
+    with pytest.raises(ValueError, match="No geff key found"):
+        asyncio.run(AsyncGeffReader.open(tmp_path / "empty.zarr", validate=False))
@@ -11,6 +11,8 @@ if all(x not in {"--codspeed", "--benchmark", "tests/test_bench.py"} for x in sy
 import atexit
 import shutil
 import tempfile
+import time
+import tracemalloc
 from functools import cache
 from pathlib import Path
 from types import MappingProxyType
@@ -18,9 +20,15 @@ from typing import TYPE_CHECKING, Any
 
 import networkx as nx
 import numpy as np
+import zarr
+import zarr.storage
 
 import geff
+import geff.validators.validators
+from geff.geff_reader import GeffReader, read_to_memory
+from geff.io import SupportedBackend, read
 from geff.utils import validate
+from geff.write_arrays import ArrayEncoding
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping
@@ -78,6 +86,21 @@ def graph_file_path(num_nodes: int) -> Path:
     return Path(tmp_dir)
 
 
+@cache
+def chunked_graph_file_path(num_nodes: int) -> Path:
+    """A graph file with small chunks, so that masked reads decode a part of the chunks."""
+    tmp_dir = tempfile.mkdtemp(suffix=".zarr")
+    atexit.register(shutil.rmtree, tmp_dir, ignore_errors=True)
+    encoding = {"nodes": ArrayEncoding(chunk_size=10), "edges": ArrayEncoding(chunk_size=1000)}
+    geff.write_nx(
+        graph=create_nx_graph(num_nodes),
+        store=tmp_dir,
+        axis_names=["t", "z", "y", "x"],
+        encoding=encoding,
+    )
+    return Path(tmp_dir)
+
+
 # ###########################   TESTS   ##################################
 
 READ_PATH: Mapping[Callable, Callable[[Path], tuple[Any, Any]]] = {
@@ -103,9 +126,10 @@ def test_bench_write(
 
 
 @pytest.mark.parametrize("nodes", [500])
-def test_bench_validate(benchmark: BenchmarkFixture, nodes: int) -> None:
+@pytest.mark.parametrize("level", ["structure", "deep"])
+def test_bench_validate(benchmark: BenchmarkFixture, nodes: int, level: str) -> None:
     graph_path = graph_file_path(nodes)
-    benchmark(validate, store=graph_path)
+    benchmark(validate, store=graph_path, level=level)
 
 
 @pytest.mark.parametrize("nodes", [500])
@@ -113,3 +137,193 @@ def test_bench_validate(benchmark: BenchmarkFixture, nodes: int) -> None:
 def test_bench_read(read_func: Callable, benchmark: BenchmarkFixture, nodes: int) -> None:
     graph_path = graph_file_path(nodes)
     benchmark(read_func, graph_path, validate=False)
+
+
+@pytest.mark.parametrize("selectivity", [0.001, 0.01, 0.1, 1.0])
+@pytest.mark.parametrize("masked", ["nodes", "edges"])
+def test_bench_build_masked(benchmark: BenchmarkFixture, masked: str, selectivity: float) -> None:
+    # the nodes are in 50 chunks and the edges in 250 chunks, so the number of decoded
+    # chunks scales with the selectivity
+    file_reader = GeffReader(chunked_graph_file_path(500), validate=False)
+    file_reader.read_node_props()
+    file_reader.read_edge_props()
+    # select a contiguous window of nodes or edges, like a time window on a sorted file
+    n_rows = (file_reader.nodes if masked == "nodes" else file_reader.edges).shape[0]
+    mask = np.zeros(n_rows, dtype=bool)
+    mask[: max(1, int(n_rows * selectivity))] = True
+    kwargs = {"node_mask": mask} if masked == "nodes" else {"edge_mask": mask}
+    # the peak memory of a separate read, as tracing would slow down the timed reads
+    tracemalloc.start()
+    try:
+        file_reader.build(**kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_memory_bytes"] = peak
+    benchmark(file_reader.build, **kwargs)
+
+
+@pytest.mark.parametrize("max_workers", [None, 8])
+@pytest.mark.parametrize("store_type", ["local", "fsspec"])
+def test_bench_read_to_memory(
+    benchmark: BenchmarkFixture, store_type: str, max_workers: int | None
+) -> None:
+    graph_path = graph_file_path(500)
+    store: Any = graph_path
+    if store_type == "fsspec":
+        pytest.importorskip("fsspec")
+        if not zarr.__version__.startswith("3"):
+            pytest.skip("FsspecStore requires zarr 3")
+        store = zarr.storage.FsspecStore.from_url(graph_path.absolute().as_uri())
+    benchmark(read_to_memory, store, validate=False, max_workers=max_workers)
+
+
+def _construct_nx_per_id(
+    metadata: Any, node_ids: Any, edge_ids: Any, node_props: Any, edge_props: Any
+) -> nx.Graph:
+    """The previous `construct_nx`, which sets every property of every id separately."""
+    graph = nx.DiGraph() if metadata.directed else nx.Graph()
+    graph.add_nodes_from(node_ids.tolist())
+    for name, prop_dict in node_props.items():
+        for idx, _id in enumerate(node_ids):
+            if "missing" not in prop_dict or not prop_dict["missing"][idx]:
+                graph.nodes[_id.item()][name] = prop_dict["values"][idx].tolist()
+    graph.add_edges_from(edge_ids.tolist())
+    for name, prop_dict in edge_props.items():
+        for idx, _id in enumerate(edge_ids):
+            if "missing" not in prop_dict or not prop_dict["missing"][idx]:
+                source, target = _id.tolist()
+                graph.edges[source, target][name] = prop_dict["values"][idx].tolist()
+    return graph
+
+
+@pytest.mark.parametrize(
+    "construct_func",
+    [geff.networkx.io.construct_nx, _construct_nx_per_id],
+    ids=["vectorized", "per_id"],
+)
+def test_bench_construct_nx(benchmark: BenchmarkFixture, construct_func: Callable) -> None:
+    in_memory_geff = read_to_memory(graph_file_path(500), validate=False)
+    benchmark(construct_func, **in_memory_geff)
+
+
+@pytest.mark.parametrize(
+    "backend", [backend for backend in SupportedBackend if backend != SupportedBackend.GRAPH_DICT]
+)
+def test_bench_read_backend(benchmark: BenchmarkFixture, backend: SupportedBackend) -> None:
+    """The read throughput of every backend of `geff.io.read` on the same file."""
+    if backend != SupportedBackend.NETWORKX:
+        pytest.importorskip(backend.value)
+    graph_path = graph_file_path(500)
+    file_reader = GeffReader(graph_path, validate=False)
+    n_nodes, n_edges = file_reader.nodes.shape[0], file_reader.edges.shape[0]
+
+    def read_backend() -> None:
+        start = time.perf_counter()
+        read(graph_path, False, None, None, backend)
+        elapsed = time.perf_counter() - start
+        throughput.append((n_nodes / elapsed, n_edges / elapsed))
+
+    throughput: list[tuple[float, float]] = []
+    benchmark(read_backend)
+    # report the best throughput, which is the least disturbed by other processes
+    nodes_per_s, edges_per_s = max(throughput)
+    benchmark.extra_info.update({"nodes/s": nodes_per_s, "edges/s": edges_per_s})
+
+
+def _validate_tracklets_nx(
+    node_ids: Any, edge_ids: Any, tracklet_ids: Any
+) -> tuple[bool, list[str]]:
+    """The previous `validate_tracklets`, which checks the subgraph of every tracklet."""
+    errors = []
+
+    ID_DTYPE = np.int64
+    nodes = node_ids.astype(ID_DTYPE, copy=False)
+    edges = edge_ids.astype(ID_DTYPE, copy=False)
+    tracklets = tracklet_ids.astype(ID_DTYPE, copy=False)
+
+    # Group nodes by tracklet ID.
+    tracklet_to_nodes: dict[np.int64, list[np.int64]] = {}
+    for node, t_id in zip(nodes, tracklets, strict=False):
+        tracklet_to_nodes.setdefault(t_id, []).append(node)
+
+    # Build the graph.
+    G = nx.DiGraph(tuple(edge) for edge in edges)
+    # Ensure all nodes from node_ids are in the graph, even if isolated.
+    G.add_nodes_from(nodes)
+
+    # Validate each tracklet.
+    for t_id, t_nodes in tracklet_to_nodes.items():
+        # by definition, a tracklet
+        if len(t_nodes) < 2:
+            continue
+
+        # Gets a subgraph for the current tracklet.
+        S = G.subgraph(t_nodes)
+
+        # Check - no branches or merges (junctions).
+        max_in_degree = max((d for _, d in S.in_degree()), default=0)
+        max_out_degree = max((d for _, d in S.out_degree()), default=0)
+
+        if max_in_degree > 1 or max_out_degree > 1:
+            errors.append(f"Tracklet {t_id}: Invalid path structure (branch or merge detected).")
+            continue
+
+        # Check - No cycles.
+        if not nx.is_directed_acyclic_graph(S):
+            errors.append(f"Tracklet {t_id}: Cycle detected.")
+            continue
+
+        # Check - Fully connected.
+        if not nx.is_weakly_connected(S):
+            errors.append(f"Tracklet {t_id}: Not fully connected.")
+            continue
+
+        # Check - Tracklet is maximal linear segment.
+        start_node = next(n for n, d in S.in_degree() if d == 0)
+        end_node = next(n for n, d in S.out_degree() if d == 0)
+
+        # Check if the path could be extended backward
+        preds_in_G = list(G.predecessors(start_node))
+        if len(preds_in_G) == 1:
+            predecessor = preds_in_G[0]
+            # If the predecessor is also part of a linear segment...
+            if G.out_degree(predecessor) == 1:
+                errors.append(
+                    f"Tracklet {t_id}: Not maximal. Path can extend backward to node {predecessor}."
+                )
+                continue
+
+        # Check if the path could be extended forward
+        succs_in_G = list(G.successors(end_node))
+        if len(succs_in_G) == 1:
+            successor = succs_in_G[0]
+            # If the successor is also part of a linear segment...
+            if G.in_degree(successor) == 1:
+                errors.append(
+                    f"Tracklet {t_id}: Not maximal. Path can extend forward to node {successor}."
+                )
+                continue
+
+    return not errors, errors
+
+
+@cache
+def tracklet_data(n_tracklets: int, length: int) -> tuple[Any, Any, Any]:
+    """Returns the node ids, edge ids and tracklet ids of tracklets that are disjoint paths."""
+    n_nodes = n_tracklets * length
+    node_ids = np.random.permutation(2 * n_nodes)[:n_nodes]
+    positions = np.arange(n_nodes).reshape(n_tracklets, length)
+    edge_ids = np.stack([node_ids[positions[:, :-1]], node_ids[positions[:, 1:]]], axis=-1)
+    tracklet_ids = np.repeat(np.arange(n_tracklets), length)
+    return node_ids, edge_ids.reshape(-1, 2), tracklet_ids
+
+
+@pytest.mark.parametrize(
+    "validate_func",
+    [geff.validators.validators.validate_tracklets, _validate_tracklets_nx],
+    ids=["vectorized", "networkx"],
+)
+def test_bench_validate_tracklets(benchmark: BenchmarkFixture, validate_func: Callable) -> None:
+    is_valid, _ = benchmark(validate_func, *tracklet_data(500, 20))
+    assert is_valid
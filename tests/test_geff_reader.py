@@ -1,9 +1,22 @@
+import networkx as nx
 import numpy as np
 import pytest
-
-from geff.geff_reader import GeffReader
-from geff.networkx.io import construct_nx
+import zarr
+import zarr.storage
+
+from geff.geff_reader import (
+    GeffReader,
+    LazyPropDict,
+    memmap_array,
+    read_selection,
+    read_to_memory,
+)
+from geff.geff_writer import GeffWriter
+from geff.metadata_schema import GeffMetadata
+from geff.networkx.io import construct_nx, write_nx
 from geff.testing.data import create_memory_mock_geff
+from geff.utils import compute_chunk_stats
+from geff.write_arrays import ArrayEncoding, write_arrays
 
 node_id_dtypes = ["int8", "uint8", "int16", "uint16"]
 node_axis_dtypes = [
@@ -180,3 +193,359 @@ def test_read_edge_props():
     )
 
     _ = construct_nx(**in_memory_geff)
+
+
+@pytest.mark.parametrize("shape", [(100,), (100, 2)])
+def test_read_selection(shape):
+    data = np.arange(np.prod(shape)).reshape(shape)
+    array = zarr.open_array(
+        zarr.storage.MemoryStore(), mode="w", shape=shape, chunks=(10, *shape[1:]), dtype=int
+    )
+    array[...] = data
+
+    np.testing.assert_array_equal(read_selection(array), data)
+
+    rng = np.random.default_rng(0)
+    for mask in [
+        np.zeros(100, dtype=bool),
+        np.ones(100, dtype=bool),
+        rng.random(100) < 0.05,
+        np.arange(100) >= 95,
+    ]:
+        np.testing.assert_array_equal(read_selection(array, mask), data[mask])
+
+    for rows in [np.array([], dtype=int), np.array([3, 4, 57, 99]), np.array([57, 3, 99, 3])]:
+        np.testing.assert_array_equal(read_selection(array, rows), data[rows])
+
+    with pytest.raises(ValueError, match="does not match the first axis"):
+        read_selection(array, np.ones(10, dtype=bool))
+    with pytest.raises(ValueError, match="out of bounds"):
+        read_selection(array, np.array([5, 100]))
+
+
+def test_read_selection_only_decodes_touched_chunks(tmp_path):
+    path = tmp_path / "array.zarr"
+    array = zarr.open_array(path, mode="w", shape=(100,), chunks=(10,), dtype=int)
+    array[...] = np.arange(100)
+    # corrupt every chunk that is not touched by the mask, decoding them would fail
+    for chunk_file in path.rglob("*"):
+        if chunk_file.name.isdigit() and chunk_file.name != "3":
+            chunk_file.write_bytes(b"not a chunk")
+
+    mask = np.zeros(100, dtype=bool)
+    mask[[31, 35]] = True
+    np.testing.assert_array_equal(read_selection(array, mask), [31, 35])
+    with pytest.raises(Exception):  # noqa: B017
+        read_selection(array)
+
+
+def _write_chunked_t_geff(path, t, missing=None, chunk_len=10):
+    """Write a geff with a single node property `t` chunked in `chunk_len` rows."""
+    node_ids = np.arange(len(t))
+    metadata = GeffMetadata(geff_version="0.0.1", directed=True)
+    write_arrays(path, node_ids, None, np.empty((0, 2), dtype=node_ids.dtype), None, metadata)
+    prop_group = zarr.open_group(path, mode="a").require_group("nodes/props/t")
+    format_kwargs = {"zarr_format": 2} if zarr.__version__.startswith("3") else {}
+    values = zarr.open_array(
+        path / "nodes/props/t/values",
+        mode="w",
+        shape=t.shape,
+        chunks=(chunk_len,),
+        dtype=t.dtype,
+        **format_kwargs,
+    )
+    values[...] = t
+    if missing is not None:
+        prop_group["missing"] = missing
+    chunk_min, chunk_max = compute_chunk_stats(t, chunk_len, missing)
+    prop_group["chunk_min"] = chunk_min
+    prop_group["chunk_max"] = chunk_max
+
+
+def test_query(tmp_path):
+    path = tmp_path / "test.zarr"
+    rng = np.random.default_rng(0)
+    t = np.sort(rng.integers(0, 20, size=100))
+    missing = rng.random(100) < 0.1
+    _write_chunked_t_geff(path, t, missing)
+
+    file_reader = GeffReader(path)
+    present = ~missing
+    np.testing.assert_array_equal(file_reader.query({"t": (3, 7)}), present & (t >= 3) & (t <= 7))
+    np.testing.assert_array_equal(file_reader.query({"t": (None, 7)}), present & (t <= 7))
+    np.testing.assert_array_equal(file_reader.query({"t": (15, None)}), present & (t >= 15))
+    assert not file_reader.query({"t": (100, None)}).any()
+
+    with pytest.raises(ValueError, match="Node property score not found"):
+        file_reader.query({"score": (0, 1)})
+
+
+def test_query_skips_chunks(tmp_path):
+    path = tmp_path / "test.zarr"
+    t = np.repeat(np.arange(10), 10)  # one frame per chunk
+    _write_chunked_t_geff(path, t)
+    # corrupt every chunk except the one holding frame 3, decoding them would fail
+    for chunk_file in (path / "nodes/props/t/values").rglob("*"):
+        if chunk_file.name.isdigit() and chunk_file.name != "3":
+            chunk_file.write_bytes(b"not a chunk")
+
+    file_reader = GeffReader(path, validate=False)
+    np.testing.assert_array_equal(file_reader.query({"t": (3, 3)}), t == 3)
+
+
+def _time_sorted_nx_geff(path, n_nodes=30):
+    rng = np.random.default_rng(1)
+    graph = nx.DiGraph()
+    for node, t in enumerate(rng.integers(0, 5, size=n_nodes)):
+        graph.add_node(node, t=int(t), x=float(node), score=float(t) / 2)
+    for node in range(n_nodes - 1):
+        graph.add_edge(node, node + 1, weight=float(node))
+    write_nx(
+        graph,
+        path,
+        axis_names=["t", "x"],
+        axis_types=["time", "space"],
+        axis_units=["second", "nanometer"],
+        sort_by_time=True,
+    )
+    return graph
+
+
+def test_read_frame(tmp_path):
+    path = tmp_path / "test.zarr"
+    graph = _time_sorted_nx_geff(path)
+
+    file_reader = GeffReader(path)
+    file_reader.read_node_props()
+    file_reader.read_edge_props()
+    t = file_reader.node_props["t"]["values"][:]
+    assert np.all(np.diff(t) >= 0)
+
+    for start, stop in [(0, 0), (1, 3), (2, 2), (4, 10), (7, 9)]:
+        in_memory_geff = file_reader.read_time_range(start, stop)
+        expected = file_reader.build(node_mask=(t >= start) & (t <= stop))
+        np.testing.assert_array_equal(in_memory_geff["node_ids"], expected["node_ids"])
+        np.testing.assert_array_equal(in_memory_geff["edge_ids"], expected["edge_ids"])
+        for name in ["t", "x", "score"]:
+            np.testing.assert_array_equal(
+                in_memory_geff["node_props"][name]["values"],
+                expected["node_props"][name]["values"],
+            )
+        np.testing.assert_array_equal(
+            in_memory_geff["edge_props"]["weight"]["values"],
+            expected["edge_props"]["weight"]["values"],
+        )
+
+    frame = file_reader.read_frame(2)
+    assert set(frame["node_ids"].tolist()) == {n for n, d in graph.nodes(data=True) if d["t"] == 2}
+
+
+def test_read_frame_without_time_index():
+    store, _ = create_memory_mock_geff(
+        node_id_dtype="uint8",
+        node_axis_dtypes={"position": "double", "time": "double"},
+        directed=True,
+    )
+    with pytest.raises(ValueError, match="Geff has no time index"):
+        GeffReader(store).read_frame(1)
+
+
+def _random_nx_graph(directed=True, n_nodes=40, n_edges=80):
+    rng = np.random.default_rng(2)
+    graph = nx.DiGraph() if directed else nx.Graph()
+    for node in rng.permutation(n_nodes):
+        graph.add_node(int(node) * 3, t=int(node) % 4)
+    while graph.number_of_edges() < n_edges:
+        u, v = rng.choice(n_nodes, size=2, replace=False) * 3
+        graph.add_edge(int(u), int(v), weight=float(u + v))
+    return graph
+
+
+@pytest.mark.parametrize("stored", [True, False])
+def test_adjacency_queries(tmp_path, stored):
+    path = tmp_path / "test.zarr"
+    graph = _random_nx_graph()
+    write_nx(graph, path, adjacency=stored)
+
+    file_reader = GeffReader(path)
+    assert file_reader.has_adjacency == stored
+    for node_ids in [[0], [3, 6, 9], list(graph.nodes)]:
+        successors = {v for u in node_ids for v in graph.successors(u)}
+        predecessors = {v for u in node_ids for v in graph.predecessors(u)}
+        incident = {e for e in graph.edges if e[0] in node_ids or e[1] in node_ids}
+        assert set(file_reader.successors(node_ids).tolist()) == successors
+        assert set(file_reader.predecessors(node_ids).tolist()) == predecessors
+        assert {tuple(e) for e in file_reader.edges_incident_to(node_ids).tolist()} == incident
+
+    with pytest.raises(ValueError, match=r"Node ids \[1\] not found"):
+        file_reader.successors([0, 1])
+
+
+@pytest.mark.parametrize("directed", [True, False])
+def test_build_with_adjacency(tmp_path, directed):
+    graph = _random_nx_graph(directed)
+    write_nx(graph, tmp_path / "indexed.zarr", adjacency=True)
+    write_nx(graph, tmp_path / "plain.zarr")
+
+    indexed_reader = GeffReader(tmp_path / "indexed.zarr")
+    plain_reader = GeffReader(tmp_path / "plain.zarr")
+    for file_reader in [indexed_reader, plain_reader]:
+        file_reader.read_node_props()
+        file_reader.read_edge_props()
+
+    t = plain_reader.node_props["t"]["values"][:]
+    n_edges = plain_reader.edges.shape[0]
+    for node_mask, edge_mask in [
+        (t < 2, None),
+        (t == 3, None),
+        (np.zeros_like(t, dtype=bool), None),
+        (t != 1, np.arange(n_edges) % 2 == 0),
+    ]:
+        indexed = indexed_reader.build(node_mask, edge_mask)
+        plain = plain_reader.build(node_mask, edge_mask)
+        np.testing.assert_array_equal(indexed["node_ids"], plain["node_ids"])
+        np.testing.assert_array_equal(indexed["edge_ids"], plain["edge_ids"])
+        np.testing.assert_array_equal(
+            indexed["edge_props"]["weight"]["values"], plain["edge_props"]["weight"]["values"]
+        )
+
+
+def test_build_lazy(tmp_path):
+    graph = _time_sorted_nx_geff(tmp_path / "test.zarr")
+    graph.nodes[3]["label"] = "three"
+    path = tmp_path / "labeled.zarr"
+    write_nx(graph, path, axis_names=["t", "x"], axis_types=["time", "space"])
+
+    file_reader = GeffReader(path)
+    file_reader.read_node_props()
+    file_reader.read_edge_props()
+    node_mask = file_reader.node_props["t"]["values"][:] > 1
+    eager = file_reader.build(node_mask)
+    lazy = file_reader.build(node_mask, lazy=True)
+
+    label = lazy["node_props"]["label"]
+    assert isinstance(label, LazyPropDict)
+    assert set(label) == {"values", "missing"}
+    assert "missing" in label and not label.is_loaded("missing")
+    np.testing.assert_array_equal(label["missing"], eager["node_props"]["label"]["missing"])
+    assert label.is_loaded("missing") and not label.is_loaded("values")
+    assert label["missing"] is label["missing"]
+
+    np.testing.assert_array_equal(lazy["node_ids"], eager["node_ids"])
+    np.testing.assert_array_equal(lazy["edge_ids"], eager["edge_ids"])
+    for props in ["node_props", "edge_props"]:
+        for name, prop_dict in eager[props].items():
+            for key, array in prop_dict.items():
+                np.testing.assert_array_equal(lazy[props][name][key], array)
+
+    assert nx.utils.graphs_equal(construct_nx(**lazy), construct_nx(**eager))
+
+
+def test_read_to_memory_lazy_decodes_only_accessed_props(tmp_path):
+    path = tmp_path / "test.zarr"
+    _time_sorted_nx_geff(path)
+    # corrupt the score property, decoding it would fail
+    for chunk_file in (path / "nodes/props/score/values").rglob("*"):
+        if chunk_file.name.replace(".", "").isdigit():
+            chunk_file.write_bytes(b"not a chunk")
+
+    in_memory_geff = read_to_memory(path, validate=False, lazy=True)
+    assert len(in_memory_geff["node_props"]["t"]["values"]) == len(in_memory_geff["node_ids"])
+    with pytest.raises(Exception):  # noqa: B017
+        in_memory_geff["node_props"]["score"]["values"]
+
+
+@pytest.mark.parametrize("adjacency", [True, False])
+def test_build_max_workers(tmp_path, adjacency):
+    path = tmp_path / "test.zarr"
+    graph = _time_sorted_nx_geff(tmp_path / "sorted.zarr")
+    write_nx(graph, path, axis_names=["t", "x"], adjacency=adjacency)
+
+    file_reader = GeffReader(path)
+    file_reader.read_node_props()
+    file_reader.read_edge_props()
+    t = file_reader.node_props["t"]["values"][:]
+    for node_mask in [None, t > 2]:
+        expected = file_reader.build(node_mask)
+        in_memory_geff = file_reader.build(node_mask, max_workers=4)
+        np.testing.assert_array_equal(in_memory_geff["node_ids"], expected["node_ids"])
+        np.testing.assert_array_equal(in_memory_geff["edge_ids"], expected["edge_ids"])
+        for props in ["node_props", "edge_props"]:
+            assert list(in_memory_geff[props]) == list(expected[props])
+            for name, prop_dict in expected[props].items():
+                assert list(in_memory_geff[props][name]) == list(prop_dict)
+                for key, array in prop_dict.items():
+                    np.testing.assert_array_equal(in_memory_geff[props][name][key], array)
+
+    in_memory_geff = read_to_memory(path, max_workers=2)
+    np.testing.assert_array_equal(in_memory_geff["node_ids"], file_reader.nodes[:])
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+@pytest.mark.parametrize(("batch_size", "n_batches"), [(None, 3), (1, 3), (5, 2), (100, 1)])
+def test_iter_batches(tmp_path, prefetch, batch_size, n_batches):
+    path = tmp_path / "test.zarr"
+    with GeffWriter(path, axis_names=["t"], encoding=ArrayEncoding(chunk_size=4)) as writer:
+        writer.append_nodes(np.arange(10), {"t": (np.arange(10) // 3, None)})
+        writer.append_nodes(np.arange(10, 12), {"t": ([4, 5], None), "label": ([7, 8], None)})
+        edges = np.stack([np.arange(12), (np.arange(12) + 1) % 12], axis=1)
+        writer.append_edges(edges, {"score": (np.linspace(0, 1, 12), np.arange(12) == 3)})
+
+    file_reader = GeffReader(path)
+    file_reader.read_node_props()
+    file_reader.read_edge_props()
+    expected = file_reader.build()
+    for ids_key, props_key, batches in [
+        ("node_ids", "node_props", file_reader.iter_node_batches(batch_size, prefetch)),
+        ("edge_ids", "edge_props", file_reader.iter_edge_batches(batch_size, prefetch)),
+    ]:
+        batches = list(batches)
+        assert len(batches) == n_batches
+        for ids, _ in batches[:-1]:
+            assert len(ids) % 4 == 0
+        np.testing.assert_array_equal(
+            np.concatenate([ids for ids, _ in batches]), expected[ids_key]
+        )
+        for name, prop_dict in expected[props_key].items():
+            for key, array in prop_dict.items():
+                np.testing.assert_array_equal(
+                    np.concatenate([props[name][key] for _, props in batches]), array
+                )
+
+    # only the loaded properties are read
+    file_reader = GeffReader(path)
+    file_reader.read_node_props(["t"])
+    ids, props = next(file_reader.iter_node_batches())
+    np.testing.assert_array_equal(ids, np.arange(4))
+    assert list(props) == ["t"]
+    with pytest.raises(ValueError, match="Batch size must be positive"):
+        file_reader.iter_edge_batches(0)
+
+
+@pytest.mark.parametrize("zarr_format", [2, 3] if zarr.__version__.startswith("3") else [2])
+def test_memmap_raw_layout(tmp_path, zarr_format):
+    graph = _random_nx_graph()
+    for node in graph.nodes:
+        graph.nodes[node]["t"] = node % 5
+    raw_path = tmp_path / "raw.zarr"
+    write_nx(graph, raw_path, zarr_format=zarr_format, encoding=ArrayEncoding(layout="raw"))
+    write_nx(graph, tmp_path / "chunked.zarr", zarr_format=zarr_format)
+
+    file_reader = GeffReader(raw_path)
+    mapped = memmap_array(file_reader.nodes)
+    assert isinstance(mapped, np.memmap)
+    np.testing.assert_array_equal(mapped, file_reader.nodes[:])
+    assert memmap_array(GeffReader(tmp_path / "chunked.zarr").nodes) is None
+
+    # all rows are read without a copy, selected rows match the decoded arrays
+    in_memory_geff = read_to_memory(raw_path)
+    assert isinstance(in_memory_geff["node_ids"].base, np.memmap)
+    expected = read_to_memory(tmp_path / "chunked.zarr")
+    np.testing.assert_array_equal(in_memory_geff["node_ids"], expected["node_ids"])
+    np.testing.assert_array_equal(in_memory_geff["edge_ids"], expected["edge_ids"])
+    rows = np.array([5, 0, 3])
+    np.testing.assert_array_equal(
+        read_selection(file_reader.edges, rows), expected["edge_ids"][rows]
+    )
+    with pytest.raises(ValueError, match="out of bounds"):
+        read_selection(file_reader.nodes, np.array([len(mapped)]))
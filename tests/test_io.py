@@ -20,11 +20,66 @@ extra_edge_props = [
 
 # NOTE: new backends have to add cases to the utility functions below
 
+# the backends that construct a tuple of node and edge DataFrames
+FRAME_BACKENDS = {SupportedBackend.PANDAS: "pandas", SupportedBackend.POLARS: "polars"}
+# the optional dependency of each backend
+BACKEND_MODULES = {
+    **FRAME_BACKENDS,
+    SupportedBackend.SCIPY: "scipy",
+    SupportedBackend.RUSTWORKX: "rustworkx",
+    SupportedBackend.SPATIAL_GRAPH: "spatial_graph",
+}
+
+
+def is_frames(graph) -> bool:
+    return isinstance(graph, tuple) and len(graph) == 2
+
+
+def is_sparse(graph) -> bool:
+    # the adjacency matrix, node ids and id index of the scipy backend
+    return isinstance(graph, tuple) and len(graph) == 3
+
+
+def is_rx(graph) -> bool:
+    return type(graph).__module__ == "rustworkx"
+
+
+def is_sg(graph) -> bool:
+    return type(graph).__module__.startswith("spatial_graph")
+
+
+def rx_ids(graph, ids: list[Any]) -> list[int]:
+    return [graph.attrs["to_rx_id_map"][_id] for _id in ids]
+
+
+def frame_column(frame, name: str) -> NDArray[Any]:
+    return np.asarray(frame[name].to_numpy())
+
 
 def is_expected_type(graph, backend: SupportedBackend):
     match backend:
         case SupportedBackend.NETWORKX:
             return isinstance(graph, nx.Graph | nx.DiGraph)
+        case SupportedBackend.PANDAS:
+            import pandas as pd
+
+            return is_frames(graph) and all(isinstance(frame, pd.DataFrame) for frame in graph)
+        case SupportedBackend.POLARS:
+            import polars as pl
+
+            return is_frames(graph) and all(isinstance(frame, pl.DataFrame) for frame in graph)
+        case SupportedBackend.SCIPY:
+            from scipy import sparse
+
+            return is_sparse(graph) and isinstance(graph[0], sparse.csr_array)
+        case SupportedBackend.RUSTWORKX:
+            import rustworkx as rx
+
+            return isinstance(graph, rx.PyGraph | rx.PyDiGraph)
+        case SupportedBackend.SPATIAL_GRAPH:
+            import spatial_graph as sg
+
+            return isinstance(graph, sg.SpatialGraph | sg.SpatialDiGraph)
         case _:
             raise TypeError(
                 f"No `is_expected_type` code path has been defined for backend '{backend.value}'."
@@ -34,6 +89,14 @@ def is_expected_type(graph, backend: SupportedBackend):
 def get_nodes(graph) -> set[Any]:
     if isinstance(graph, (nx.Graph | nx.DiGraph)):
         return set(graph.nodes)
+    elif is_frames(graph):
+        return set(frame_column(graph[0], "id").tolist())
+    elif is_sparse(graph):
+        return set(graph[1].tolist())
+    elif is_rx(graph):
+        return set(graph.attrs["to_rx_id_map"])
+    elif is_sg(graph):
+        return set(graph.nodes.tolist())
     else:
         raise TypeError(f"No `get_nodes` code path has been defined for type '{type(graph)}'.")
 
@@ -41,6 +104,20 @@ def get_nodes(graph) -> set[Any]:
 def get_edges(graph) -> set[tuple[Any, Any]]:
     if isinstance(graph, (nx.Graph | nx.DiGraph)):
         return set(graph.edges)
+    elif is_frames(graph):
+        edges = graph[1]
+        sources = frame_column(edges, "source").tolist()
+        targets = frame_column(edges, "target").tolist()
+        return set(zip(sources, targets, strict=True))
+    elif is_sparse(graph):
+        matrix, node_ids, _ = graph
+        sources, targets = matrix.nonzero()
+        return set(zip(node_ids[sources].tolist(), node_ids[targets].tolist(), strict=True))
+    elif is_rx(graph):
+        to_geff_id = {rx_id: _id for _id, rx_id in graph.attrs["to_rx_id_map"].items()}
+        return {(to_geff_id[source], to_geff_id[target]) for source, target in graph.edge_list()}
+    elif is_sg(graph):
+        return {tuple(edge) for edge in graph.edges.tolist()}
     else:
         raise TypeError(f"No `get_edges` code path has been defined for type '{type(graph)}'.")
 
@@ -49,6 +126,15 @@ def get_node_prop(graph, name: str, nodes: list[Any]) -> NDArray[Any]:
     if isinstance(graph, (nx.Graph | nx.DiGraph)):
         prop = [graph.nodes[node][name] for node in nodes]
         return np.array(prop)
+    elif is_frames(graph):
+        ids = frame_column(graph[0], "id")
+        values = frame_column(graph[0], name)
+        order = np.argsort(ids)
+        return values[order[np.searchsorted(ids, nodes, sorter=order)]]
+    elif is_rx(graph):
+        return np.array([graph[rx_id][name] for rx_id in rx_ids(graph, nodes)])
+    elif is_sg(graph):
+        return getattr(graph.node_attrs[np.asarray(nodes, dtype=graph.node_dtype)], name)
     else:
         raise TypeError(f"No `get_node_prop` code path has been defined for type '{type(graph)}'.")
 
@@ -57,6 +143,24 @@ def get_edge_prop(graph, name: str, edges: list[Any]) -> NDArray[Any]:
     if isinstance(graph, (nx.Graph | nx.DiGraph)):
         prop = [graph.edges[edge][name] for edge in edges]
         return np.array(prop)
+    elif is_frames(graph):
+        rows = {
+            edge: row
+            for row, edge in enumerate(
+                zip(
+                    frame_column(graph[1], "source").tolist(),
+                    frame_column(graph[1], "target").tolist(),
+                    strict=True,
+                )
+            )
+        }
+        return frame_column(graph[1], name)[[rows[tuple(edge)] for edge in edges]]
+    elif is_rx(graph):
+        return np.array(
+            [graph.get_edge_data(*rx_ids(graph, edge))[name] for edge in edges]  # type: ignore
+        )
+    elif is_sg(graph):
+        return getattr(graph.edge_attrs[np.asarray(edges, dtype=graph.node_dtype)], name)
     else:
         raise TypeError(f"No `get_edge_prop` code path has been defined for type '{type(graph)}'.")
 
@@ -88,6 +192,12 @@ def test_read(
     # temporarily skip dummy example case until it is removed
     if backend == SupportedBackend.GRAPH_DICT:
         return
+    if backend in BACKEND_MODULES:
+        pytest.importorskip(BACKEND_MODULES[backend])
+    if backend == SupportedBackend.SPATIAL_GRAPH and node_id_dtype != "uint16":
+        # spatial_graph compiles a module per dtype, the other dtypes are covered by
+        # tests/test_spatial_graph
+        pytest.skip("spatial_graph is only tested with one node id dtype")
 
     graph, metadata = read(store, backend=backend)
 
@@ -95,7 +205,15 @@ def test_read(
 
     # nodes and edges correct
     assert get_nodes(graph) == {*graph_props["nodes"].tolist()}
-    assert get_edges(graph) == {*[tuple(edges) for edges in graph_props["edges"].tolist()]}
+    expected_edges = {*[tuple(edges) for edges in graph_props["edges"].tolist()]}
+    if backend == SupportedBackend.SCIPY and not directed:
+        # the adjacency matrix of an undirected graph has the edges in both directions
+        expected_edges |= {(target, source) for source, target in expected_edges}
+    assert get_edges(graph) == expected_edges
+
+    # the adjacency matrix has no properties
+    if backend == SupportedBackend.SCIPY:
+        return
 
     # check node properties are correct
     spatial_node_properties = ["y", "x"]
@@ -103,6 +221,14 @@ def test_read(
         spatial_node_properties.append("t")
     if include_z:
         spatial_node_properties.append("z")
+    if backend == SupportedBackend.SPATIAL_GRAPH:
+        # the spatial graph stacks the spatiotemporal properties into one position
+        axis_names = [axis.name for axis in metadata.axes]
+        np.testing.assert_array_equal(
+            get_node_prop(graph, "position", graph_props["nodes"].tolist()),
+            np.stack([graph_props[name] for name in axis_names], axis=1),
+        )
+        spatial_node_properties = []
     for name in spatial_node_properties:
         np.testing.assert_array_equal(
             get_node_prop(graph, name, graph_props["nodes"].tolist()), graph_props[name]
@@ -1,6 +1,11 @@
+import numpy as np
 import pytest
 
-from geff.io_utils import create_or_update_props_metadata
+from geff.io_utils import (
+    RoiAccumulator,
+    calculate_roi,
+    create_or_update_props_metadata,
+)
 from geff.metadata_schema import GeffMetadata, PropMetadata
 
 
@@ -130,3 +135,20 @@ class TestCreateOrUpdatePropsMetadata:
         props_md = [PropMetadata(identifier="prop1", dtype="int64")]
         with pytest.raises(ValueError):
             create_or_update_props_metadata(metadata, props_md, "invalid_type")
+
+
+def test_roi_accumulator():
+    accumulator = RoiAccumulator(["t", "x"])
+    assert accumulator.roi is None
+    accumulator.update({"t": np.array([3, 1]), "x": np.array([5.0, 2.0])})
+    accumulator.update({"t": np.array([], dtype=int), "x": np.array([])})
+    accumulator.update({"t": np.array([2]), "x": np.array([7.5])})
+    assert accumulator.roi == ((1, 2.0), (3, 7.5))
+
+    with pytest.raises(ValueError, match="Spatiotemporal properties {'x'} not found"):
+        accumulator.update({"t": np.array([0])})
+
+    assert calculate_roi({"t": np.array([4, 2]), "y": np.array([1, 9])}, ["y", "t"]) == (
+        (1, 2),
+        (9, 4),
+    )
@@ -253,3 +253,60 @@ def test_write_nx_different_store_types(tmp_path):
     assert len(graph_read.nodes) == 2
     assert len(graph_read.edges) == 1
     assert (1, 2) in graph_read.edges
+
+
+def test_write_nx_sort_by_time(tmp_path):
+    graph = nx.DiGraph()
+    graph.add_node(1, t=2, x=1.0)
+    graph.add_node(2, t=0, x=2.0)
+    graph.add_node(3, t=1, x=3.0)
+    graph.add_node(4, t=0, x=4.0)
+    graph.add_edge(2, 3)
+    graph.add_edge(3, 1)
+
+    path = tmp_path / "sorted.zarr"
+    geff.write_nx(
+        graph, path, axis_names=["t", "x"], axis_types=["time", "space"], sort_by_time=True
+    )
+    geff.validate(path)
+
+    root = zarr.open(str(path), mode="r")
+    np.testing.assert_array_equal(root["nodes/props/t/values"][:], [0, 0, 1, 2])
+    np.testing.assert_array_equal(root["nodes/time_index/offsets"][:], [0, 2, 3, 4])
+
+    graph_read, _ = geff.read_nx(path)
+    assert set(graph_read.nodes) == set(graph.nodes)
+    assert set(graph_read.edges) == set(graph.edges)
+    for node, data in graph.nodes(data=True):
+        assert graph_read.nodes[node] == data
+
+    with pytest.raises(ValueError, match="no axis has type 'time'"):
+        geff.write_nx(graph, tmp_path / "unsorted.zarr", axis_names=["t", "x"], sort_by_time=True)
+
+
+@pytest.mark.parametrize("directed", [True, False])
+def test_construct_nx(directed):
+    metadata = GeffMetadata(geff_version="0.0.1", directed=directed)
+    node_props = {
+        "t": {"values": np.array([0, 1, 2])},
+        "label": {"values": np.array([5, 0, 7]), "missing": np.array([False, True, False])},
+        "color": {"values": np.array([[1.0, 0.0], [0.5, 0.5], [0.0, 1.0]])},
+    }
+    edge_props = {"score": {"values": np.array([0.5, 0.0]), "missing": np.array([False, True])}}
+    graph = geff.networkx.io.construct_nx(
+        metadata,
+        np.array([10, 11, 12], dtype="uint16"),
+        np.array([[10, 11], [12, 11]], dtype="uint16"),
+        node_props,
+        edge_props,
+    )
+
+    assert graph.is_directed() == directed
+    assert dict(graph.nodes(data=True)) == {
+        10: {"t": 0, "label": 5, "color": [1.0, 0.0]},
+        11: {"t": 1, "color": [0.5, 0.5]},
+        12: {"t": 2, "label": 7, "color": [0.0, 1.0]},
+    }
+    assert type(graph.nodes[10]["t"]) is int
+    assert graph.edges[10, 11] == {"score": 0.5}
+    assert graph.edges[12, 11] == {}
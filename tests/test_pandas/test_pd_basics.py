@@ -0,0 +1,62 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from geff.io import SupportedBackend, read
+from geff.networkx.io import write_nx
+
+pd = pytest.importorskip("pandas")
+
+from geff.pandas.io import construct_pd, read_pd  # noqa: E402
+
+
+@pytest.fixture
+def geff_path(tmp_path):
+    graph = nx.DiGraph()
+    graph.add_node(1, t=0, label="a", pos=[1.0, 2.0], count=3)
+    graph.add_node(2, t=1, pos=[3.0, 4.0], flag=True)
+    graph.add_node(3, t=1, label="bb", count=5)
+    graph.add_edge(1, 2, score=0.5)
+    graph.add_edge(1, 3)
+    path = tmp_path / "graph.zarr"
+    write_nx(graph, path, axis_names=["t"])
+    return path
+
+
+def test_read_pd(geff_path):
+    (nodes, edges), metadata = read_pd(geff_path)
+    assert metadata.directed
+    assert list(nodes.columns[:1]) == ["id"]
+    assert nodes["id"].tolist() == [1, 2, 3]
+    assert nodes["t"].dtype == np.int64
+    assert nodes["count"].dtype == "Int64"
+    assert nodes["count"].isna().tolist() == [False, True, False]
+    assert nodes["label"].dtype == "string"
+    assert nodes["label"].isna().tolist() == [False, True, False]
+    assert nodes["pos"].iloc[1].tolist() == [3.0, 4.0]
+    assert nodes["pos"].iloc[2] is None
+
+    assert list(edges.columns) == ["source", "target", "score"]
+    assert edges["score"].dtype == "Float64"
+    assert edges["score"].isna().tolist() == [False, True]
+
+
+def test_read_pd_expand(geff_path):
+    (nodes, _), _ = read(geff_path, True, None, None, SupportedBackend.PANDAS, {"expand": True})
+    assert "pos" not in nodes.columns
+    assert nodes["pos_1"].tolist()[:2] == [2.0, 4.0]
+    assert nodes["pos_0"].dtype == "Float64"
+    assert nodes["pos_0"].isna().tolist() == [False, False, True]
+
+
+def test_construct_pd(geff_path):
+    (nodes, edges), metadata = read_pd(geff_path, node_props=[])
+    node_ids = nodes["id"].to_numpy()
+    edge_ids = np.stack([edges["source"], edges["target"]], axis=1)
+    flag = {"values": np.array([True, False, True]), "missing": np.array([0, 0, 1], bool)}
+    nodes, _ = construct_pd(metadata, node_ids, edge_ids, {"flag": flag}, {})
+    assert nodes["flag"].dtype == "boolean"
+    assert nodes["flag"].isna().tolist() == [False, False, True]
+
+    with pytest.raises(ValueError, match="same name as another column"):
+        construct_pd(metadata, node_ids, edge_ids, {"id": {"values": np.zeros(3)}}, {})
@@ -0,0 +1,47 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from geff.io import SupportedBackend, read
+from geff.networkx.io import write_nx
+
+pl = pytest.importorskip("polars")
+
+from geff.polars.io import read_pl  # noqa: E402
+
+
+@pytest.fixture
+def geff_path(tmp_path):
+    graph = nx.DiGraph()
+    graph.add_node(1, t=0, label="a", pos=[1.0, 2.0], count=3)
+    graph.add_node(2, t=1, pos=[3.0, 4.0], flag=True)
+    graph.add_node(3, t=1, label="bb", count=5)
+    graph.add_edge(1, 2, score=0.5)
+    graph.add_edge(1, 3)
+    path = tmp_path / "graph.zarr"
+    write_nx(graph, path, axis_names=["t"])
+    return path
+
+
+def test_read_pl(geff_path):
+    (nodes, edges), metadata = read_pl(geff_path)
+    assert metadata.directed
+    assert nodes.columns[0] == "id"
+    assert nodes["id"].to_list() == [1, 2, 3]
+    assert nodes["t"].null_count() == 0
+    assert nodes["count"].to_list() == [3, None, 5]
+    assert nodes["label"].to_list() == ["a", None, "bb"]
+    assert nodes["flag"].to_list() == [None, 1, None]
+    assert nodes["pos"].dtype == pl.Array(pl.Float64, 2)
+    assert nodes["pos"].to_list() == [[1.0, 2.0], [3.0, 4.0], None]
+
+    assert edges.columns == ["source", "target", "score"]
+    assert edges["score"].to_list() == [0.5, None]
+
+
+def test_read_pl_expand(geff_path):
+    (nodes, _), _ = read(geff_path, True, None, None, SupportedBackend.POLARS, {"expand": True})
+    assert "pos" not in nodes.columns
+    assert nodes["pos_0"].to_list() == [1.0, 3.0, None]
+    assert nodes["pos_1"].dtype == pl.Float64
+    np.testing.assert_array_equal(nodes["id"].to_numpy(), [1, 2, 3])
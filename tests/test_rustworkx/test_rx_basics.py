@@ -337,3 +337,44 @@ def test_write_rx_different_store_types(tmp_path):
     graph_read, _ = geff.read_rx(memory_store)
     assert graph_read.num_nodes() == 3
     assert graph_read.num_edges() == 2
+
+
+def test_construct_rx_lazy():
+    from geff.geff_reader import read_to_memory
+    from geff.rustworkx.io import construct_rx
+
+    store, _ = create_memory_mock_geff(
+        "uint8",
+        {"position": "double", "time": "double"},
+        extra_edge_props={"score": "float64", "color": "uint8"},
+        directed=True,
+    )
+    graph = construct_rx(**read_to_memory(store, lazy=True))
+    expected = construct_rx(**read_to_memory(store))
+    assert graph.nodes() == expected.nodes()
+    assert graph.weighted_edge_list() == expected.weighted_edge_list()
+
+
+def test_construct_rx_no_edge_props(tmp_path):
+    from geff.rustworkx.io import construct_rx
+
+    metadata = GeffMetadata(geff_version="0.4", directed=True)
+    node_ids = np.array([10, 30, 20], dtype=np.int64)
+    edge_ids = np.array([[10, 20], [20, 30]], dtype=np.int64)
+    x = {"values": np.array([1.0, 3.0, 2.0])}
+    graph = construct_rx(metadata, node_ids, edge_ids, {"x": x}, {})
+
+    to_rx_id_map = graph.attrs["to_rx_id_map"]
+    assert [graph[to_rx_id_map[node]]["x"] for node in [10, 20, 30]] == [1.0, 2.0, 3.0]
+    assert sorted(graph.edge_list()) == sorted(
+        [(to_rx_id_map[10], to_rx_id_map[20]), (to_rx_id_map[20], to_rx_id_map[30])]
+    )
+    # edges without data are written back without properties
+    geff.write_rx(
+        graph, tmp_path / "test.zarr", node_id_dict={v: k for k, v in to_rx_id_map.items()}
+    )
+    graph_read, _ = geff.read_rx(tmp_path / "test.zarr")
+    assert graph_read.num_edges() == 2
+
+    with pytest.raises(ValueError, match="not in the node ids"):
+        construct_rx(metadata, node_ids, np.array([[10, 40]]), {"x": x}, {})
@@ -0,0 +1,47 @@
+import networkx as nx
+import numpy as np
+import pytest
+
+from geff.metadata_schema import GeffMetadata
+from geff.networkx.io import write_nx
+
+pytest.importorskip("scipy")
+
+from geff.scipy.io import construct_scipy, read_scipy
+
+
+@pytest.mark.parametrize("directed", [True, False])
+def test_read_scipy(tmp_path, directed):
+    graph = nx.DiGraph() if directed else nx.Graph()
+    graph.add_nodes_from([10, 20, 30, 40])
+    graph.add_edge(10, 20, score=0.5)
+    graph.add_edge(20, 30, score=2.0)
+    graph.add_edge(30, 30, score=3.0)
+    graph.add_edge(40, 10, score=1.5)
+    write_nx(graph, tmp_path / "graph.zarr")
+
+    (matrix, node_ids, index), metadata = read_scipy(tmp_path / "graph.zarr", weight="score")
+    assert metadata.directed == directed
+    np.testing.assert_array_equal(index.positions(node_ids), np.arange(4))
+    expected = nx.to_scipy_sparse_array(graph, nodelist=node_ids.tolist(), weight="score")
+    np.testing.assert_array_equal(matrix.toarray(), expected.toarray())
+
+    (matrix, _, _), _ = read_scipy(tmp_path / "graph.zarr")
+    assert matrix.dtype == np.float64
+    assert matrix.nnz == (4 if directed else 7)
+
+
+def test_construct_scipy_errors():
+    metadata = GeffMetadata(geff_version="0.0.1", directed=True)
+    node_ids = np.array([1, 2, 3])
+    edge_ids = np.array([[1, 2], [2, 3]])
+    score = {"values": np.array([1.0, 2.0]), "missing": np.array([False, True])}
+    with pytest.raises(ValueError, match="missing on some edges"):
+        construct_scipy(metadata, node_ids, edge_ids, {}, {"score": score}, weight="score")
+    with pytest.raises(ValueError, match="Weight property color not found"):
+        construct_scipy(metadata, node_ids, edge_ids, {}, {"score": score}, weight="color")
+    with pytest.raises(ValueError, match="not in the node ids"):
+        construct_scipy(metadata, node_ids, np.array([[1, 4]]), {}, {})
+
+    matrix, _, _ = construct_scipy(metadata, node_ids[:0], edge_ids[:0], {}, {})
+    assert matrix.shape == (0, 0)
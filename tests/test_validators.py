@@ -1,6 +1,8 @@
 import numpy as np
 import pytest
+import zarr
 
+from geff.validators import validators
 from geff.validators.validators import (
     validate_lineages,
     validate_no_repeated_edges,
@@ -154,6 +156,30 @@ def test_detects_repeated_edges():
             False,
             "Tracklet not maximal length",
         ),
+        # Repeated edges count once
+        (
+            np.array([1, 2, 3]),
+            np.array([[1, 2], [2, 3], [1, 2]]),
+            np.array([10, 10, 10]),
+            True,
+            "Repeated edge in path",
+        ),
+        # Self edge in a tracklet
+        (
+            np.array([1, 2]),
+            np.array([[1, 2], [2, 2]]),
+            np.array([10, 10]),
+            False,
+            "Self edge in tracklet",
+        ),
+        # Division into two tracklets from a node that is not in the node ids
+        (
+            np.array([1, 2, 3, 4]),
+            np.array([[0, 1], [0, 3], [1, 2], [3, 4]]),
+            np.array([10, 10, 20, 20]),
+            True,
+            "Division from an unknown node",
+        ),
     ],
 )
 def test_validate_tracklets(node_ids, edge_ids, tracklet_ids, expected_valid, description):
@@ -161,6 +187,39 @@ def test_validate_tracklets(node_ids, edge_ids, tracklet_ids, expected_valid, de
     assert is_valid == expected_valid, f"{description} failed: {errors}"
 
 
+def test_validate_tracklets_errors():
+    node_ids = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14])
+    edge_ids = np.array(
+        [
+            # merge into 3
+            [1, 3],
+            [2, 3],
+            # cycle 4 -> 5 -> 4
+            [4, 5],
+            [5, 4],
+            # 6 and 7 are not connected
+            # 8 -> 9 -> 10 can be extended backward
+            [8, 9],
+            [9, 10],
+            # 11 -> 12 -> 13 -> 14 can be extended forward
+            [11, 12],
+            [12, 13],
+            [13, 14],
+        ]
+    )
+    tracklet_ids = np.array([50, 50, 50, 40, 40, 30, 30, 21, 20, 20, 22, 22, 22, 23])
+    is_valid, errors = validate_tracklets(node_ids, edge_ids, tracklet_ids)
+    assert not is_valid
+    # in the order in which the tracklets appear
+    assert errors == [
+        "Tracklet 50: Invalid path structure (branch or merge detected).",
+        "Tracklet 40: Cycle detected.",
+        "Tracklet 30: Not fully connected.",
+        "Tracklet 20: Not maximal. Path can extend backward to node 8.",
+        "Tracklet 22: Not maximal. Path can extend forward to node 14.",
+    ]
+
+
 @pytest.mark.parametrize(
     "node_ids, edge_ids, lineage_ids, expected_valid, description",
     [
@@ -251,3 +310,27 @@ def test_validate_lineages(node_ids, edge_ids, lineage_ids, expected_valid, desc
     """
     is_valid, errors = validate_lineages(node_ids, edge_ids, lineage_ids)
     assert is_valid == expected_valid, f"Test '{description}' failed: {errors}"
+
+
+def test_validate_lineages_errors(monkeypatch):
+    # one batch per chunk of two edges
+    monkeypatch.setattr(validators, "EDGE_BATCH_ROWS", 1)
+    node_ids = np.array([1, 2, 3, 4, 5, 6, 7, 8])
+    edge_ids = zarr.array(np.array([[1, 2], [3, 4], [4, 5], [6, 7], [7, 9], [2, 8]]), chunks=(2, 2))
+    lineage_ids = np.array([30, 30, 20, 20, 10, 40, 40, 50])
+    is_valid, errors = validate_lineages(node_ids, edge_ids, lineage_ids)
+    assert not is_valid
+    # in the order in which the lineages appear
+    assert errors == [
+        # 8 is joined to lineage 30 by the last chunk
+        "Lineage 30: Does not form a valid, isolated connected component.",
+        # 5 is part of lineage 10
+        "Lineage 20: Does not form a valid, isolated connected component.",
+        "Lineage 10: Does not form a valid, isolated connected component.",
+        # 9 is not in the node ids
+        "Lineage 40: Does not form a valid, isolated connected component.",
+        "Lineage 50: Does not form a valid, isolated connected component.",
+    ]
+
+    lineage_ids = np.array([30, 30, 20, 20, 20, 40, 40, 50])
+    assert validate_lineages(node_ids, edge_ids[:4], lineage_ids) == (True, [])